@@ -17,8 +17,8 @@ echo "3. Locale settings:"
 locale
 echo ""
 
-echo "4. Python packages (openpyxl):"
-python3 -m pip list | grep -E "(openpyxl|et-xmlfile)" || pip3 list | grep -E "(openpyxl|et-xmlfile)"
+echo "4. Python packages (openpyxl, numpy):"
+python3 -m pip list | grep -E "(openpyxl|et-xmlfile|numpy)" || pip3 list | grep -E "(openpyxl|et-xmlfile|numpy)"
 echo ""
 
 echo "5. Python encoding:"
@@ -33,6 +33,10 @@ echo "7. Test openpyxl import:"
 python3 -c "import openpyxl; print('openpyxl version:', openpyxl.__version__); print('openpyxl location:', openpyxl.__file__)"
 echo ""
 
+echo "7b. Test numpy import (projections API):"
+python3 -c "import numpy; print('numpy version:', numpy.__version__)" || echo "❌ numpy missing - run: pip install -r requirements.txt"
+echo ""
+
 echo "8. Check for multiple Python installations:"
 which -a python3
 echo ""
@@ -1,6 +1,6 @@
 #!/bin/bash
 echo "==================================="
-echo "FIX openpyxl ON PRODUCTION"
+echo "FIX openpyxl / numpy ON PRODUCTION"
 echo "==================================="
 echo ""
 
@@ -28,8 +28,7 @@ else
     echo "cd /var/www/statistika"
     echo "python3 -m venv venv"
     echo "source venv/bin/activate"
-    echo "pip install openpyxl==3.1.5"
-    echo "pip install -r stats/requirements.txt  # if exists"
+    echo "pip install -r stats/requirements.txt  # openpyxl, numpy, psycopg2, pytz"
     echo ""
     echo "Then update pm2 to use venv Python:"
     echo "pm2 delete statisti"
@@ -39,7 +38,7 @@ else
     echo ""
     echo "OPTION 2: Use --break-system-packages (RISKY)"
     echo "-------------------------------------------"
-    echo "sudo pip3 install openpyxl==3.1.5 --break-system-packages --upgrade"
+    echo "sudo pip3 install -r requirements.txt --break-system-packages --upgrade"
     echo ""
     exit 1
 fi
@@ -53,12 +52,14 @@ echo "Step 3: Checking current openpyxl version in virtualenv..."
 "$VENV_PATH/bin/python" -m pip show openpyxl || echo "Not installed in venv"
 
 echo ""
-echo "Step 4: Installing openpyxl 3.1.5 in virtualenv..."
-"$VENV_PATH/bin/pip" install openpyxl==3.1.5 --upgrade
+echo "Step 4: Installing requirements.txt (openpyxl 3.1.5, numpy, ...) in virtualenv..."
+"$VENV_PATH/bin/pip" install -r requirements.txt --upgrade
 
 echo ""
 echo "Step 5: Verifying installation..."
 "$VENV_PATH/bin/python" -c "import openpyxl; print('openpyxl version:', openpyxl.__version__)"
+# numpy je potreban za projekcije (projection_engine.py, advanced_projections.py)
+"$VENV_PATH/bin/python" -c "import numpy; print('numpy version:', numpy.__version__)"
 
 echo ""
 echo "Step 6: Testing Excel creation with new version..."
@@ -4,19 +4,50 @@ Advanced Projection Calculator with Statistical Analysis
 Uses 2025 baseline data + new routes for comprehensive 2026 projections
 """
 
+import os
 import sys
 import json
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Any, Optional
-import statistics
 import math
 
+import numpy as np
+
+from projection_engine import (
+    DEFAULT_DISRUPTION_RATE,
+    DEFAULT_DRAWS,
+    MAX_DRAWS,
+    ProjectionEngine,
+    charter_adjusted,
+    group_months,
+    load_factor_percent,
+    percentile_bands,
+    simulate,
+)
+
+# Default capacities (used when the type is not in the database)
+DEFAULT_AIRCRAFT_CAPACITIES = {
+    'A320': 180, 'A321': 220, 'B738': 189, 'A319': 156,
+    'B737': 189, 'A20N': 180, 'A21N': 220, 'E195': 132,
+}
+DEFAULT_SEATS = 180
+
+# Monte Carlo load factor spread (percentage points) for routes without historical data
+DEFAULT_LF_STD_DEV = 5.0
+
 class AdvancedProjectionCalculator:
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path
-        
-    def calculate(self, projection_year: int, routes: List[Dict[str, Any]], baseline_data: Optional[Dict] = None) -> Dict[str, Any]:
+        self._aircraft_capacities: Optional[Dict[str, int]] = None
+        
+    def calculate(
+        self,
+        projection_year: int,
+        routes: List[Dict[str, Any]],
+        baseline_data: Optional[Dict] = None,
+        monte_carlo: Any = None
+    ) -> Dict[str, Any]:
         """
         Calculate advanced projections with statistical analysis.
         
@@ -24,25 +55,40 @@ class AdvancedProjectionCalculator:
             projection_year: Year to project for (e.g., 2026)
             routes: List of route configurations (new routes + modifications)
             baseline_data: Historical 2025 data for baseline routes
+            monte_carlo: Optional Monte Carlo options {draws, seed, disruptionRate},
+                or true for defaults
+        
+        Raises:
+            ValueError: if the Monte Carlo options are invalid
         """
+        monte_carlo_options = parse_monte_carlo_options(monte_carlo)
         
         # Combine baseline routes with new routes
         all_routes = self._merge_baseline_and_new_routes(routes, baseline_data)
         
+        engine = ProjectionEngine(
+            all_routes, projection_year,
+            [self._get_aircraft_capacity(r['aircraftType']) for r in all_routes]
+        )
+        load_factors = self._route_load_factors(all_routes, engine)
+        monthly_totals = engine.monthly_totals(load_factors['period'])
+        
         # Calculate projections
-        yearly = self._calculate_yearly_advanced(all_routes, projection_year)
-        quarterly = self._calculate_quarterly_advanced(all_routes, projection_year)
-        monthly = self._calculate_monthly_advanced(all_routes, projection_year)
-        seasonal = self._calculate_seasonal_advanced(all_routes, projection_year)
-        route_breakdown = self._calculate_route_breakdown_advanced(all_routes, yearly['totalOperations'])
+        yearly = self._calculate_yearly_advanced(engine, load_factors['yearly'])
+        quarterly = self._calculate_quarterly_advanced(monthly_totals)
+        monthly = self._calculate_monthly_advanced(monthly_totals, projection_year)
+        seasonal = self._calculate_seasonal_advanced(monthly_totals)
+        route_breakdown = self._calculate_route_breakdown_advanced(
+            all_routes, engine, load_factors['period'], yearly['totalOperations']
+        )
         
         # Statistical analysis
-        statistics_analysis = self._calculate_statistics(all_routes, projection_year)
+        statistics_analysis = self._calculate_statistics(engine, load_factors['base'])
         
         # Scenario analysis (optimistic, pessimistic, realistic)
-        scenarios = self._calculate_scenarios(all_routes, projection_year)
+        scenarios = self._calculate_scenarios(engine, load_factors['base'])
         
-        return {
+        result = {
             'projectionYear': projection_year,
             'yearly': yearly,
             'quarterly': quarterly,
@@ -58,6 +104,13 @@ class AdvancedProjectionCalculator:
                 'newRoutes': len([r for r in all_routes if not r.get('isBaseline', False)]),
             }
         }
+        
+        if monte_carlo_options is not None:
+            result['monteCarlo'] = self._calculate_monte_carlo(
+                all_routes, engine, load_factors['period'], projection_year, monte_carlo_options
+            )
+        
+        return result
     
     def _merge_baseline_and_new_routes(self, new_routes: List[Dict], baseline_data: Optional[Dict]) -> List[Dict]:
         """Merge baseline 2025 routes with new 2026 routes."""
@@ -103,41 +156,40 @@ class AdvancedProjectionCalculator:
         
         return merged
     
-    def _calculate_yearly_advanced(self, routes: List[Dict[str, Any]], year: int) -> Dict[str, Any]:
-        """Calculate yearly totals with confidence intervals."""
-        total_operations = 0
-        total_passengers = 0
-        total_capacity = 0
+    def _route_load_factors(self, routes: List[Dict[str, Any]], engine: ProjectionEngine) -> Dict[str, np.ndarray]:
+        """
+        Load factor (0-1) po ruti, jednom za sve rollup-e.
         
-        passenger_estimates = []
+        - base: historijski avgLoadFactor + 5% rasta, inače estimatedLoadFactor
+        - period: base + charter boost za rute bez historijskih podataka
+        - yearly: kao period, ali historijske rute ograničene na 98%
+        """
+        has_history = np.array([bool(r.get('historicalData')) for r in routes], dtype=bool)
+        base = np.array([
+            r['historicalData']['avgLoadFactor'] / 100.0 * 1.05 if r.get('historicalData')
+            else r['estimatedLoadFactor'] / 100.0
+            for r in routes
+        ], dtype=float)
+        boosted = charter_adjusted(base, engine.is_charter)
         
-        for route in routes:
-            operations = self._calculate_route_operations(route)
-            aircraft_capacity = self._get_aircraft_capacity(route['aircraftType'])
-            
-            # Use historical data if available
-            if route.get('historicalData'):
-                hist = route['historicalData']
-                load_factor = hist['avgLoadFactor'] / 100.0
-                # Add growth factor for baseline routes (5% optimistic growth)
-                load_factor = min(0.98, load_factor * 1.05)
-            else:
-                load_factor = route['estimatedLoadFactor'] / 100.0
-                if route.get('isCharter', False) and load_factor < 0.90:
-                    load_factor = max(load_factor, 0.92)
-            
-            passengers = operations * aircraft_capacity * load_factor
-            passenger_estimates.append(passengers)
-            
-            total_operations += operations
-            total_passengers += passengers
-            total_capacity += operations * aircraft_capacity
+        return {
+            'base': base,
+            'period': np.where(has_history, base, boosted),
+            'yearly': np.where(has_history, np.minimum(0.98, base), boosted),
+        }
+    
+    def _calculate_yearly_advanced(self, engine: ProjectionEngine, load_factor: np.ndarray) -> Dict[str, Any]:
+        """Calculate yearly totals with confidence intervals."""
+        operations, passenger_estimates, capacity = engine.route_totals(load_factor)
+        total_operations = operations.sum()
+        total_passengers = passenger_estimates.sum()
+        total_capacity = capacity.sum()
         
-        avg_load_factor = (total_passengers / total_capacity * 100) if total_capacity > 0 else 0
+        avg_load_factor = load_factor_percent(total_passengers, total_capacity)
         
         # Calculate confidence intervals
         if len(passenger_estimates) > 1:
-            std_dev = statistics.stdev(passenger_estimates)
+            std_dev = passenger_estimates.std(ddof=1)
             confidence_95 = 1.96 * std_dev / math.sqrt(len(passenger_estimates))
         else:
             confidence_95 = 0
@@ -153,7 +205,7 @@ class AdvancedProjectionCalculator:
             }
         }
     
-    def _calculate_quarterly_advanced(self, routes: List[Dict[str, Any]], year: int) -> List[Dict[str, Any]]:
+    def _calculate_quarterly_advanced(self, monthly_totals) -> List[Dict[str, Any]]:
         """Calculate quarterly projections."""
         quarters = [
             {'name': 'Q1', 'months': [1, 2, 3]},
@@ -164,57 +216,35 @@ class AdvancedProjectionCalculator:
         
         quarterly_data = []
         for quarter in quarters:
-            total_ops = 0
-            total_pax = 0
-            total_cap = 0
-            
-            for route in routes:
-                ops, pax, cap = self._calculate_route_for_period(
-                    route, year, quarter['months'][0], quarter['months'][-1]
-                )
-                total_ops += ops
-                total_pax += pax
-                total_cap += cap
-            
-            avg_lf = (total_pax / total_cap * 100) if total_cap > 0 else 0
+            total_ops, total_pax, total_cap = group_months(monthly_totals, quarter['months'])
             
             quarterly_data.append({
                 'quarter': quarter['name'],
                 'operations': int(total_ops),
                 'passengers': int(total_pax),
-                'loadFactor': round(avg_lf, 2),
+                'loadFactor': round(load_factor_percent(total_pax, total_cap), 2),
             })
         
         return quarterly_data
     
-    def _calculate_monthly_advanced(self, routes: List[Dict[str, Any]], year: int) -> List[Dict[str, Any]]:
+    def _calculate_monthly_advanced(self, monthly_totals, year: int) -> List[Dict[str, Any]]:
         """Calculate monthly projections with variance."""
         monthly_data = []
         
         for month in range(1, 13):
-            total_ops = 0
-            total_pax = 0
-            total_cap = 0
-            
-            for route in routes:
-                ops, pax, cap = self._calculate_route_for_period(route, year, month, month)
-                total_ops += ops
-                total_pax += pax
-                total_cap += cap
-            
-            avg_lf = (total_pax / total_cap * 100) if total_cap > 0 else 0
+            total_ops, total_pax, total_cap = group_months(monthly_totals, [month])
             
             monthly_data.append({
                 'month': month,
                 'monthName': datetime(year, month, 1).strftime('%B'),
                 'operations': int(total_ops),
                 'passengers': int(total_pax),
-                'loadFactor': round(avg_lf, 2),
+                'loadFactor': round(load_factor_percent(total_pax, total_cap), 2),
             })
         
         return monthly_data
     
-    def _calculate_seasonal_advanced(self, routes: List[Dict[str, Any]], year: int) -> List[Dict[str, Any]]:
+    def _calculate_seasonal_advanced(self, monthly_totals) -> List[Dict[str, Any]]:
         """Calculate seasonal projections."""
         seasons = [
             {'name': 'Winter', 'months': [1, 2, 3]},
@@ -225,47 +255,30 @@ class AdvancedProjectionCalculator:
         
         seasonal_data = []
         for season in seasons:
-            total_ops = 0
-            total_pax = 0
-            total_cap = 0
-            
-            for route in routes:
-                ops, pax, cap = self._calculate_route_for_period(
-                    route, year, season['months'][0], season['months'][-1]
-                )
-                total_ops += ops
-                total_pax += pax
-                total_cap += cap
-            
-            avg_lf = (total_pax / total_cap * 100) if total_cap > 0 else 0
+            total_ops, total_pax, total_cap = group_months(monthly_totals, season['months'])
             
             seasonal_data.append({
                 'season': season['name'],
                 'operations': int(total_ops),
                 'passengers': int(total_pax),
-                'loadFactor': round(avg_lf, 2),
+                'loadFactor': round(load_factor_percent(total_pax, total_cap), 2),
             })
         
         return seasonal_data
     
-    def _calculate_route_breakdown_advanced(self, routes: List[Dict[str, Any]], total_operations: int) -> List[Dict[str, Any]]:
+    def _calculate_route_breakdown_advanced(
+        self,
+        routes: List[Dict[str, Any]],
+        engine: ProjectionEngine,
+        load_factor: np.ndarray,
+        total_operations: int
+    ) -> List[Dict[str, Any]]:
         """Calculate detailed route breakdown."""
         breakdown = []
+        operations, passengers, _ = engine.route_totals(load_factor)
         
-        for route in routes:
-            operations = self._calculate_route_operations(route)
-            aircraft_capacity = self._get_aircraft_capacity(route['aircraftType'])
-            
-            if route.get('historicalData'):
-                hist = route['historicalData']
-                load_factor = hist['avgLoadFactor'] / 100.0 * 1.05  # 5% growth
-            else:
-                load_factor = route['estimatedLoadFactor'] / 100.0
-                if route.get('isCharter', False) and load_factor < 0.90:
-                    load_factor = max(load_factor, 0.92)
-            
-            passengers = operations * aircraft_capacity * load_factor
-            contribution = (operations / total_operations * 100) if total_operations > 0 else 0
+        for route, route_ops, route_pax, route_lf in zip(routes, operations, passengers, load_factor):
+            contribution = (route_ops / total_operations * 100) if total_operations > 0 else 0
             
             route_type = '🛫 Charter' if route.get('isCharter', False) else ('📊 Baseline' if route.get('isBaseline', False) else '🆕 Nova')
             destination_label = f"{route['destination']} ({route_type})"
@@ -273,10 +286,10 @@ class AdvancedProjectionCalculator:
             breakdown.append({
                 'destination': destination_label,
                 'airline': route['airlineIcao'],
-                'operations': int(operations),
-                'passengers': int(passengers),
-                'loadFactor': round(load_factor * 100, 2),
-                'contribution': round(contribution, 2),
+                'operations': int(route_ops),
+                'passengers': int(route_pax),
+                'loadFactor': round(float(route_lf) * 100, 2),
+                'contribution': round(float(contribution), 2),
                 'isBaseline': route.get('isBaseline', False),
                 'isCharter': route.get('isCharter', False),
             })
@@ -284,84 +297,44 @@ class AdvancedProjectionCalculator:
         breakdown.sort(key=lambda x: x['operations'], reverse=True)
         return breakdown
     
-    def _calculate_statistics(self, routes: List[Dict[str, Any]], year: int) -> Dict[str, Any]:
-        """Calculate statistical measures."""
-        operations_list = []
-        passengers_list = []
-        load_factors = []
+    def _describe(self, values: np.ndarray, round_extremes: bool = False) -> Dict[str, Any]:
+        """mean/median/stdDev/min/max za niz vrijednosti po ruti"""
+        if len(values) == 0:
+            return {'mean': 0, 'median': 0, 'stdDev': 0, 'min': 0, 'max': 0}
         
-        for route in routes:
-            ops = self._calculate_route_operations(route)
-            cap = self._get_aircraft_capacity(route['aircraftType'])
-            
-            if route.get('historicalData'):
-                lf = route['historicalData']['avgLoadFactor'] / 100.0 * 1.05
-            else:
-                lf = route['estimatedLoadFactor'] / 100.0
-            
-            pax = ops * cap * lf
-            
-            operations_list.append(ops)
-            passengers_list.append(pax)
-            load_factors.append(lf * 100)
+        extreme = (lambda v: round(float(v), 2)) if round_extremes else int
+        return {
+            'mean': round(float(values.mean()), 2),
+            'median': round(float(np.median(values)), 2),
+            'stdDev': round(float(values.std(ddof=1)), 2) if len(values) > 1 else 0,
+            'min': extreme(values.min()),
+            'max': extreme(values.max()),
+        }
+    
+    def _calculate_statistics(self, engine: ProjectionEngine, load_factor: np.ndarray) -> Dict[str, Any]:
+        """Calculate statistical measures."""
+        operations, passengers, _ = engine.route_totals(load_factor)
         
         return {
-            'operations': {
-                'mean': round(statistics.mean(operations_list), 2) if operations_list else 0,
-                'median': round(statistics.median(operations_list), 2) if operations_list else 0,
-                'stdDev': round(statistics.stdev(operations_list), 2) if len(operations_list) > 1 else 0,
-                'min': int(min(operations_list)) if operations_list else 0,
-                'max': int(max(operations_list)) if operations_list else 0,
-            },
-            'passengers': {
-                'mean': round(statistics.mean(passengers_list), 2) if passengers_list else 0,
-                'median': round(statistics.median(passengers_list), 2) if passengers_list else 0,
-                'stdDev': round(statistics.stdev(passengers_list), 2) if len(passengers_list) > 1 else 0,
-                'min': int(min(passengers_list)) if passengers_list else 0,
-                'max': int(max(passengers_list)) if passengers_list else 0,
-            },
-            'loadFactor': {
-                'mean': round(statistics.mean(load_factors), 2) if load_factors else 0,
-                'median': round(statistics.median(load_factors), 2) if load_factors else 0,
-                'stdDev': round(statistics.stdev(load_factors), 2) if len(load_factors) > 1 else 0,
-                'min': round(min(load_factors), 2) if load_factors else 0,
-                'max': round(max(load_factors), 2) if load_factors else 0,
-            }
+            'operations': self._describe(operations),
+            'passengers': self._describe(passengers),
+            'loadFactor': self._describe(load_factor * 100, round_extremes=True),
         }
     
-    def _calculate_scenarios(self, routes: List[Dict[str, Any]], year: int) -> Dict[str, Any]:
+    def _calculate_scenarios(self, engine: ProjectionEngine, load_factor: np.ndarray) -> Dict[str, Any]:
         """Calculate optimistic, realistic, and pessimistic scenarios."""
         scenarios = {}
         
         for scenario_name, lf_multiplier in [('pessimistic', 0.85), ('realistic', 1.0), ('optimistic', 1.15)]:
-            total_ops = 0
-            total_pax = 0
-            total_cap = 0
-            
-            for route in routes:
-                ops = self._calculate_route_operations(route)
-                cap = self._get_aircraft_capacity(route['aircraftType'])
-                
-                if route.get('historicalData'):
-                    lf = route['historicalData']['avgLoadFactor'] / 100.0 * 1.05
-                else:
-                    lf = route['estimatedLoadFactor'] / 100.0
-                
-                # Apply scenario multiplier
-                lf = min(0.98, lf * lf_multiplier)
-                
-                pax = ops * cap * lf
-                
-                total_ops += ops
-                total_pax += pax
-                total_cap += ops * cap
-            
-            avg_lf = (total_pax / total_cap * 100) if total_cap > 0 else 0
+            # Apply scenario multiplier
+            scenario_lf = np.minimum(0.98, load_factor * lf_multiplier)
+            operations, passengers, capacity = engine.route_totals(scenario_lf)
+            total_pax = passengers.sum()
             
             scenarios[scenario_name] = {
-                'totalOperations': int(total_ops),
+                'totalOperations': int(operations.sum()),
                 'totalPassengers': int(total_pax),
-                'averageLoadFactor': round(avg_lf, 2),
+                'averageLoadFactor': round(load_factor_percent(total_pax, capacity.sum()), 2),
             }
         
         # Calculate relative error
@@ -373,72 +346,170 @@ class AdvancedProjectionCalculator:
         
         return scenarios
     
-    def _calculate_route_operations(self, route: Dict[str, Any]) -> float:
-        """Calculate total operations for a route."""
-        start_date = datetime.strptime(route['startDate'], '%Y-%m-%d')
-        end_date = datetime.strptime(route['endDate'], '%Y-%m-%d')
-        
-        days_active = (end_date - start_date).days + 1
-        weeks_active = days_active / 7.0
-        
-        return route['weeklyOperations'] * weeks_active
-    
-    def _calculate_route_for_period(self, route: Dict[str, Any], year: int, start_month: int, end_month: int) -> tuple:
-        """Calculate operations, passengers, and capacity for a route in a specific period."""
-        route_start = datetime.strptime(route['startDate'], '%Y-%m-%d')
-        route_end = datetime.strptime(route['endDate'], '%Y-%m-%d')
-        
-        period_start = datetime(year, start_month, 1)
-        
-        if end_month == 12:
-            period_end = datetime(year, 12, 31)
-        else:
-            period_end = datetime(year, end_month + 1, 1) - timedelta(days=1)
-        
-        overlap_start = max(route_start, period_start)
-        overlap_end = min(route_end, period_end)
-        
-        if overlap_start > overlap_end:
-            return 0, 0, 0
+    def _calculate_monte_carlo(
+        self,
+        routes: List[Dict[str, Any]],
+        engine: ProjectionEngine,
+        load_factor: np.ndarray,
+        year: int,
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Percentile bands per month and for the year from a Monte Carlo simulation.
         
-        days_in_period = (overlap_end - overlap_start).days + 1
-        weeks_in_period = days_in_period / 7.0
-        operations = route['weeklyOperations'] * weeks_in_period
+        Per-route load factor spread comes from historicalData
+        (stdDevLoadFactor, minLoadFactor, maxLoadFactor); routes without
+        history use DEFAULT_LF_STD_DEV and the full 0-100% range.
         
-        aircraft_capacity = self._get_aircraft_capacity(route['aircraftType'])
+        options must come from parse_monte_carlo_options.
+        """
+        draws = options['draws']
+        disruption_rate = options['disruptionRate']
+        seed = options['seed']
+        
+        std_dev = np.array([
+            (r['historicalData'].get('stdDevLoadFactor') or 0) if r.get('historicalData') else DEFAULT_LF_STD_DEV
+            for r in routes
+        ], dtype=float) / 100.0
+        lf_min = np.array([
+            r['historicalData'].get('minLoadFactor', 0) if r.get('historicalData') else 0
+            for r in routes
+        ], dtype=float) / 100.0
+        lf_max = np.array([
+            r['historicalData'].get('maxLoadFactor', 100) if r.get('historicalData') else 100
+            for r in routes
+        ], dtype=float) / 100.0
+        
+        operations, passengers = simulate(
+            engine, load_factor, std_dev, lf_min, lf_max,
+            draws=draws, disruption_rate=disruption_rate, seed=seed
+        )
+        
+        def as_ints(bands: Dict[str, Any], index=None) -> Dict[str, int]:
+            return {key: int(value if index is None else value[index]) for key, value in bands.items()}
+        
+        monthly_ops = percentile_bands(operations)
+        monthly_pax = percentile_bands(passengers)
+        yearly_ops = percentile_bands(operations.sum(axis=1))
+        yearly_pax = percentile_bands(passengers.sum(axis=1))
         
-        if route.get('historicalData'):
-            load_factor = route['historicalData']['avgLoadFactor'] / 100.0 * 1.05
-        else:
-            load_factor = route['estimatedLoadFactor'] / 100.0
-            if route.get('isCharter', False) and load_factor < 0.90:
-                load_factor = max(load_factor, 0.92)
+        return {
+            'draws': draws,
+            'seed': seed,
+            'disruptionRate': disruption_rate,
+            'yearly': {
+                'operations': as_ints(yearly_ops),
+                'passengers': as_ints(yearly_pax),
+            },
+            'monthly': [
+                {
+                    'month': month,
+                    'monthName': datetime(year, month, 1).strftime('%B'),
+                    'operations': as_ints(monthly_ops, month - 1),
+                    'passengers': as_ints(monthly_pax, month - 1),
+                }
+                for month in range(1, 13)
+            ],
+        }
+    
+    def _load_aircraft_capacities(self) -> Dict[str, int]:
+        """
+        Load the whole AircraftType table (model -> seats) once.
         
-        passengers = operations * aircraft_capacity * load_factor
-        capacity = operations * aircraft_capacity
+        Live Postgres (DATABASE_URL, through report_db) is preferred; a SQLite
+        db_path is used only if that file exists. Types missing from the
+        database fall back to DEFAULT_AIRCRAFT_CAPACITIES.
+        """
+        capacities = dict(DEFAULT_AIRCRAFT_CAPACITIES)
         
-        return operations, passengers, capacity
-    
-    def _get_aircraft_capacity(self, aircraft_type: str) -> int:
-        """Get aircraft capacity."""
-        if self.db_path:
+        if os.getenv('DATABASE_URL'):
+            try:
+                from report_db import fetch_all
+                rows = fetch_all('SELECT model, seats FROM "AircraftType"')
+                capacities.update({row['model']: row['seats'] for row in rows})
+                return capacities
+            except Exception as e:
+                print(f"WARNING: Could not load aircraft capacities from Postgres: {e}", file=sys.stderr)
+        
+        if self.db_path and os.path.isfile(self.db_path):
             try:
                 conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute('SELECT seats FROM AircraftType WHERE model = ?', (aircraft_type,))
-                result = cursor.fetchone()
-                conn.close()
-                if result:
-                    return result[0]
+                try:
+                    rows = conn.execute('SELECT model, seats FROM AircraftType').fetchall()
+                finally:
+                    conn.close()
+                capacities.update(dict(rows))
             except Exception:
                 pass
         
-        # Default capacities
-        defaults = {
-            'A320': 180, 'A321': 220, 'B738': 189, 'A319': 156,
-            'B737': 189, 'A20N': 180, 'A21N': 220, 'E195': 132,
-        }
-        return defaults.get(aircraft_type, 180)
+        return capacities
+    
+    def _get_aircraft_capacity(self, aircraft_type: str) -> int:
+        """Get aircraft capacity (O(1) lookup, table loaded on first use)."""
+        if self._aircraft_capacities is None:
+            self._aircraft_capacities = self._load_aircraft_capacities()
+        return self._aircraft_capacities.get(aircraft_type, DEFAULT_SEATS)
+
+
+def _option_int(options: Dict[str, Any], name: str, default: Optional[int]) -> Optional[int]:
+    """Integer option; null/missing gives the default, numeric strings are accepted."""
+    value = options.get(name)
+    if value is None:
+        return default
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            value = float(value)
+        except ValueError:
+            raise ValueError(f"monteCarlo.{name} must be an integer, got {options[name]!r}")
+    if isinstance(value, bool) or not isinstance(value, (int, float)) \
+            or not math.isfinite(value) or value != int(value):
+        raise ValueError(f"monteCarlo.{name} must be an integer, got {options[name]!r}")
+    return int(value)
+
+
+def parse_monte_carlo_options(value: Any) -> Optional[Dict[str, Any]]:
+    """
+    Validate the monteCarlo input.
+    
+    null/false disables the simulation, true uses the defaults, an object may
+    set draws (clamped to 1..MAX_DRAWS), seed (integer >= 0) and
+    disruptionRate (clamped to 0..1).
+    
+    Raises:
+        ValueError: with a message suitable for the API response
+    """
+    if value is None or value is False:
+        return None
+    if value is True:
+        value = {}
+    if not isinstance(value, dict):
+        raise ValueError(
+            f"monteCarlo must be true or an object {{draws, seed, disruptionRate}}, got {type(value).__name__}"
+        )
+    
+    draws = _option_int(value, 'draws', DEFAULT_DRAWS)
+    seed = _option_int(value, 'seed', None)
+    if seed is not None and seed < 0:
+        raise ValueError(f"monteCarlo.seed must be a non-negative integer, got {value['seed']!r}")
+    
+    rate = value.get('disruptionRate')
+    if rate is None:
+        rate = DEFAULT_DISRUPTION_RATE
+    try:
+        if isinstance(rate, bool):
+            raise ValueError
+        rate = float(rate)
+    except (TypeError, ValueError):
+        raise ValueError(f"monteCarlo.disruptionRate must be a number, got {value['disruptionRate']!r}")
+    if not math.isfinite(rate):
+        raise ValueError(f"monteCarlo.disruptionRate must be a number, got {value['disruptionRate']!r}")
+    
+    return {
+        'draws': min(MAX_DRAWS, max(1, draws)),
+        'seed': seed,
+        'disruptionRate': min(1.0, max(0.0, rate)),
+    }
 
 
 def main():
@@ -452,6 +523,12 @@ def main():
         projection_year = input_data.get('projectionYear', 2026)
         routes = input_data.get('routes', [])
         baseline_data = input_data.get('baselineData')
+        try:
+            monte_carlo = parse_monte_carlo_options(input_data.get('monteCarlo'))
+        except ValueError as e:
+            # Neispravne opcije - jasna poruka (route vraća result.error) bez traceback-a
+            print(json.dumps({'error': str(e)}))
+            return
         db_path = input_data.get('dbPath', 'prisma/dev.db')
         
         # Debug logging
@@ -462,7 +539,7 @@ def main():
             print(f"DEBUG: Baseline routes count: {len(baseline_data['routeSummary'])}", file=sys.stderr)
         
         calculator = AdvancedProjectionCalculator(db_path)
-        result = calculator.calculate(projection_year, routes, baseline_data)
+        result = calculator.calculate(projection_year, routes, baseline_data, monte_carlo)
         
         print(json.dumps(result, indent=2))
         
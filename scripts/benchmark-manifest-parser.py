@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Benchmark: parse_manifest (prefix classifier + precompiled regex) vs. the old parser
+
+Stara verzija je za svaku liniju radila niz substring provjera i do tri
+nekompajlirana re.match poziva. Benchmark generiše Wizz Air manifest u formatu
+iz parse_manifest.py (zaglavlje, glavni putnici, companion-i, bebe, SSR i
+route linije, sumarni red) i prvo provjerava da obje verzije daju iste putnike.
+
+Upotreba:
+    python3 scripts/benchmark-manifest-parser.py [broj_putnika]
+"""
+import random
+import re
+import sys
+import timeit
+
+from parse_manifest import extract_flight_info, extract_passengers, extract_summary
+
+FIRST_NAMES = ['Damir', 'Kristina', 'Dino', 'Shehab Moh', 'Amra', 'Lejla', 'Emir', 'Ana-Marija', 'Tarik', 'Sara']
+LAST_NAMES = ['Abazaj', 'Cerni', 'Abdelwahed', 'Hodzic', 'Kovacevic', 'Begic', 'Mujic', 'Van Der Berg', 'Husic']
+TITLES = ['MR', 'MS', 'MRS', 'MSTR', 'MISS', 'CHD']
+FARES = ['KREG', 'BOREG', 'KLREG', 'WDC']
+
+
+def extract_passengers_regex(content):
+    """
+    Stara implementacija (referenca)
+
+    Extract passenger list from manifest
+
+    Format example:
+      Abazaj,Damir             MR     13Nov25  KREG      TT8U3B01             1C
+      Cerni,Kristina        i  MS     07Aug25  BOREG     AKSG8G01            30D
+       Cerni,Dino              MR                        AKSG8G02            34F
+    """
+    passengers = []
+
+    # Find the passenger list section
+    lines = content.split('\n')
+
+    in_passenger_section = False
+    current_main_passenger = None
+
+    for line in lines:
+        # Start of passenger section
+        if 'Listed Confirmed Passengers:' in line:
+            in_passenger_section = True
+            continue
+
+        # End of passenger section (only on "Total Confirm" or final separator)
+        if in_passenger_section:
+            # End when we hit the summary line
+            if 'Total Confirm Manifested:' in line:
+                break
+            # Or end on a very long separator line AFTER we've started collecting passengers
+            if line.strip().startswith('---') and len(line.strip()) > 70 and len(passengers) > 0:
+                break
+
+        if not in_passenger_section:
+            continue
+
+        # Skip header lines and initial separator
+        if 'Passenger' in line or 'Name (i= INF)' in line:
+            continue
+
+        # Skip separator lines at the start of passenger section (before any passengers)
+        if line.strip().startswith('---'):
+            continue
+
+        # Skip SSR lines and route lines
+        if 'SSR(s):' in line or re.match(r'^\s+(DTM|TZL|[A-Z]{3})[A-Z]{3}\s+\d{2}\w{3}\d{2}', line):
+            continue
+
+        # Empty line
+        if not line.strip():
+            continue
+
+        # Check if this is a passenger line (main or companion)
+        # Main passengers start with exactly 2 spaces
+        if line.startswith('  ') and not line.startswith('   ') and ',' in line[:35]:
+            # This is a main passenger
+            # Format: "  Name (may have spaces)    Title  Date     FareClass PassID   [F]  Seat"
+            # Example: "  Abazaj,Damir             MR     13Nov25  KREG      TT8U3B01             1C"
+            # Example: "  Abdelwahed,Shehab Moh    MR     12Oct25  KLREG     OHVWSV02   F         9A"
+
+            # Use regex with flexible spacing
+            passenger_match = re.match(
+                r'^\s{2}([A-Za-z\-\s]+,[A-Za-z\-\s]+?)\s+(i\s+)?([A-Z]{2,5})\s+(\d{2}\w{3}\d{2})?\s+(\w+)?\s+(\w+)?\s+(F)?\s+(\d{1,2}[A-F])?\s*',
+                line
+            )
+
+            if passenger_match:
+                name = passenger_match.group(1).strip()
+                is_infant = passenger_match.group(2) is not None
+                title = passenger_match.group(3)
+                date_confirm = passenger_match.group(4)
+                fare_class = passenger_match.group(5)
+                passenger_id = passenger_match.group(6)
+                flight_status = passenger_match.group(7)
+                seat = passenger_match.group(8)
+
+                passenger = {
+                    'passengerName': name,
+                    'title': title,
+                    'isInfant': is_infant,
+                    'confirmationDate': date_confirm,
+                    'fareClass': fare_class,
+                    'passengerId': passenger_id,
+                    'seatNumber': seat,
+                    'flightStatus': flight_status
+                }
+                passengers.append(passenger)
+                current_main_passenger = passenger
+
+        elif line.startswith('   ') and not line.startswith('     ') and ',' in line and current_main_passenger:
+            # This is a companion passenger (starts with 3+ spaces)
+            # Format: "   Name              Title              PassID      [F]  Seat"
+            companion_match = re.match(
+                r'^\s{3,}([A-Za-z\-\s]+,[A-Za-z\-\s]+?)\s+(i\s+)?([A-Z]{2,5})?\s+(\w+)?\s+(F)?\s+(\d{1,2}[A-F])?\s*',
+                line
+            )
+
+            if companion_match:
+                name = companion_match.group(1).strip()
+                is_infant = companion_match.group(2) is not None
+                title_match = companion_match.group(3)
+
+                # Title might be missing for companions
+                if title_match and title_match in ['MR', 'MS', 'MRS', 'CHD', 'MSTR', 'MISS']:
+                    title = title_match
+                    passenger_id = companion_match.group(4)
+                    flight_status = companion_match.group(5)
+                    seat = companion_match.group(6)
+                else:
+                    # No title, so what we thought was title is actually passenger ID
+                    title = 'CHD'  # Default for companions without title
+                    passenger_id = title_match
+                    flight_status = companion_match.group(4)
+                    seat = companion_match.group(5)
+
+                companion = {
+                    'passengerName': name,
+                    'title': title,
+                    'isInfant': is_infant,
+                    'confirmationDate': None,
+                    'fareClass': None,
+                    'passengerId': passenger_id,
+                    'seatNumber': seat,
+                    'flightStatus': flight_status
+                }
+                passengers.append(companion)
+
+    return passengers
+
+
+def _name(rng, width):
+    return f"{rng.choice(LAST_NAMES)},{rng.choice(FIRST_NAMES)}"[:width]
+
+
+def _pnr(rng):
+    return ''.join(rng.choice('ABCDEFGHJKLMNPRSTUVWXYZ0123456789') for _ in range(6))
+
+
+def sample_manifest(passenger_count, seed=42):
+    """Manifest sa ~passenger_count putnika (glavni putnici + companion-i + bebe)"""
+    rng = random.Random(seed)
+    lines = [
+        '+' + '-' * 78 + '+',
+        '| Flight Date:  15Nov25                     Printed: 15Nov25 08:12           |',
+        '| Flight Info:  W6  4298    Open     DTM         TZL                         |',
+        '|               A320    Dep. 10:25  Arv. 12:25                               |',
+        '+' + '-' * 78 + '+',
+        '',
+        'Listed Confirmed Passengers:',
+        '',
+        '  Passenger Name (i= INF)  Title  Date     Fare      PassID     F    Seat',
+        '  ' + '-' * 70,
+    ]
+    seats = [f'{row}{letter}' for row in range(1, 32) for letter in 'ABCDEF']
+    rng.shuffle(seats)
+    count = 0
+    while count < passenger_count:
+        pnr = _pnr(rng)
+        infant = 'i' if rng.random() < 0.03 else ' '
+        status = 'F' if rng.random() < 0.1 else ' '
+        seat = seats[count % len(seats)]
+        lines.append(
+            f"  {_name(rng, 22):<22}{infant}  {rng.choice(TITLES[:5]):<7}"
+            f"{rng.randint(1, 28):02d}Oct25  {rng.choice(FARES):<10}{pnr}01   {status}    {seat:>5}"
+        )
+        count += 1
+        if rng.random() < 0.15:
+            lines.append(f"      SSR(s): {rng.choice(['WCHR', 'BLND', 'PETC'])}")
+        if rng.random() < 0.05:
+            lines.append("   DTMTZL  15Nov25  W6 4298")
+        for index in range(2, 2 + (rng.random() < 0.3) * rng.randint(1, 3)):
+            if count >= passenger_count:
+                break
+            title = rng.choice(TITLES) if rng.random() < 0.7 else ''
+            seat = seats[count % len(seats)]
+            lines.append(
+                f"   {_name(rng, 21):<21}   {title:<6}{'':<19}{pnr}{index:02d}        {seat:>5}"
+            )
+            count += 1
+    lines += [
+        '-' * 80,
+        'Total Confirm Manifested:  %d  Male: 147  Female:  80  Child:   6  Infant:   8' % count,
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def check_equivalence(content):
+    old = extract_passengers_regex(content)
+    new = extract_passengers(content)
+    if old != new:
+        for index, (a, b) in enumerate(zip(old, new)):
+            if a != b:
+                raise AssertionError(f'passenger {index}: old={a} new={b}')
+        raise AssertionError(f'passenger count: old={len(old)} new={len(new)}')
+    return len(new)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 240
+    for seed in range(50):
+        check_equivalence(sample_manifest(count, seed))
+        check_equivalence(sample_manifest(count, seed).replace('\n', '\r\n'))
+
+    content = sample_manifest(count)
+    parsed = check_equivalence(content)
+    number = 200
+
+    def run_regex():
+        extract_passengers_regex(content)
+
+    def run_classifier():
+        extract_passengers(content)
+
+    def run_full():
+        extract_flight_info(content)
+        extract_passengers(content)
+        extract_summary(content)
+
+    print(f'📊 manifest parser benchmark ({parsed} passengers, {len(content.splitlines())} lines, {len(content):,} bytes)\n')
+    results = {}
+    for name, fn in (('regex (old)', run_regex), ('prefix classifier', run_classifier), ('full parse (new)', run_full)):
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        results[name] = best
+        print(f'   {name:<20} {best * 1e6:8.1f} µs/manifest')
+
+    print(f"\n   Speedup (passengers): {results['regex (old)'] / results['prefix classifier']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
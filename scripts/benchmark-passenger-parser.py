@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: passenger_parser.parse_passengers vs. the old per-call regex
+
+Stara verzija (kopirana u svaki ekstraktor) je radila dva nekompajlirana
+re.match poziva po ćeliji i vraćala dict. Benchmark generiše ćelije sa
+realnom raspodjelom (brojevi, '165+6 INF', '-', prazne) i prvo provjerava
+da obje verzije daju iste rezultate.
+
+Upotreba:
+    python3 scripts/benchmark-passenger-parser.py [broj_ćelija]
+"""
+import random
+import re
+import sys
+import timeit
+
+from passenger_parser import parse_passengers
+
+
+def parse_passengers_regex(value):
+    """Stara implementacija (referenca)"""
+    if not value or value == '-' or value == 'N/A' or str(value).strip() == '':
+        return None
+
+    str_val = str(value).strip()
+
+    match = re.match(r'^(\d+)\s*\+\s*(\d+)', str_val)
+    if match:
+        adults = int(match.group(1))
+        infants = int(match.group(2))
+        return {'adults': adults, 'infants': infants, 'total': adults + infants}
+
+    match = re.match(r'^(\d+)$', str_val)
+    if match:
+        adults = int(match.group(1))
+        return {'adults': adults, 'infants': 0, 'total': adults}
+
+    return None
+
+
+def sample_cells(count, seed=42):
+    """Ćelije kao u dnevnim izvještajima: ~60% '165+6 INF', ~25% brojevi, ostalo prazno/'-'/N/A"""
+    rng = random.Random(seed)
+    cells = []
+    for _ in range(count):
+        kind = rng.random()
+        adults = rng.randint(0, 189)
+        if kind < 0.45:
+            cells.append(f'{adults}+{rng.randint(0, 6)} INF')
+        elif kind < 0.60:
+            cells.append(f'{adults} + {rng.randint(0, 6)}')
+        elif kind < 0.75:
+            cells.append(adults)
+        elif kind < 0.85:
+            cells.append(str(adults))
+        elif kind < 0.92:
+            cells.append('-')
+        elif kind < 0.96:
+            cells.append(None)
+        else:
+            cells.append(rng.choice(['N/A', ' ', 'ukupno', '120.5']))
+    return cells
+
+
+def check_equivalence(cells):
+    for cell in cells:
+        old = parse_passengers_regex(cell)
+        new = parse_passengers(cell)
+        expected = (old['adults'], old['infants']) if old else None
+        if new != expected:
+            raise AssertionError(f'{cell!r}: regex={old} cached={new}')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cells = sample_cells(count)
+    check_equivalence(cells)
+
+    def run_regex():
+        for cell in cells:
+            parse_passengers_regex(cell)
+
+    def run_cached():
+        for cell in cells:
+            parse_passengers(cell)
+
+    def run_uncached():
+        # Isti kod bez LRU keša (samo kompajlirani regex + fast path)
+        for cell in cells:
+            parse_passengers.__wrapped__(cell)
+
+    print(f'📊 parse_passengers benchmark ({count:,} cells, {len(set(map(repr, cells))):,} distinct)\n')
+    results = {}
+    for name, fn in (('regex (old)', run_regex), ('compiled', run_uncached), ('compiled + lru_cache', run_cached)):
+        parse_passengers.cache_clear()
+        best = min(timeit.repeat(fn, number=1, repeat=5))
+        results[name] = best
+        print(f'   {name:<22} {best * 1000:8.1f} ms   {best / count * 1e9:7.0f} ns/cell')
+
+    baseline = results['regex (old)']
+    print(f"\n   Speedup (cached vs old): {baseline / results['compiled + lru_cache']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the Excel report generators
+
+Svaki generator se pokreće nad sintetičkim mjesecom `Flight` podataka u
+1x / 10x / 100x trenutnom obimu, a vrijeme se dijeli na faze:
+- fetch      upiti (report_db.fetch_all)
+- aggregate  agregacione funkcije generatora (vidi GENERATORS; generatori koji
+             agregiraju usput dok pišu ćelije imaju aggregate = 0)
+- render     sve ostalo: učitavanje template-a, pisanje ćelija, stilovi
+- save       Workbook.save
+Faze su ekskluzivne (fetch unutar agregacije se ne broji dvaput).
+
+Podaci dolaze iz FixtureDatabase: lažni fetch_all koji iz SELECT liste upita
+pravi redove (dict, kao RealDictCursor) nad deterministički generisanim
+letovima, pa Postgres nije potreban. Sa --database generatori idu na stvarnu
+bazu (DATABASE_URL) bez skaliranja; BHDCA tada koristi SQL agregaciju.
+
+Rezultati se pišu kao JSON (output/benchmarks/reports-<commit>.json), a
+--compare ispisuje razliku u odnosu na ranije pokretanje.
+
+Upotreba:
+    python3 scripts/benchmark-reports.py
+    python3 scripts/benchmark-reports.py --scales 1,10 --generators bhansa,bhdca --repeat 5
+    python3 scripts/benchmark-reports.py --compare output/benchmarks/reports-1a2b3c4.json
+    python3 scripts/benchmark-reports.py --database --year 2025 --month 10
+"""
+import calendar
+import contextlib
+import functools
+import importlib
+import io
+import json
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from openpyxl.workbook.workbook import Workbook
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BENCHMARK_DIR = PROJECT_ROOT / "output" / "benchmarks"
+RESULTS_VERSION = 1
+
+# ~ prosječan broj letova mjesečno u output/2025-flights-data.json
+BASE_FLIGHTS_PER_MONTH = 100
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_REPEAT = 3
+PHASES = ('fetch', 'aggregate', 'render', 'save')
+
+HOME_AIRPORT = ('TZL', 'LQTZ', 'Tuzla International Airport', 'Tuzla', 'Bosnia and Herzegovina')
+
+# (name, iata, icao, address, weight)
+AIRLINES = (
+    ('Wizz Air Hungary', 'W6', 'WZZ', 'Budapest, Hungary', 55),
+    ('Wizz Air Malta', 'W4', 'WMT', 'Floriana, Malta', 15),
+    ('Pegasus Airlines', 'PC', 'PGT', 'Istanbul, Turkey', 10),
+    ('Ryanair', 'FR', 'RYR', 'Dublin, Ireland', 10),
+    ('AJet', 'VF', 'TKJ', 'Istanbul, Turkey', 5),
+    ('Private Wings', None, 'PWF', 'Berlin, Germany', 5),
+)
+
+# (iata, icao, name, city, country)
+DESTINATIONS = (
+    ('FMM', 'EDJA', 'Memmingen Airport', 'Memmingen', 'Germany'),
+    ('DTM', 'EDLW', 'Dortmund Airport', 'Dortmund', 'Germany'),
+    ('HHN', 'EDFH', 'Frankfurt-Hahn Airport', 'Hahn', 'Germany'),
+    ('MLH', 'LFSB', 'EuroAirport Basel-Mulhouse', 'Basel', 'France'),
+    ('EIN', 'EHEH', 'Eindhoven Airport', 'Eindhoven', 'Netherlands'),
+    ('CRL', 'EBCI', 'Brussels South Charleroi', 'Charleroi', 'Belgium'),
+    ('MMX', 'ESMS', 'Malmö Airport', 'Malmö', 'Sweden'),
+    ('SAW', 'LTFJ', 'Istanbul Sabiha Gökçen', 'Istanbul', 'Turkey'),
+)
+DOMESTIC = ('SJJ', 'LQSA', 'Sarajevo International Airport', 'Sarajevo', 'Bosnia and Herzegovina')
+
+# (model, seats, mtow)
+JET_AIRCRAFT = (('A320', 180, 78000), ('A321', 230, 93500), ('B738', 189, 79000))
+BUSINESS_JET = ('C56X', 9, 9200)
+
+# (code, name, weight)
+OPERATION_TYPES = (
+    ('SCHEDULED', 'Scheduled', 85),
+    ('CHARTER', 'Charter', 8),
+    ('MEDEVAC', 'Medevac', 3),
+    ('GENERAL_AVIATION', 'General aviation', 4),
+)
+
+DELAY_CODES = (('93', 'Aircraft rotation'), ('89', 'Restrictions at airport of departure'), ('41', 'Aircraft defects'))
+
+
+# ---------------------------------------------------------------------------
+# Sintetički podaci
+# ---------------------------------------------------------------------------
+
+def _weighted(rng, items):
+    return rng.choices(items, weights=[item[-1] for item in items])[0]
+
+
+def _leg_passengers(rng, seats):
+    passengers = rng.randint(int(seats * 0.6), seats)
+    male = int(passengers * rng.uniform(0.4, 0.6))
+    female = int((passengers - male) * rng.uniform(0.7, 0.95))
+    return {
+        'passengers': passengers,
+        'male': male,
+        'female': female,
+        'children': passengers - male - female,
+        'infants': rng.randint(0, 4) if seats > 20 else 0,
+        'baggage': passengers * rng.randint(8, 15),
+        'cargo': rng.choice((0, 0, 0, rng.randint(10, 500))),
+        'mail': rng.choice((0, 0, 0, 0, rng.randint(1, 50))),
+    }
+
+
+def synthetic_flight(rng, day, index):
+    """
+    Jedan let (dolazak i/ili odlazak) sa svim kolonama koje generatori biraju
+    u svojim upitima, pod istim imenima (alias-i iz SELECT liste).
+    """
+    airline_name, airline_iata, airline_icao, airline_address, _ = _weighted(rng, AIRLINES)
+    operation_code, operation_name, _ = _weighted(rng, OPERATION_TYPES)
+    model, seats, mtow = BUSINESS_JET if operation_code in ('MEDEVAC', 'GENERAL_AVIATION') else rng.choice(JET_AIRCRAFT)
+    other = DOMESTIC if rng.random() < 0.03 else rng.choice(DESTINATIONS)
+
+    # 80% rotacija (dolazak + odlazak), ostalo samo dolazak ili samo odlazak
+    kind = rng.random()
+    has_arrival = kind < 0.9
+    has_departure = kind < 0.8 or kind >= 0.9
+
+    arrival_at = datetime(day.year, day.month, day.day, rng.randint(5, 21), rng.choice((0, 15, 30, 45)))
+    departure_at = arrival_at + timedelta(minutes=rng.randint(40, 70))
+    flight_number = f"{airline_iata or airline_icao}{rng.randint(1000, 9999)}"
+
+    if has_arrival and has_departure:
+        route = f"{other[0]}-{HOME_AIRPORT[0]}-{other[0]}"
+    elif has_arrival:
+        route = f"{other[0]}-{HOME_AIRPORT[0]}"
+    else:
+        route = f"{HOME_AIRPORT[0]}-{other[0]}"
+
+    flight = {
+        'id': f"bench-{day.isoformat()}-{index}",
+        'date': datetime(day.year, day.month, day.day),
+        'route': route,
+        'registration': f"HA-LW{chr(65 + rng.randint(0, 25))}",
+        'airline_name': airline_name,
+        'airline_iata': airline_iata,
+        'airline_icao': airline_icao,
+        'airline_address': airline_address,
+        'aircraft_model': model,
+        'aircraft_seats': seats,
+        'aircraft_mtow': mtow,
+        'operation_type_code': operation_code,
+        'operation_type_name': operation_name,
+        'flight_type_code': None,
+        'flight_type_name': None,
+    }
+
+    for prefix, airport in (('arrival_airport', HOME_AIRPORT), ('departure_airport', other)):
+        if prefix == 'arrival_airport' and not has_arrival:
+            airport = HOME_AIRPORT
+        iata, icao, name, city, country = airport
+        flight.update({
+            f'{prefix}_iata': iata, f'{prefix}_icao': icao, f'{prefix}_name': name,
+            f'{prefix}_city': city, f'{prefix}_country': country,
+        })
+    if not has_arrival:
+        iata, icao, name, city, country = other
+        flight.update({
+            'arrival_airport_iata': iata, 'arrival_airport_icao': icao, 'arrival_airport_name': name,
+            'arrival_airport_city': city, 'arrival_airport_country': country,
+            'departure_airport_iata': HOME_AIRPORT[0], 'departure_airport_icao': HOME_AIRPORT[1],
+            'departure_airport_name': HOME_AIRPORT[2], 'departure_airport_city': HOME_AIRPORT[3],
+            'departure_airport_country': HOME_AIRPORT[4],
+        })
+
+    for leg, present, scheduled in (('arrival', has_arrival, arrival_at), ('departure', has_departure, departure_at)):
+        cancelled = present and rng.random() < 0.02
+        load = _leg_passengers(rng, seats) if present and not cancelled else None
+        actual = scheduled + timedelta(minutes=rng.choice((-5, 0, 0, 5, 10, 25, 60))) if load else None
+        flight.update({
+            f'{leg}FlightNumber': flight_number if present else None,
+            f'{leg}ScheduledTime': scheduled if present else None,
+            f'{leg}ActualTime': actual,
+            f'{leg}Passengers': load and load['passengers'],
+            f'{leg}MalePassengers': load and load['male'],
+            f'{leg}FemalePassengers': load and load['female'],
+            f'{leg}Children': load and load['children'],
+            f'{leg}Infants': load and load['infants'],
+            f'{leg}Baggage': load and load['baggage'],
+            f'{leg}Cargo': load and load['cargo'],
+            f'{leg}Mail': load and load['mail'],
+            f'{leg}Status': ('CANCELLED' if cancelled else 'OPERATED') if present else None,
+        })
+    flight['arrivalFerryIn'] = False
+    flight['departureFerryOut'] = False
+    flight['arrivalEnginesOffTime'] = flight['arrivalActualTime']
+    flight['departureDoorClosingTime'] = (
+        flight['departureActualTime'] - timedelta(minutes=10) if flight['departureActualTime'] else None
+    )
+    return flight
+
+
+@functools.lru_cache(maxsize=None)
+def select_columns(query):
+    """Imena kolona rezultata (alias ili ime kolone) iz SELECT liste upita"""
+    query = re.sub(r'--[^\n]*', '', query)
+    match = re.search(r'\bSELECT\b(.*?)\bFROM\b', query, re.S | re.I)
+    if not match:
+        raise ValueError(f"Fixture ne podržava upit: {query[:80]}")
+
+    items, depth, current = [], 0, ''
+    for char in match.group(1):
+        depth += (char == '(') - (char == ')')
+        if char == ',' and depth == 0:
+            items.append(current)
+            current = ''
+        else:
+            current += char
+    items.append(current)
+
+    columns = []
+    for item in items:
+        item = ' '.join(item.split())
+        alias = re.search(r'\bas\s+"?(\w+)"?$', item, re.I)
+        columns.append(alias.group(1) if alias else item.split('.')[-1].strip('"'))
+    return tuple(columns)
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+class FixtureDatabase:
+    """
+    Lažni report_db.fetch_all nad sintetičkim letovima.
+
+    prepare() unaprijed generiše letove za period (van mjerenja), a fetch_all()
+    samo filtrira po datumu i pravi dict redove sa kolonama iz SELECT liste,
+    kao što bi ih vratio RealDictCursor.
+    """
+
+    def __init__(self, scale, seed=42):
+        self.scale = scale
+        self.seed = seed
+        self.flights = []
+
+    def prepare(self, first_day, last_day):
+        self.flights = []
+        day = first_day
+        while day <= last_day:
+            rng = random.Random(f"{self.seed}-{self.scale}-{day.isoformat()}")
+            per_day = BASE_FLIGHTS_PER_MONTH * self.scale / calendar.monthrange(day.year, day.month)[1]
+            count = int(per_day) + (rng.random() < per_day - int(per_day))
+            self.flights.extend(synthetic_flight(rng, day, index) for index in range(count))
+            day += timedelta(days=1)
+        self.flights.sort(key=lambda f: (f['date'], f['departureScheduledTime'] or f['arrivalScheduledTime']))
+
+    def clear(self):
+        self.flights = []
+
+    def fetch_all(self, query, params=None):
+        columns = select_columns(query)
+
+        if '"FlightDelay"' in query:
+            # ~20% letova ima delay kod
+            rows = []
+            for flight_id in params[0]:
+                rng = random.Random(flight_id)
+                if rng.random() < 0.2:
+                    code, description = rng.choice(DELAY_CODES)
+                    delay = {
+                        'flightId': flight_id, 'phase': 'DEP', 'minutes': rng.randint(5, 90),
+                        'isPrimary': True, 'comment': None, 'unofficialReason': None,
+                        'delay_code': code, 'delay_description': description,
+                    }
+                    rows.append({column: delay.get(column) for column in columns})
+            return rows
+
+        first_day, last_day = _as_date(params[0]), _as_date(params[1])
+        flights = (f for f in self.flights if first_day <= f['date'].date() <= last_day)
+        if "'W6', 'W4'" in query:
+            flights = (f for f in flights if f['airline_iata'] in ('W6', 'W4') or f['airline_icao'] in ('WZZ', 'WMT'))
+        return [{column: flight.get(column) for column in columns} for flight in flights]
+
+
+# ---------------------------------------------------------------------------
+# Mjerenje faza
+# ---------------------------------------------------------------------------
+
+class PhaseTimer:
+    """Ekskluzivno vrijeme po fazi; sve van omotanih funkcija je 'render'"""
+
+    def __init__(self):
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self._stack = ['render']
+        self._mark = None
+
+    def _switch(self):
+        now = time.perf_counter()
+        self.totals[self._stack[-1]] += now - self._mark
+        self._mark = now
+
+    def __enter__(self):
+        self._mark = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._switch()
+        return False
+
+    def wrap(self, phase, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            self._switch()
+            self._stack.append(phase)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._switch()
+                self._stack.pop()
+        return timed
+
+
+@contextlib.contextmanager
+def instrumented(module, spec, timer, fetch_all):
+    """Privremeno omotaj fetch_all, agregacione funkcije i Workbook.save"""
+    originals = [(module, 'fetch_all', module.fetch_all), (Workbook, 'save', Workbook.save)]
+    originals += [(module, name, getattr(module, name)) for name in spec.aggregate]
+    try:
+        module.fetch_all = timer.wrap('fetch', fetch_all)
+        Workbook.save = timer.wrap('save', Workbook.save)
+        for name in spec.aggregate:
+            setattr(module, name, timer.wrap('aggregate', getattr(module, name)))
+        yield
+    finally:
+        for owner, name, value in originals:
+            setattr(owner, name, value)
+
+
+# ---------------------------------------------------------------------------
+# Generatori
+# ---------------------------------------------------------------------------
+
+# run(module, year, month, output_path, live); year_to_date: generator čita od 1. januara
+GeneratorSpec = namedtuple('GeneratorSpec', ('module', 'run', 'aggregate', 'year_to_date'))
+
+
+def _run_advanced(module, year, month, output_path, live):
+    last_day = calendar.monthrange(year, month)[1]
+    wb = module.create_advanced_report(f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last_day:02d}", 'all')
+    wb.save(output_path)
+
+
+GENERATORS = {
+    'bhansa': GeneratorSpec(
+        'generate_bhansa_report',
+        lambda m, year, month, out, live: m.generate_bhansa_report(year, month, out),
+        (), False,
+    ),
+    'bhdca': GeneratorSpec(
+        'generate_bhdca_report',
+        # Fixture ne izvršava GROUP BY upite, pa bez baze ide Python agregacija
+        lambda m, year, month, out, live: m.generate_bhdca_report(year, month, out, aggregate_in_sql=live),
+        ('aggregate_airport_traffic', 'aggregate_city_pair_data'), False,
+    ),
+    'customs': GeneratorSpec(
+        'generate_customs_stats',
+        lambda m, year, month, out, live: m.generate_customs_stats(year, month, out),
+        ('aggregate_customs_data',), False,
+    ),
+    'local_stats': GeneratorSpec(
+        'generate_local_stats',
+        lambda m, year, month, out, live: m.generate_local_stats(year, month, out),
+        ('build_redovni_data', 'aggregate_daily'), False,
+    ),
+    'director': GeneratorSpec(
+        'generate_director_stats',
+        lambda m, year, month, out, live: m.generate_director_stats(year, month, out),
+        ('group_flights_by_month', 'aggregate_customs_data', 'combine_customs_data'), True,
+    ),
+    'wizzair': GeneratorSpec(
+        'generate_wizzair_performance',
+        lambda m, year, month, out, live: m.generate_wizzair_performance(year, month, output_path=out),
+        (), False,
+    ),
+    'advanced': GeneratorSpec(
+        'generate_custom_advanced_report',
+        _run_advanced,
+        ('aggregate_by_month', 'calculate_monthly_stats'), False,
+    ),
+}
+
+
+def benchmark_generator(name, scale, year, month, repeat, live):
+    """Pokreni jedan generator `repeat` puta; vraća rezultat najbržeg pokretanja"""
+    spec = GENERATORS[name]
+    result = {'generator': name, 'scale': scale}
+
+    try:
+        module = importlib.import_module(spec.module)
+    except ImportError as e:
+        return {**result, 'error': f"import failed: {e}"}
+
+    first_day = date(year, 1 if spec.year_to_date else month, 1)
+    last_day = date(year, month, calendar.monthrange(year, month)[1])
+    fixture = None
+    if live:
+        fetch_all = module.fetch_all
+    else:
+        fixture = FixtureDatabase(scale)
+        fixture.prepare(first_day, last_day)
+        fetch_all = fixture.fetch_all
+        result['flights'] = len(fixture.flights)
+
+    runs = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for attempt in range(repeat):
+                output_path = Path(tmp_dir) / f"{name}-{attempt}.xlsx"
+                timer = PhaseTimer()
+                with instrumented(module, spec, timer, fetch_all), \
+                        contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                    with timer:
+                        spec.run(module, year, month, output_path, live)
+                runs.append(timer.totals)
+    except Exception as e:
+        return {**result, 'error': f"{type(e).__name__}: {e}"}
+    finally:
+        if fixture:
+            fixture.clear()
+
+    best = min(runs, key=lambda totals: sum(totals.values()))
+    return {
+        **result,
+        'repeat': repeat,
+        'phases': {phase: round(best[phase], 6) for phase in PHASES},
+        'total': round(sum(best.values()), 6),
+        'totals': [round(sum(totals.values()), 6) for totals in runs],
+    }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def pop_option(args, name, default=None):
+    """Izvuci --name VALUE / --name=VALUE iz argumenata; vraća (value, remaining_args)"""
+    value = default
+    remaining = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == f'--{name}' and i + 1 < len(args):
+            value = args[i + 1]
+            i += 2
+            continue
+        if arg.startswith(f'--{name}='):
+            value = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+        i += 1
+    return value, remaining
+
+
+def current_commit():
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_ms(seconds):
+    return f"{seconds * 1000:9.1f}"
+
+
+def print_result(result):
+    label = f"   {result['generator']:<12} {result['scale']:>4}x"
+    if 'error' in result:
+        print(f"{label}   ⚠️  {result['error']}")
+        return
+    flights = f"{result['flights']:>7,} letova" if 'flights' in result else ' ' * 14
+    phases = '  '.join(f"{phase} {format_ms(result['phases'][phase])}" for phase in PHASES)
+    print(f"{label} {flights}   {phases}   total {format_ms(result['total'])} ms")
+
+
+def print_comparison(results, baseline_path):
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['generator'], r['scale']): r for r in baseline.get('results', []) if 'error' not in r}
+
+    print(f"\n📈 Poređenje sa {baseline_path} (commit {baseline.get('commit')})\n")
+    for result in results:
+        old = previous.get((result['generator'], result['scale']))
+        if 'error' in result or not old:
+            continue
+        change = (result['total'] - old['total']) / old['total'] * 100 if old['total'] else 0.0
+        marker = '🔴' if change > 10 else '🟢' if change < -10 else '  '
+        print(
+            f"   {marker} {result['generator']:<12} {result['scale']:>4}x   "
+            f"{format_ms(old['total'])} -> {format_ms(result['total'])} ms   {change:+6.1f}%"
+        )
+
+
+def main():
+    args = sys.argv[1:]
+    live = '--database' in args
+    args = [arg for arg in args if arg != '--database']
+
+    scales, args = pop_option(args, 'scales', ','.join(map(str, DEFAULT_SCALES)))
+    names, args = pop_option(args, 'generators', ','.join(GENERATORS))
+    repeat, args = pop_option(args, 'repeat', str(DEFAULT_REPEAT))
+    year, args = pop_option(args, 'year', '2025')
+    month, args = pop_option(args, 'month', '10')
+    output_path, args = pop_option(args, 'output')
+    compare_path, args = pop_option(args, 'compare')
+    if args:
+        print(f"Nepoznati argumenti: {' '.join(args)}")
+        sys.exit(1)
+
+    names = [name.strip() for name in names.split(',') if name.strip()]
+    unknown = [name for name in names if name not in GENERATORS]
+    if unknown:
+        print(f"Nepoznati generatori: {', '.join(unknown)} (dostupni: {', '.join(GENERATORS)})")
+        sys.exit(1)
+
+    # Stvarna baza se ne skalira
+    scales = [1] if live else [int(scale) for scale in scales.split(',')]
+    year, month, repeat = int(year), int(month), int(repeat)
+    commit = current_commit()
+
+    mode = 'database' if live else 'fixture'
+    print(f"📊 Report benchmark ({mode}, {year}-{month:02d}, commit {commit or '?'}, repeat {repeat})\n")
+    results = []
+    for scale in scales:
+        for name in names:
+            result = benchmark_generator(name, scale, year, month, repeat, live)
+            print_result(result)
+            results.append(result)
+
+    output_path = Path(output_path) if output_path else BENCHMARK_DIR / f"reports-{commit or 'worktree'}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'commit': commit,
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'mode': mode,
+            'year': year,
+            'month': month,
+            'baseFlightsPerMonth': BASE_FLIGHTS_PER_MONTH,
+            'results': results,
+        }, f, indent=2)
+    print(f"\n✅ Rezultati: {output_path}")
+
+    if compare_path:
+        print_comparison(results, compare_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,11 +6,15 @@ Handles route planning, historical data analysis, and passenger projections.
 
 import sys
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Any, Optional
 import sqlite3
 from pathlib import Path
 
+import numpy as np
+
+from projection_engine import ProjectionEngine, charter_adjusted, group_months, load_factor_percent
+
 class ProjectionCalculator:
     def __init__(self):
         """Initialize the projection calculator."""
@@ -34,11 +38,19 @@ class ProjectionCalculator:
         manual_count = len(routes) - baseline_count
         print(f"  Baseline routes: {baseline_count}, Manual routes: {manual_count}", file=sys.stderr)
         
-        yearly_data = self._calculate_yearly(routes)
-        quarterly_data = self._calculate_quarterly(routes, year)
-        seasonal_data = self._calculate_seasonal(routes, year)
-        monthly_data = self._calculate_monthly(routes, year)
-        route_breakdown = self._calculate_route_breakdown(routes, yearly_data['totalOperations'])
+        engine = ProjectionEngine(
+            routes, year, [self._get_aircraft_capacity(r['aircraftType']) for r in routes]
+        )
+        load_factor = self._route_load_factors(routes, engine)
+        monthly_totals = engine.monthly_totals(load_factor)
+        
+        yearly_data = self._calculate_yearly(engine, load_factor)
+        quarterly_data = self._calculate_quarterly(monthly_totals)
+        seasonal_data = self._calculate_seasonal(monthly_totals)
+        monthly_data = self._calculate_monthly(engine, monthly_totals, year)
+        route_breakdown = self._calculate_route_breakdown(
+            routes, engine, load_factor, yearly_data['totalOperations']
+        )
         
         return {
             'yearly': yearly_data,
@@ -48,68 +60,44 @@ class ProjectionCalculator:
             'routeBreakdown': route_breakdown
         }
     
-    def _calculate_yearly(self, routes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _route_load_factors(self, routes: List[Dict[str, Any]], engine: ProjectionEngine) -> np.ndarray:
+        """Load factor (0-1) po ruti, sa charter boost-om."""
+        load_factor = np.array([r['estimatedLoadFactor'] for r in routes], dtype=float) / 100.0
+        return charter_adjusted(load_factor, engine.is_charter)
+    
+    def _calculate_yearly(self, engine: ProjectionEngine, load_factor: np.ndarray) -> Dict[str, Any]:
         """Calculate yearly totals."""
-        total_operations = 0
-        total_passengers = 0
-        total_capacity = 0
-        
-        for route in routes:
-            operations = self._calculate_route_operations(route)
-            aircraft_capacity = self._get_aircraft_capacity(route['aircraftType'])
-            
-            # Apply charter boost if applicable
-            load_factor = route['estimatedLoadFactor'] / 100.0
-            if route.get('isCharter', False) and load_factor < 0.90:
-                # Charter flights typically have higher load factors
-                load_factor = max(load_factor, 0.92)
-            
-            passengers = operations * aircraft_capacity * load_factor
-            
-            total_operations += operations
-            total_passengers += passengers
-            total_capacity += operations * aircraft_capacity
-        
-        avg_load_factor = (total_passengers / total_capacity * 100) if total_capacity > 0 else 0
+        # Operacije po ruti se zaokružuju na cijeli broj (kao u route breakdown-u)
+        operations, passengers, capacity = engine.route_totals(
+            load_factor, np.trunc(engine.route_operations)
+        )
+        total_passengers = passengers.sum()
         
         return {
-            'totalOperations': int(total_operations),
+            'totalOperations': int(operations.sum()),
             'totalPassengers': int(total_passengers),
-            'averageLoadFactor': round(avg_load_factor, 2)
+            'averageLoadFactor': round(load_factor_percent(total_passengers, capacity.sum()), 2)
         }
     
-    def _calculate_quarterly(self, routes: List[Dict[str, Any]], year: int) -> List[Dict[str, Any]]:
+    def _calculate_quarterly(self, monthly_totals) -> List[Dict[str, Any]]:
         """Calculate quarterly breakdown."""
         quarters = []
         
         for q in range(1, 5):
-            q_start_month = (q - 1) * 3 + 1
-            q_end_month = q * 3
-            
-            q_operations = 0
-            q_passengers = 0
-            q_capacity = 0
-            
-            for route in routes:
-                route_ops, route_pax, route_cap = self._calculate_route_for_period(
-                    route, year, q_start_month, q_end_month
-                )
-                q_operations += route_ops
-                q_passengers += route_pax
-                q_capacity += route_cap
-            
-            q_load_factor = (q_passengers / q_capacity * 100) if q_capacity > 0 else 0
+            q_operations, q_passengers, q_capacity = group_months(
+                monthly_totals, range((q - 1) * 3 + 1, q * 3 + 1)
+            )
             
             quarters.append({
                 'quarter': q,
                 'operations': int(q_operations),
                 'passengers': int(q_passengers),
-                'loadFactor': round(q_load_factor, 2)
+                'loadFactor': round(load_factor_percent(q_passengers, q_capacity), 2)
             })
         
         return quarters
     
-    def _calculate_seasonal(self, routes: List[Dict[str, Any]], year: int) -> List[Dict[str, Any]]:
+    def _calculate_seasonal(self, monthly_totals) -> List[Dict[str, Any]]:
         """Calculate seasonal breakdown (Winter, Spring, Summer, Fall)."""
         seasons = [
             {'name': 'Zima', 'months': [12, 1, 2]},
@@ -121,79 +109,53 @@ class ProjectionCalculator:
         seasonal_data = []
         
         for season in seasons:
-            s_operations = 0
-            s_passengers = 0
-            s_capacity = 0
-            
-            for month in season['months']:
-                for route in routes:
-                    route_ops, route_pax, route_cap = self._calculate_route_for_period(
-                        route, year, month, month
-                    )
-                    s_operations += route_ops
-                    s_passengers += route_pax
-                    s_capacity += route_cap
-            
-            s_load_factor = (s_passengers / s_capacity * 100) if s_capacity > 0 else 0
+            s_operations, s_passengers, s_capacity = group_months(monthly_totals, season['months'])
             
             seasonal_data.append({
                 'season': season['name'],
                 'operations': int(s_operations),
                 'passengers': int(s_passengers),
-                'loadFactor': round(s_load_factor, 2)
+                'loadFactor': round(load_factor_percent(s_passengers, s_capacity), 2)
             })
         
         return seasonal_data
     
-    def _calculate_monthly(self, routes: List[Dict[str, Any]], year: int) -> List[Dict[str, Any]]:
+    def _calculate_monthly(self, engine: ProjectionEngine, monthly_totals, year: int) -> List[Dict[str, Any]]:
         """Calculate monthly projections."""
         monthly_data = []
+        total_ops, total_pax, total_cap = monthly_totals
+        active_routes = engine.active_routes_per_month()
         
         for month in range(1, 13):
-            total_ops = 0
-            total_pax = 0
-            total_cap = 0
-            active_routes = 0
-            
-            for route in routes:
-                ops, pax, cap = self._calculate_route_for_period(route, year, month, month)
-                if ops > 0:
-                    active_routes += 1
-                total_ops += ops
-                total_pax += pax
-                total_cap += cap
+            i = month - 1
             
             # Debug logging for November and December
             if month >= 11:
-                print(f"Month {month}: {active_routes} active routes, {int(total_ops)} ops, {int(total_pax)} pax", file=sys.stderr)
-            
-            avg_lf = (total_pax / total_cap * 100) if total_cap > 0 else 0
+                print(f"Month {month}: {active_routes[i]} active routes, {int(total_ops[i])} ops, {int(total_pax[i])} pax", file=sys.stderr)
             
             monthly_data.append({
                 'month': month,
                 'monthName': datetime(year, month, 1).strftime('%B'),
-                'operations': int(total_ops),
-                'passengers': int(total_pax),
-                'loadFactor': round(avg_lf, 2)
+                'operations': int(total_ops[i]),
+                'passengers': int(total_pax[i]),
+                'loadFactor': round(load_factor_percent(total_pax[i], total_cap[i]), 2)
             })
         
         return monthly_data
     
-    def _calculate_route_breakdown(self, routes: List[Dict[str, Any]], total_operations: int) -> List[Dict[str, Any]]:
+    def _calculate_route_breakdown(
+        self,
+        routes: List[Dict[str, Any]],
+        engine: ProjectionEngine,
+        load_factor: np.ndarray,
+        total_operations: int
+    ) -> List[Dict[str, Any]]:
         """Calculate breakdown by route."""
         breakdown = []
+        operations, passengers, _ = engine.route_totals(load_factor, np.trunc(engine.route_operations))
         
-        for route in routes:
-            operations = self._calculate_route_operations(route)
-            aircraft_capacity = self._get_aircraft_capacity(route['aircraftType'])
-            load_factor = route['estimatedLoadFactor'] / 100.0
-            
-            # Apply charter boost if applicable
-            if route.get('isCharter', False) and load_factor < 0.90:
-                load_factor = max(load_factor, 0.92)
-            
-            passengers = operations * aircraft_capacity * load_factor
-            contribution = (operations / total_operations * 100) if total_operations > 0 else 0
+        for route, route_ops, route_pax in zip(routes, operations, passengers):
+            contribution = (route_ops / total_operations * 100) if total_operations > 0 else 0
             
             # Add route type indicator
             route_type = '🛫 Charter' if route.get('isCharter', False) else '✈️ Redovan'
@@ -201,9 +163,9 @@ class ProjectionCalculator:
             
             breakdown.append({
                 'destination': destination_label,
-                'operations': int(operations),
-                'passengers': int(passengers),
-                'contribution': round(contribution, 2)
+                'operations': int(route_ops),
+                'passengers': int(route_pax),
+                'contribution': round(float(contribution), 2)
             })
         
         # Sort by operations descending
@@ -211,65 +173,6 @@ class ProjectionCalculator:
         
         return breakdown
     
-    def _calculate_route_operations(self, route: Dict[str, Any]) -> int:
-        """Calculate total operations for a route based on weekly frequency and date range."""
-        start_date = datetime.strptime(route['startDate'], '%Y-%m-%d')
-        end_date = datetime.strptime(route['endDate'], '%Y-%m-%d')
-        
-        # Calculate number of weeks
-        days_diff = (end_date - start_date).days + 1
-        weeks = days_diff / 7.0
-        
-        # Total operations = weekly operations * number of weeks
-        total_operations = route['weeklyOperations'] * weeks
-        
-        return int(total_operations)
-    
-    def _calculate_route_for_period(
-        self, 
-        route: Dict[str, Any], 
-        year: int, 
-        start_month: int, 
-        end_month: int
-    ) -> tuple:
-        """Calculate operations, passengers, and capacity for a route in a specific period."""
-        route_start = datetime.strptime(route['startDate'], '%Y-%m-%d')
-        route_end = datetime.strptime(route['endDate'], '%Y-%m-%d')
-        
-        # Define period boundaries
-        period_start = datetime(year, start_month, 1)
-        
-        # Calculate last day of end_month
-        if end_month == 12:
-            period_end = datetime(year, 12, 31)
-        else:
-            period_end = datetime(year, end_month + 1, 1) - timedelta(days=1)
-        
-        # Find overlap
-        overlap_start = max(route_start, period_start)
-        overlap_end = min(route_end, period_end)
-        
-        if overlap_start > overlap_end:
-            return 0, 0, 0
-        
-        # Calculate operations in this period
-        days_in_period = (overlap_end - overlap_start).days + 1
-        weeks_in_period = days_in_period / 7.0
-        operations = route['weeklyOperations'] * weeks_in_period
-        
-        # Calculate passengers with charter boost
-        aircraft_capacity = self._get_aircraft_capacity(route['aircraftType'])
-        load_factor = route['estimatedLoadFactor'] / 100.0
-        
-        # Apply charter boost if applicable
-        if route.get('isCharter', False) and load_factor < 0.90:
-            load_factor = max(load_factor, 0.92)
-        
-        passengers = operations * aircraft_capacity * load_factor
-        capacity = operations * aircraft_capacity
-        
-        return operations, passengers, capacity
-    
     def _get_aircraft_capacity(self, aircraft_type: str) -> int:
         """Get aircraft capacity from default values."""
         # Default capacities for common aircraft types
@@ -57,23 +57,27 @@ for sheet_name in wb.sheetnames:
 
 wb.close()
 
-# Also check the JSON file
+# Also check the extracted data
 print("\n" + "="*80)
 print("Checking extracted JSON data:")
 print("="*80 + "\n")
 
-import json
+import numpy as np
 
-with open('output/2025-flights-data.json', 'r') as f:
-    data = json.load(f)
+from flight_columns import read_flight_columns
 
-flights = data['flights']
-print(f"Total flights in JSON: {len(flights)}")
+columns = read_flight_columns('output/2025-flights-data.json', [
+    'date', 'airline', 'route', 'arrivalPassengers', 'departurePassengers',
+])
+arr_missing = np.ma.getmaskarray(columns['arrivalPassengers'])
+dep_missing = np.ma.getmaskarray(columns['departurePassengers'])
+
+print(f"Total flights in JSON: {len(columns['date'])}")
 
 # Count flights with passenger data
-with_arrival = sum(1 for f in flights if f.get('arrivalPassengers') is not None)
-with_departure = sum(1 for f in flights if f.get('departurePassengers') is not None)
-without_any = sum(1 for f in flights if f.get('arrivalPassengers') is None and f.get('departurePassengers') is None)
+with_arrival = int((~arr_missing).sum())
+with_departure = int((~dep_missing).sum())
+without_any = int((arr_missing & dep_missing).sum())
 
 print(f"Flights with arrival data: {with_arrival}")
 print(f"Flights with departure data: {with_departure}")
@@ -82,6 +86,5 @@ print(f"Flights WITHOUT any passenger data: {without_any}")
 # Show the flights without data
 if without_any > 0:
     print(f"\nFlights without passenger data in JSON:")
-    for f in flights:
-        if f.get('arrivalPassengers') is None and f.get('departurePassengers') is None:
-            print(f"  {f['date'][:10]} - {f['airline']} - {f['route']}")
+    for i in np.flatnonzero(arr_missing & dep_missing):
+        print(f"  {columns['date'][i]} - {columns['airline'][i]} - {columns['route'][i]}")
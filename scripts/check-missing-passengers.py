@@ -1,28 +1,21 @@
 #!/usr/bin/env python3
 
-import json
+import numpy as np
 
-with open('output/2025-flights-data.json', 'r') as f:
-    data = json.load(f)
+from flight_columns import read_flight_columns
 
-total_flights = len(data['flights'])
-missing_arrival = 0
-missing_departure = 0
-missing_both = 0
-has_data = 0
+columns = read_flight_columns('output/2025-flights-data.json', [
+    'date', 'airline', 'route', 'arrivalPassengers', 'departurePassengers',
+])
 
-for flight in data['flights']:
-    arr = flight.get('arrivalPassengers')
-    dep = flight.get('departurePassengers')
+total_flights = len(columns['date'])
+arr_missing = np.ma.getmaskarray(columns['arrivalPassengers'])
+dep_missing = np.ma.getmaskarray(columns['departurePassengers'])
 
-    if arr is None and dep is None:
-        missing_both += 1
-    elif arr is None:
-        missing_arrival += 1
-    elif dep is None:
-        missing_departure += 1
-    else:
-        has_data += 1
+missing_both = int((arr_missing & dep_missing).sum())
+missing_arrival = int((arr_missing & ~dep_missing).sum())
+missing_departure = int((~arr_missing & dep_missing).sum())
+has_data = int((~arr_missing & ~dep_missing).sum())
 
 print(f"📊 Passenger Data Completeness\n")
 print(f"Total flights: {total_flights}\n")
@@ -34,14 +27,8 @@ print()
 
 # Show examples of flights with missing data
 print("Examples of flights with missing passenger data:\n")
-count = 0
-for flight in data['flights']:
-    arr = flight.get('arrivalPassengers')
-    dep = flight.get('departurePassengers')
-
-    if arr is None or dep is None:
-        print(f"  {flight['date']} - {flight['airline']} - {flight['route']}")
-        print(f"    Arrival: {arr}, Departure: {dep}")
-        count += 1
-        if count >= 10:
-            break
+for i in np.flatnonzero(arr_missing | dep_missing)[:10]:
+    arr = None if arr_missing[i] else int(columns['arrivalPassengers'][i])
+    dep = None if dep_missing[i] else int(columns['departurePassengers'][i])
+    print(f"  {columns['date'][i]}T00:00:00 - {columns['airline'][i]} - {columns['route'][i]}")
+    print(f"    Arrival: {arr}, Departure: {dep}")
@@ -2,7 +2,8 @@
 
 import openpyxl
 import os
-import re
+
+from passenger_parser import parse_passengers
 
 STATS_DIR = "/Users/emir_mw/stats/STATS/2025/Dnevni izvještaji"
 month_folder = "01. JANUAR"
@@ -15,28 +16,6 @@ files = [
 
 file_path = os.path.join(month_path, files[0])
 
-def parse_passengers(value):
-    """Parse passenger string"""
-    if not value or value == '-' or value == 'N/A' or str(value).strip() == '':
-        return 0, 0
-
-    str_val = str(value).strip()
-
-    # Pattern: "110+6 INF" or "110+6"
-    match = re.match(r'^(\d+)\s*\+\s*(\d+)', str_val)
-    if match:
-        adults = int(match.group(1))
-        infants = int(match.group(2))
-        return adults, infants
-
-    # Pattern: just a number "110"
-    match = re.match(r'^(\d+)$', str_val)
-    if match:
-        adults = int(match.group(1))
-        return adults, 0
-
-    return 0, 0
-
 wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
 
 # Aircraft types that are missing
@@ -63,8 +42,8 @@ for sheet_name in wb.sheetnames:
             arrival_pax_str = row[13] if len(row) > 13 else None
             departure_pax_str = row[14] if len(row) > 14 else None
 
-            arr_adults, arr_infants = parse_passengers(arrival_pax_str)
-            dep_adults, dep_infants = parse_passengers(departure_pax_str)
+            arr_adults, arr_infants = parse_passengers(arrival_pax_str) or (0, 0)
+            dep_adults, dep_infants = parse_passengers(departure_pax_str) or (0, 0)
 
             flight_total = arr_adults + arr_infants + dep_adults + dep_infants
             skipped_pax_total += flight_total
@@ -2,47 +2,10 @@
 """
 Ultra-safe Excel helper functions for all report generators
 """
-import re
-import unicodedata
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 
-
-def sanitize_text(value):
-    """
-    Remove ALL characters that can corrupt Excel XML.
-    """
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        return value
-
-    # Normalize unicode
-    try:
-        value = unicodedata.normalize('NFC', value)
-    except Exception:
-        pass
-
-    # Remove control characters except tab, newline, carriage return
-    value = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', value)
-
-    # Try openpyxl's built-in cleaner
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Remove null bytes and BOM
-    value = value.replace('\x00', '').replace('\ufeff', '')
-
-    # Ensure valid UTF-8
-    try:
-        value = value.encode('utf-8', errors='ignore').decode('utf-8')
-    except Exception:
-        pass
-
-    return value
+from excel_sanitizer import sanitize_text
 
 
 def safe_set_cell_value(cell, value):
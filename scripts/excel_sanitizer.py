@@ -2,51 +2,70 @@
 """
 Improved Excel sanitization for all report generators
 """
-import re
 import unicodedata
+from functools import lru_cache
+
+# Broj različitih stringova koji se pamte (imena aviokompanija, aerodroma, tipova aviona...)
+CACHE_SIZE = 8192
+
+# Kontrolni znakovi 0x00-0x1F i 0x7F-0x9F (DEL + C1)
+_CONTROL_CHARS = [*range(0x00, 0x20), *range(0x7F, 0xA0)]
+
+# Stroga sanitizacija (validan XML): tab, newline i carriage return ostaju
+_XML_TABLE = dict.fromkeys(
+    [c for c in _CONTROL_CHARS if c not in (0x09, 0x0A, 0x0D)] + [0xFEFF]
+)
+
+# Sanitizacija za izvještaje: svi kontrolni znakovi, BOM i zero-width razmaci
+# se brišu, non-breaking space postaje običan razmak
+_REPORT_TABLE = dict.fromkeys(_CONTROL_CHARS + [0xFEFF, 0x200B, 0x200C, 0x200D])
+_REPORT_TABLE[0xA0] = ' '
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _sanitize_xml_str(value):
+    if value.isascii():
+        # ASCII: NFC i UTF-8 provjera ne mijenjaju ništa
+        return value if value.isprintable() else value.translate(_XML_TABLE)
+
+    value = unicodedata.normalize('NFC', value).translate(_XML_TABLE)
+    # Izbaci lone surrogate-e koji se ne mogu zapisati kao UTF-8
+    return value.encode('utf-8', errors='ignore').decode('utf-8')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _sanitize_report_str(value):
+    if value.isascii() and value.isprintable():
+        return value.strip()
+    return value.translate(_REPORT_TABLE).strip()
 
 
 def sanitize_text(value):
     """
     Remove ALL characters that can corrupt Excel XML.
-    This includes control characters, invalid XML chars, and problematic unicode.
+    This includes control characters (except tab, newline, carriage return),
+    BOM and lone surrogates; text is NFC-normalized.
+    Non-string values are returned unchanged.
     """
     if value is None:
         return None
     if not isinstance(value, str):
         return value
+    return _sanitize_xml_str(value)
 
-    # Step 1: Normalize unicode (NFC normalization)
-    try:
-        value = unicodedata.normalize('NFC', value)
-    except Exception:
-        pass
-
-    # Step 2: Remove control characters (0x00-0x1F except tab, newline, carriage return)
-    # Excel allows: 0x09 (tab), 0x0A (newline), 0x0D (carriage return)
-    value = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F]', '', value)
-
-    # Step 3: Remove other problematic characters
-    # 0x7F (DEL), and C1 control characters (0x80-0x9F)
-    value = re.sub(r'[\x7F-\x9F]', '', value)
 
-    # Step 4: Try openpyxl's built-in cleaner if available
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Step 5: Remove null bytes and other problematic chars
-    value = value.replace('\x00', '').replace('\ufeff', '')  # BOM
-
-    # Step 6: Ensure it's valid UTF-8
-    try:
-        value = value.encode('utf-8', errors='ignore').decode('utf-8')
-    except Exception:
-        pass
-
-    return value
+def sanitize_report_text(value):
+    """
+    Gentle sanitization for report generators that preserves unicode (ć, č, š, ž, đ).
+    Removes control characters (0x00-0x1F, 0x7F-0x9F), BOM and zero-width
+    spaces, replaces non-breaking space with a regular space and strips whitespace.
+    Non-string values are returned unchanged.
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        return value
+    return _sanitize_report_str(value)
 
 
 def sanitize_number(value):
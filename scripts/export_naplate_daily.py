@@ -3,9 +3,10 @@ import sys
 from copy import copy
 from pathlib import Path
 
-from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 
+from report_templates import load_template
+
 
 def find_header_row(ws):
     for row in range(1, 15):
@@ -112,7 +113,7 @@ def main():
 
     data = json.loads(input_path.read_text(encoding="utf-8"))
 
-    wb = load_workbook(template_path)
+    wb = load_template(template_path)
     ws = wb.active
 
     header_row = find_header_row(ws)
@@ -2,9 +2,10 @@ import json
 import sys
 from pathlib import Path
 
-from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 
+from report_templates import load_template
+
 
 def find_header_row(ws):
     for row in range(1, 20):
@@ -65,7 +66,7 @@ def write_amount_formula(ws, row, price_col, qty_col, amount_col):
 
 
 def export_sky_speed(template_path, output_path, carrier_data):
-    wb = load_workbook(template_path)
+    wb = load_template(template_path)
     ws = wb.active
 
     header_row = find_header_row(ws)
@@ -130,7 +131,7 @@ def export_sky_speed(template_path, output_path, carrier_data):
 
 
 def export_wizz_airport(template_path, output_path, carrier_data, airport_services, adjustments_amount):
-    wb = load_workbook(template_path)
+    wb = load_template(template_path)
     ws = wb.active
 
     header_row = find_header_row(ws)
@@ -271,7 +272,7 @@ def export_wizz_airport(template_path, output_path, carrier_data, airport_servic
 
 
 def export_general(template_path, output_path, report):
-    wb = load_workbook(template_path)
+    wb = load_template(template_path)
     ws = wb.active
 
     start_row = 4
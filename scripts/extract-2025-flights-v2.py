@@ -5,39 +5,14 @@ import os
 import sys
 import json
 import re
+from functools import lru_cache
 from datetime import datetime
 
-STATS_DIR = "/Users/emir_mw/stats/STATS/2025/Dnevni izvještaji"
-
-def parse_passengers(value):
-    """Parse passenger string like '165+6 INF' or '110' or '-'"""
-    if not value or value == '-' or value == 'N/A' or str(value).strip() == '':
-        return None
-
-    str_val = str(value).strip()
-
-    # Pattern: "110+6 INF" or "110+6" (with infants)
-    match = re.match(r'^(\d+)\s*\+\s*(\d+)', str_val)
-    if match:
-        adults = int(match.group(1))
-        infants = int(match.group(2))
-        return {
-            'adults': adults,
-            'infants': infants,
-            'total': adults + infants
-        }
+from flight_columns import write_flight_columns
+from flight_row_plan import RowPlan
+from passenger_parser import parse_passengers
 
-    # Pattern: just a number "110" (no infants)
-    match = re.match(r'^(\d+)$', str_val)
-    if match:
-        adults = int(match.group(1))
-        return {
-            'adults': adults,
-            'infants': 0,
-            'total': adults
-        }
-
-    return None
+STATS_DIR = "/Users/emir_mw/stats/STATS/2025/Dnevni izvještaji"
 
 def parse_route(route):
     """Parse route like 'TZL-AYT' and return [departure, arrival]"""
@@ -209,13 +184,128 @@ def detect_format(header_row):
 
     return format_info
 
-def safe_get(row, col):
-    """Safely get a value from row at column index"""
-    if col is None:
+@lru_cache(maxsize=None)
+def compile_format(header_row):
+    """Detect the sheet format once per header signature and compile it into a RowPlan"""
+    return RowPlan(detect_format(header_row))
+
+def parse_flight_row(row, plan, proper_date_str, source_file, sheet_name):
+    """
+    Parse one sheet row into a flight dict.
+    Returns None for rows that are not valid flights (bad date, no route).
+    """
+    # Extract data using the compiled column plan (one tuple unpack per row)
+    (
+        airline_name, arrival_from, departure_to,
+        aircraft_model, available_seats, registration, operation_type_str, mtow,
+        arrival_flight_number, departure_flight_number,
+        scheduled_arrival_time, actual_arrival_time, scheduled_departure_time, actual_departure_time,
+        arrival_pax_val, departure_pax_val, arrival_inf_val, departure_inf_val,
+        arrival_baggage, departure_baggage, arrival_cargo, departure_cargo, arrival_mail, departure_mail,
+    ) = plan.extract(row)
+
+    if plan.split_route:
+        # 2023 format: separate "Dolazak iz" and "Odlazak za" columns
+        if arrival_from and departure_to:
+            route_str = f"{arrival_from}-{departure_to}"
+        elif arrival_from:
+            route_str = arrival_from
+        elif departure_to:
+            route_str = departure_to
+        else:
+            route_str = None
+    else:
+        # Other formats: single "Ruta" column
+        route_str = arrival_from
+
+    # Parse date
+    try:
+        flight_date = datetime.strptime(proper_date_str, '%Y-%m-%d').isoformat()
+    except:
+        return None
+
+    # Parse route
+    route = parse_route(str(route_str))
+    if not route:
         return None
-    if len(row) > col:
-        return row[col]
-    return None
+
+    # Handle passenger data based on format
+    if plan.use_parse_passengers:
+        # Format 1 & 2: Passengers in "165+6 INF" format
+        arrival_pax = parse_passengers(arrival_pax_val)
+        departure_pax = parse_passengers(departure_pax_val)
+        arrival_adults, arrival_infants = arrival_pax or (None, None)
+        departure_adults, departure_infants = departure_pax or (None, None)
+    else:
+        # Format 3 & 4: Adults and infants in separate columns
+        arrival_adults = int(arrival_pax_val) if arrival_pax_val and str(arrival_pax_val).strip() not in ['-', 'N/A', ''] else None
+        departure_adults = int(departure_pax_val) if departure_pax_val and str(departure_pax_val).strip() not in ['-', 'N/A', ''] else None
+        arrival_infants = int(arrival_inf_val) if arrival_inf_val and str(arrival_inf_val).strip() not in ['-', 'N/A', ''] else None
+        departure_infants = int(departure_inf_val) if departure_inf_val and str(departure_inf_val).strip() not in ['-', 'N/A', ''] else None
+
+    # Create flight object
+    flight = {
+        'date': flight_date,
+        'airline': str(airline_name).strip().upper(),
+        'route': str(route_str),
+        'departureAirport': route['departure'],
+        'arrivalAirport': route['arrival'],
+        'aircraftModel': str(aircraft_model).strip(),
+        'registration': str(registration or ''),
+        'operationType': str(operation_type_str).strip().upper() if operation_type_str else 'N/A',
+
+        # Additional data
+        'availableSeats': int(available_seats) if available_seats and str(available_seats).strip() not in ['-', 'N/A', ''] else None,
+        'mtow': int(mtow) if mtow and str(mtow).strip() and str(mtow).strip() != '-' else None,
+        'arrivalFlightNumber': str(arrival_flight_number) if arrival_flight_number else None,
+        'departureFlightNumber': str(departure_flight_number) if departure_flight_number else None,
+
+        # Times
+        'scheduledArrivalTime': str(scheduled_arrival_time) if scheduled_arrival_time and str(scheduled_arrival_time).strip() not in ['-', 'N/A', ''] else None,
+        'actualArrivalTime': str(actual_arrival_time) if actual_arrival_time and str(actual_arrival_time).strip() not in ['-', 'N/A', ''] else None,
+        'scheduledDepartureTime': str(scheduled_departure_time) if scheduled_departure_time and str(scheduled_departure_time).strip() not in ['-', 'N/A', ''] else None,
+        'actualDepartureTime': str(actual_departure_time) if actual_departure_time and str(actual_departure_time).strip() not in ['-', 'N/A', ''] else None,
+
+        # Passengers
+        'arrivalPassengers': arrival_adults,
+        'arrivalInfants': arrival_infants,
+        'departurePassengers': departure_adults,
+        'departureInfants': departure_infants,
+
+        # Baggage, cargo, mail
+        'arrivalBaggage': int(arrival_baggage) if arrival_baggage and str(arrival_baggage).strip() != '-' else None,
+        'departureBaggage': int(departure_baggage) if departure_baggage and str(departure_baggage).strip() != '-' else None,
+        'arrivalCargo': int(arrival_cargo) if arrival_cargo and str(arrival_cargo).strip() != '-' else None,
+        'departureCargo': int(departure_cargo) if departure_cargo and str(departure_cargo).strip() != '-' else None,
+        'arrivalMail': int(arrival_mail) if arrival_mail and str(arrival_mail).strip() != '-' else None,
+        'departureMail': int(departure_mail) if departure_mail and str(departure_mail).strip() != '-' else None,
+
+        'sourceFile': source_file,
+        'sheet': sheet_name,
+    }
+
+    return flight
+
+def non_empty_rows(rows):
+    """Skip empty rows (no value in the first column)"""
+    for row in rows:
+        if row and row[0]:
+            yield row
+
+def iter_sheet_flights(rows, plan, proper_date_str, source_file, sheet_name):
+    """
+    Stream flights from sheet rows (header already consumed):
+    non_empty_rows -> parse_flight_row -> yield valid flights.
+    Only one row is held in memory at a time.
+    """
+    for row in non_empty_rows(rows):
+        try:
+            flight = parse_flight_row(row, plan, proper_date_str, source_file, sheet_name)
+        except Exception:
+            # Skip problematic rows silently
+            continue
+        if flight:
+            yield flight
 
 def extract_month(month_folder):
     """Extract flight data from one month"""
@@ -256,127 +346,15 @@ def extract_month(month_folder):
             ws = wb[sheet_name]
 
             # Detect format for THIS sheet (each sheet might have different structure!)
-            sheet_rows = list(ws.iter_rows(values_only=True))
-            if len(sheet_rows) == 0:
+            # Header is read with next(); the remaining rows are streamed
+            rows = ws.iter_rows(values_only=True)
+            header_row = next(rows, None)
+            if header_row is None:
                 continue
 
-            header_row = sheet_rows[0]
-            fmt = detect_format(header_row)
-
-            for i, row in enumerate(sheet_rows, 1):
-                # Skip header
-                if i == 1:
-                    continue
-
-                # Skip empty rows
-                if not row[0]:
-                    continue
-
-                try:
-                    # Extract data using format-specific columns
-                    airline_name = safe_get(row, fmt['airline_col'])
-                    route_str = safe_get(row, fmt['route_col'])
-                    aircraft_model = safe_get(row, fmt['aircraft_col'])
-                    available_seats = safe_get(row, fmt.get('available_seats_col'))
-                    registration = safe_get(row, fmt['registration_col'])
-                    operation_type_str = safe_get(row, fmt['operation_type_col'])
-                    mtow = safe_get(row, fmt['mtow_col'])
-                    arrival_flight_number = safe_get(row, fmt['arrival_flight_number_col'])
-                    departure_flight_number = safe_get(row, fmt['departure_flight_number_col'])
-
-                    # Times
-                    scheduled_arrival_time = safe_get(row, fmt.get('scheduled_arrival_time_col'))
-                    actual_arrival_time = safe_get(row, fmt.get('actual_arrival_time_col'))
-                    scheduled_departure_time = safe_get(row, fmt.get('scheduled_departure_time_col'))
-                    actual_departure_time = safe_get(row, fmt.get('actual_departure_time_col'))
-
-                    # Passenger data
-                    arrival_pax_val = safe_get(row, fmt['arrival_pax_col'])
-                    departure_pax_val = safe_get(row, fmt['departure_pax_col'])
-                    arrival_inf_val = safe_get(row, fmt['arrival_inf_col'])
-                    departure_inf_val = safe_get(row, fmt['departure_inf_col'])
-
-                    # Baggage, cargo, mail
-                    arrival_baggage = safe_get(row, fmt['arrival_baggage_col'])
-                    departure_baggage = safe_get(row, fmt['departure_baggage_col'])
-                    arrival_cargo = safe_get(row, fmt['arrival_cargo_col'])
-                    departure_cargo = safe_get(row, fmt['departure_cargo_col'])
-                    arrival_mail = safe_get(row, fmt['arrival_mail_col'])
-                    departure_mail = safe_get(row, fmt['departure_mail_col'])
-
-                    # Parse date
-                    try:
-                        flight_date = datetime.strptime(proper_date_str, '%Y-%m-%d').isoformat()
-                    except:
-                        continue
-
-                    # Parse route
-                    route = parse_route(str(route_str))
-                    if not route:
-                        continue
-
-                    # Handle passenger data based on format
-                    if fmt['use_parse_passengers']:
-                        # Format 1 & 2: Passengers in "165+6 INF" format
-                        arrival_pax = parse_passengers(arrival_pax_val)
-                        departure_pax = parse_passengers(departure_pax_val)
-                        arrival_adults = arrival_pax['adults'] if arrival_pax else None
-                        arrival_infants = arrival_pax['infants'] if arrival_pax else None
-                        departure_adults = departure_pax['adults'] if departure_pax else None
-                        departure_infants = departure_pax['infants'] if departure_pax else None
-                    else:
-                        # Format 3 & 4: Adults and infants in separate columns
-                        arrival_adults = int(arrival_pax_val) if arrival_pax_val and str(arrival_pax_val).strip() not in ['-', 'N/A', ''] else None
-                        departure_adults = int(departure_pax_val) if departure_pax_val and str(departure_pax_val).strip() not in ['-', 'N/A', ''] else None
-                        arrival_infants = int(arrival_inf_val) if arrival_inf_val and str(arrival_inf_val).strip() not in ['-', 'N/A', ''] else None
-                        departure_infants = int(departure_inf_val) if departure_inf_val and str(departure_inf_val).strip() not in ['-', 'N/A', ''] else None
-
-                    # Create flight object
-                    flight = {
-                        'date': flight_date,
-                        'airline': str(airline_name).strip().upper(),
-                        'route': str(route_str),
-                        'departureAirport': route['departure'],
-                        'arrivalAirport': route['arrival'],
-                        'aircraftModel': str(aircraft_model).strip(),
-                        'registration': str(registration or ''),
-                        'operationType': str(operation_type_str).strip().upper() if operation_type_str else 'N/A',
-
-                        # Additional data
-                        'availableSeats': int(available_seats) if available_seats and str(available_seats).strip() not in ['-', 'N/A', ''] else None,
-                        'mtow': int(mtow) if mtow and str(mtow).strip() and str(mtow).strip() != '-' else None,
-                        'arrivalFlightNumber': str(arrival_flight_number) if arrival_flight_number else None,
-                        'departureFlightNumber': str(departure_flight_number) if departure_flight_number else None,
-
-                        # Times
-                        'scheduledArrivalTime': str(scheduled_arrival_time) if scheduled_arrival_time and str(scheduled_arrival_time).strip() not in ['-', 'N/A', ''] else None,
-                        'actualArrivalTime': str(actual_arrival_time) if actual_arrival_time and str(actual_arrival_time).strip() not in ['-', 'N/A', ''] else None,
-                        'scheduledDepartureTime': str(scheduled_departure_time) if scheduled_departure_time and str(scheduled_departure_time).strip() not in ['-', 'N/A', ''] else None,
-                        'actualDepartureTime': str(actual_departure_time) if actual_departure_time and str(actual_departure_time).strip() not in ['-', 'N/A', ''] else None,
-
-                        # Passengers
-                        'arrivalPassengers': arrival_adults,
-                        'arrivalInfants': arrival_infants,
-                        'departurePassengers': departure_adults,
-                        'departureInfants': departure_infants,
-
-                        # Baggage, cargo, mail
-                        'arrivalBaggage': int(arrival_baggage) if arrival_baggage and str(arrival_baggage).strip() != '-' else None,
-                        'departureBaggage': int(departure_baggage) if departure_baggage and str(departure_baggage).strip() != '-' else None,
-                        'arrivalCargo': int(arrival_cargo) if arrival_cargo and str(arrival_cargo).strip() != '-' else None,
-                        'departureCargo': int(departure_cargo) if departure_cargo and str(departure_cargo).strip() != '-' else None,
-                        'arrivalMail': int(arrival_mail) if arrival_mail and str(arrival_mail).strip() != '-' else None,
-                        'departureMail': int(departure_mail) if departure_mail and str(departure_mail).strip() != '-' else None,
-
-                        'sourceFile': files[0],
-                        'sheet': sheet_name,
-                    }
-
-                    flights.append(flight)
-
-                except Exception as e:
-                    # Skip problematic rows silently
-                    pass
+            plan = compile_format(header_row)
+
+            flights.extend(iter_sheet_flights(rows, plan, proper_date_str, files[0], sheet_name))
 
         print(f"✅ {len(flights)} flights")
         wb.close()
@@ -430,12 +408,16 @@ def main():
             'extractedAt': datetime.now().isoformat(),
         }, f, indent=2, ensure_ascii=False)
 
+    # Compact columnar copy for the verification scripts
+    columns_file = write_flight_columns(all_flights, output_file)
+
     print('\\n' + '='*80)
     print('✅ EXTRACTION COMPLETED')
     print('='*80)
     print(f'\\n📋 Summary:')
     print(f'   - Total flights: {len(all_flights)}')
-    print(f'   - Output file: {output_file}\\n')
+    print(f'   - Output file: {output_file}')
+    print(f'   - Columnar file: {columns_file}\\n')
 
 if __name__ == '__main__':
     main()
@@ -7,37 +7,9 @@ import json
 import re
 from datetime import datetime
 
-STATS_DIR = "/Users/emir_mw/stats/STATS/2025/Dnevni izvještaji"
-
-def parse_passengers(value):
-    """Parse passenger string like '165+6 INF' or '110' or '-'"""
-    if not value or value == '-' or value == 'N/A' or str(value).strip() == '':
-        return None
-
-    str_val = str(value).strip()
-
-    # Pattern: "110+6 INF" or "110+6" (with infants)
-    match = re.match(r'^(\d+)\s*\+\s*(\d+)', str_val)
-    if match:
-        adults = int(match.group(1))
-        infants = int(match.group(2))
-        return {
-            'adults': adults,
-            'infants': infants,
-            'total': adults + infants
-        }
-
-    # Pattern: just a number "110" (no infants)
-    match = re.match(r'^(\d+)$', str_val)
-    if match:
-        adults = int(match.group(1))
-        return {
-            'adults': adults,
-            'infants': 0,
-            'total': adults
-        }
+from passenger_parser import parse_passengers
 
-    return None
+STATS_DIR = "/Users/emir_mw/stats/STATS/2025/Dnevni izvještaji"
 
 def parse_route(route):
     """Parse route like 'TZL-AYT' and return [departure, arrival]"""
@@ -169,10 +141,10 @@ def extract_month(month_folder):
                         'departureFlightNumber': str(departure_flight_number) if departure_flight_number else None,
 
                         # Passengers (parsed)
-                        'arrivalPassengers': arrival_pax['adults'] if arrival_pax else None,
-                        'arrivalInfants': arrival_pax['infants'] if arrival_pax else None,
-                        'departurePassengers': departure_pax['adults'] if departure_pax else None,
-                        'departureInfants': departure_pax['infants'] if departure_pax else None,
+                        'arrivalPassengers': arrival_pax[0] if arrival_pax else None,
+                        'arrivalInfants': arrival_pax[1] if arrival_pax else None,
+                        'departurePassengers': departure_pax[0] if departure_pax else None,
+                        'departureInfants': departure_pax[1] if departure_pax else None,
 
                         # Baggage, cargo, mail
                         'arrivalBaggage': int(arrival_baggage) if arrival_baggage and str(arrival_baggage).strip() != '-' else None,
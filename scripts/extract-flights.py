@@ -5,8 +5,25 @@ import os
 import sys
 import json
 import re
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from flight_columns import write_flight_columns
+import flight_row_plan
+import passenger_parser
+from flight_row_plan import RowPlan
+from ingest_manifest import (
+    IngestManifest,
+    cached_sheet,
+    code_version,
+    entry_records,
+    file_entry,
+    file_unchanged,
+    sheet_fingerprints,
+)
+from passenger_parser import parse_passengers
+
 # Get year from command line argument or use default
 YEAR = sys.argv[1] if len(sys.argv) > 1 else "2025"
 
@@ -15,35 +32,8 @@ STATS_DIR = f"/Users/emir_mw/stats/STATS/{YEAR}/Dnevni izvještaji"
 if not os.path.exists(STATS_DIR):
     STATS_DIR = f"/Users/emir_mw/stats/STATS/{YEAR}/Mjesečni izvještaji"
 
-def parse_passengers(value):
-    """Parse passenger string like '165+6 INF' or '110' or '-'"""
-    if not value or value == '-' or value == 'N/A' or str(value).strip() == '':
-        return None
-
-    str_val = str(value).strip()
-
-    # Pattern: "110+6 INF" or "110+6" (with infants)
-    match = re.match(r'^(\d+)\s*\+\s*(\d+)', str_val)
-    if match:
-        adults = int(match.group(1))
-        infants = int(match.group(2))
-        return {
-            'adults': adults,
-            'infants': infants,
-            'total': adults + infants
-        }
-
-    # Pattern: just a number "110" (no infants)
-    match = re.match(r'^(\d+)$', str_val)
-    if match:
-        adults = int(match.group(1))
-        return {
-            'adults': adults,
-            'infants': 0,
-            'total': adults
-        }
-
-    return None
+# --format: json = jedan dokument na kraju, jsonl = jedan let po liniji, upisuje se tokom ekstrakcije
+OUTPUT_FORMATS = ('json', 'jsonl')
 
 def parse_route(route):
     """Parse route like 'TZL-AYT' and return [departure, arrival]"""
@@ -253,16 +243,150 @@ def detect_format(header_row):
 
     return format_info
 
-def safe_get(row, col):
-    """Safely get a value from row at column index"""
-    if col is None:
+@lru_cache(maxsize=None)
+def compile_format(header_row):
+    """Detect the sheet format once per header signature and compile it into a RowPlan"""
+    return RowPlan(detect_format(header_row))
+
+def parse_flight_row(row, plan, sheet_date, source_file, sheet_name):
+    """
+    Parse one sheet row into a flight dict.
+    Returns None for rows that are not valid flights (no date, no route).
+    sheet_date is 'YYYY-MM-DD' from the sheet name, or None when the date
+    is in the first column (2023 format).
+    """
+    # Determine proper_date_str
+    if sheet_date:
+        # 2024/2025 format: day is in sheet name
+        proper_date_str = sheet_date
+    else:
+        # 2023 format: date is in first column (datetime object)
+        date_obj = row[0]
+        if isinstance(date_obj, datetime):
+            proper_date_str = date_obj.strftime('%Y-%m-%d')
+        else:
+            # Skip rows without valid date
+            return None
+    # Extract data using the compiled column plan (one tuple unpack per row)
+    (
+        airline_name, arrival_from, departure_to,
+        aircraft_model, available_seats, registration, operation_type_str, mtow,
+        arrival_flight_number, departure_flight_number,
+        scheduled_arrival_time, actual_arrival_time, scheduled_departure_time, actual_departure_time,
+        arrival_pax_val, departure_pax_val, arrival_inf_val, departure_inf_val,
+        arrival_baggage, departure_baggage, arrival_cargo, departure_cargo, arrival_mail, departure_mail,
+    ) = plan.extract(row)
+
+    if plan.split_route:
+        # 2023 format: separate "Dolazak iz" and "Odlazak za" columns
+        if arrival_from and departure_to:
+            route_str = f"{arrival_from}-{departure_to}"
+        elif arrival_from:
+            route_str = arrival_from
+        elif departure_to:
+            route_str = departure_to
+        else:
+            route_str = None
+    else:
+        # Other formats: single "Ruta" column
+        route_str = arrival_from
+
+    # Parse date
+    try:
+        flight_date = datetime.strptime(proper_date_str, '%Y-%m-%d').isoformat()
+    except:
         return None
-    if len(row) > col:
-        return row[col]
-    return None
 
-def extract_month(month_folder):
-    """Extract flight data from one month"""
+    # Parse route
+    route = parse_route(str(route_str))
+    if not route:
+        return None
+
+    # Handle passenger data based on format
+    if plan.use_parse_passengers:
+        # Format 1 & 2: Passengers in "165+6 INF" format
+        arrival_pax = parse_passengers(arrival_pax_val)
+        departure_pax = parse_passengers(departure_pax_val)
+        arrival_adults, arrival_infants = arrival_pax or (None, None)
+        departure_adults, departure_infants = departure_pax or (None, None)
+    else:
+        # Format 3 & 4: Adults and infants in separate columns
+        arrival_adults = int(arrival_pax_val) if arrival_pax_val and str(arrival_pax_val).strip() not in ['-', 'N/A', ''] else None
+        departure_adults = int(departure_pax_val) if departure_pax_val and str(departure_pax_val).strip() not in ['-', 'N/A', ''] else None
+        arrival_infants = int(arrival_inf_val) if arrival_inf_val and str(arrival_inf_val).strip() not in ['-', 'N/A', ''] else None
+        departure_infants = int(departure_inf_val) if departure_inf_val and str(departure_inf_val).strip() not in ['-', 'N/A', ''] else None
+
+    # Create flight object
+    flight = {
+        'date': flight_date,
+        'airline': str(airline_name).strip().upper(),
+        'route': str(route_str),
+        'departureAirport': route['departure'],
+        'arrivalAirport': route['arrival'],
+        'aircraftModel': str(aircraft_model).strip(),
+        'registration': str(registration or ''),
+        'operationType': str(operation_type_str).strip().upper() if operation_type_str else 'N/A',
+
+        # Additional data
+        'availableSeats': int(available_seats) if available_seats and str(available_seats).strip() not in ['-', 'N/A', ''] else None,
+        'mtow': int(mtow) if mtow and str(mtow).strip() and str(mtow).strip() != '-' else None,
+        'arrivalFlightNumber': str(arrival_flight_number) if arrival_flight_number else None,
+        'departureFlightNumber': str(departure_flight_number) if departure_flight_number else None,
+
+        # Times
+        'scheduledArrivalTime': str(scheduled_arrival_time) if scheduled_arrival_time and str(scheduled_arrival_time).strip() not in ['-', 'N/A', ''] else None,
+        'actualArrivalTime': str(actual_arrival_time) if actual_arrival_time and str(actual_arrival_time).strip() not in ['-', 'N/A', ''] else None,
+        'scheduledDepartureTime': str(scheduled_departure_time) if scheduled_departure_time and str(scheduled_departure_time).strip() not in ['-', 'N/A', ''] else None,
+        'actualDepartureTime': str(actual_departure_time) if actual_departure_time and str(actual_departure_time).strip() not in ['-', 'N/A', ''] else None,
+
+        # Passengers
+        'arrivalPassengers': arrival_adults,
+        'arrivalInfants': arrival_infants,
+        'departurePassengers': departure_adults,
+        'departureInfants': departure_infants,
+
+        # Baggage, cargo, mail
+        'arrivalBaggage': int(arrival_baggage) if arrival_baggage and str(arrival_baggage).strip() != '-' else None,
+        'departureBaggage': int(departure_baggage) if departure_baggage and str(departure_baggage).strip() != '-' else None,
+        'arrivalCargo': int(arrival_cargo) if arrival_cargo and str(arrival_cargo).strip() != '-' else None,
+        'departureCargo': int(departure_cargo) if departure_cargo and str(departure_cargo).strip() != '-' else None,
+        'arrivalMail': int(arrival_mail) if arrival_mail and str(arrival_mail).strip() != '-' else None,
+        'departureMail': int(departure_mail) if departure_mail and str(departure_mail).strip() != '-' else None,
+
+        'sourceFile': source_file,
+        'sheet': sheet_name,
+    }
+
+    return flight
+
+def non_empty_rows(rows):
+    """Skip empty rows (no value in the first column)"""
+    for row in rows:
+        if row and row[0]:
+            yield row
+
+def iter_sheet_flights(rows, plan, sheet_date, source_file, sheet_name):
+    """
+    Stream flights from sheet rows (header already consumed):
+    non_empty_rows -> parse_flight_row -> yield valid flights.
+    Only one row is held in memory at a time.
+    """
+    for row in non_empty_rows(rows):
+        try:
+            flight = parse_flight_row(row, plan, sheet_date, source_file, sheet_name)
+        except Exception:
+            # Skip problematic rows silently
+            continue
+        if flight:
+            yield flight
+
+def log_month(message):
+    """One progress line per month, written in a single call so parallel workers don't interleave"""
+    sys.stdout.write(message + '\n')
+    sys.stdout.flush()
+
+def find_month_file(month_folder):
+    """Path of the month's flight workbook, or None"""
     month_path = os.path.join(STATS_DIR, month_folder)
 
     # Find Excel file (match both 2025 and 2024 naming conventions)
@@ -272,200 +396,192 @@ def extract_month(month_folder):
     ]
 
     if not files:
-        print(f"   ⚠️  No Excel file found in {month_folder}")
-        return []
+        return None
 
     # Prefer files without "STATISTIKA" in name (those are summary files, not flight data)
     non_stat_files = [f for f in files if 'STATISTIKA' not in f.upper()]
     files_to_use = non_stat_files if non_stat_files else files
 
-    file_path = os.path.join(month_path, files_to_use[0])
-    flights = []
+    return os.path.join(month_path, files_to_use[0])
 
-    try:
-        print(f"📊 {month_folder}: ", end="", flush=True)
+def extract_month(month_folder, previous=None):
+    """
+    Extract flight data from one month.
+
+    previous is this workbook's ingest manifest entry from the last run (or None).
+    An unchanged workbook is not opened at all; in a changed one only sheets
+    whose fingerprint changed are parsed again.
+    Returns (flights, manifest_entry).
+    """
+    file_path = find_month_file(month_folder)
+    if not file_path:
+        print(f"   ⚠️  No Excel file found in {month_folder}")
+        return [], None
+
+    source_file = os.path.basename(file_path)
 
+    if file_unchanged(previous, file_path):
+        flights = entry_records(previous)
+        log_month(f"📊 {month_folder}: ⏭️  unchanged, {len(flights)} flights from manifest")
+        return flights, previous
+
+    try:
+        fingerprints = sheet_fingerprints(file_path)
         wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
 
         # Extract year and month from folder name
         month_number = month_folder.split('.')[0].strip().zfill(2)
         year = YEAR
 
+        flights = []
+        sheets = {}
+        parsed_sheets = 0
+
         # Iterate through all sheets (days)
         for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-
-            # Detect format for THIS sheet (each sheet might have different structure!)
-            sheet_rows = list(ws.iter_rows(values_only=True))
-            if len(sheet_rows) == 0:
-                continue
-
-            header_row = sheet_rows[0]
-            fmt = detect_format(header_row)
-
-            # Extract day from sheet name (2024/2025 format) or use None (2023 format - date in first column)
-            day_str = re.match(r'^(\d+)', sheet_name.strip())
-            sheet_has_day = day_str is not None
-            day_from_sheet = day_str.group(1).zfill(2) if sheet_has_day else None
-
-            for i, row in enumerate(sheet_rows, 1):
-                # Skip header
-                if i == 1:
-                    continue
-
-                # Skip empty rows
-                if not row[0]:
-                    continue
-
-                try:
-                    # Determine proper_date_str
-                    if sheet_has_day:
-                        # 2024/2025 format: day is in sheet name
-                        proper_date_str = f"{year}-{month_number}-{day_from_sheet}"
-                    else:
-                        # 2023 format: date is in first column (datetime object)
-                        date_obj = row[0]
-                        if isinstance(date_obj, datetime):
-                            proper_date_str = date_obj.strftime('%Y-%m-%d')
-                        else:
-                            # Skip rows without valid date
-                            continue
-                    # Extract data using format-specific columns
-                    airline_name = safe_get(row, fmt['airline_col'])
-
-                    # Extract route (can be single column or list of [arrival_from, departure_to] columns)
-                    route_col = fmt['route_col']
-                    if isinstance(route_col, list):
-                        # 2023 format: separate "Dolazak iz" and "Odlazak za" columns
-                        arrival_from = safe_get(row, route_col[0])
-                        departure_to = safe_get(row, route_col[1])
-                        if arrival_from and departure_to:
-                            route_str = f"{arrival_from}-{departure_to}"
-                        elif arrival_from:
-                            route_str = arrival_from
-                        elif departure_to:
-                            route_str = departure_to
-                        else:
-                            route_str = None
-                    else:
-                        # Other formats: single "Ruta" column
-                        route_str = safe_get(row, route_col)
-
-                    aircraft_model = safe_get(row, fmt['aircraft_col'])
-                    available_seats = safe_get(row, fmt.get('available_seats_col'))
-                    registration = safe_get(row, fmt['registration_col'])
-                    operation_type_str = safe_get(row, fmt['operation_type_col'])
-                    mtow = safe_get(row, fmt['mtow_col'])
-                    arrival_flight_number = safe_get(row, fmt['arrival_flight_number_col'])
-                    departure_flight_number = safe_get(row, fmt['departure_flight_number_col'])
-
-                    # Times
-                    scheduled_arrival_time = safe_get(row, fmt.get('scheduled_arrival_time_col'))
-                    actual_arrival_time = safe_get(row, fmt.get('actual_arrival_time_col'))
-                    scheduled_departure_time = safe_get(row, fmt.get('scheduled_departure_time_col'))
-                    actual_departure_time = safe_get(row, fmt.get('actual_departure_time_col'))
-
-                    # Passenger data
-                    arrival_pax_val = safe_get(row, fmt['arrival_pax_col'])
-                    departure_pax_val = safe_get(row, fmt['departure_pax_col'])
-                    arrival_inf_val = safe_get(row, fmt['arrival_inf_col'])
-                    departure_inf_val = safe_get(row, fmt['departure_inf_col'])
-
-                    # Baggage, cargo, mail
-                    arrival_baggage = safe_get(row, fmt['arrival_baggage_col'])
-                    departure_baggage = safe_get(row, fmt['departure_baggage_col'])
-                    arrival_cargo = safe_get(row, fmt['arrival_cargo_col'])
-                    departure_cargo = safe_get(row, fmt['departure_cargo_col'])
-                    arrival_mail = safe_get(row, fmt['arrival_mail_col'])
-                    departure_mail = safe_get(row, fmt['departure_mail_col'])
-
-                    # Parse date
-                    try:
-                        flight_date = datetime.strptime(proper_date_str, '%Y-%m-%d').isoformat()
-                    except:
-                        continue
-
-                    # Parse route
-                    route = parse_route(str(route_str))
-                    if not route:
-                        continue
-
-                    # Handle passenger data based on format
-                    if fmt['use_parse_passengers']:
-                        # Format 1 & 2: Passengers in "165+6 INF" format
-                        arrival_pax = parse_passengers(arrival_pax_val)
-                        departure_pax = parse_passengers(departure_pax_val)
-                        arrival_adults = arrival_pax['adults'] if arrival_pax else None
-                        arrival_infants = arrival_pax['infants'] if arrival_pax else None
-                        departure_adults = departure_pax['adults'] if departure_pax else None
-                        departure_infants = departure_pax['infants'] if departure_pax else None
-                    else:
-                        # Format 3 & 4: Adults and infants in separate columns
-                        arrival_adults = int(arrival_pax_val) if arrival_pax_val and str(arrival_pax_val).strip() not in ['-', 'N/A', ''] else None
-                        departure_adults = int(departure_pax_val) if departure_pax_val and str(departure_pax_val).strip() not in ['-', 'N/A', ''] else None
-                        arrival_infants = int(arrival_inf_val) if arrival_inf_val and str(arrival_inf_val).strip() not in ['-', 'N/A', ''] else None
-                        departure_infants = int(departure_inf_val) if departure_inf_val and str(departure_inf_val).strip() not in ['-', 'N/A', ''] else None
-
-                    # Create flight object
-                    flight = {
-                        'date': flight_date,
-                        'airline': str(airline_name).strip().upper(),
-                        'route': str(route_str),
-                        'departureAirport': route['departure'],
-                        'arrivalAirport': route['arrival'],
-                        'aircraftModel': str(aircraft_model).strip(),
-                        'registration': str(registration or ''),
-                        'operationType': str(operation_type_str).strip().upper() if operation_type_str else 'N/A',
-
-                        # Additional data
-                        'availableSeats': int(available_seats) if available_seats and str(available_seats).strip() not in ['-', 'N/A', ''] else None,
-                        'mtow': int(mtow) if mtow and str(mtow).strip() and str(mtow).strip() != '-' else None,
-                        'arrivalFlightNumber': str(arrival_flight_number) if arrival_flight_number else None,
-                        'departureFlightNumber': str(departure_flight_number) if departure_flight_number else None,
-
-                        # Times
-                        'scheduledArrivalTime': str(scheduled_arrival_time) if scheduled_arrival_time and str(scheduled_arrival_time).strip() not in ['-', 'N/A', ''] else None,
-                        'actualArrivalTime': str(actual_arrival_time) if actual_arrival_time and str(actual_arrival_time).strip() not in ['-', 'N/A', ''] else None,
-                        'scheduledDepartureTime': str(scheduled_departure_time) if scheduled_departure_time and str(scheduled_departure_time).strip() not in ['-', 'N/A', ''] else None,
-                        'actualDepartureTime': str(actual_departure_time) if actual_departure_time and str(actual_departure_time).strip() not in ['-', 'N/A', ''] else None,
-
-                        # Passengers
-                        'arrivalPassengers': arrival_adults,
-                        'arrivalInfants': arrival_infants,
-                        'departurePassengers': departure_adults,
-                        'departureInfants': departure_infants,
-
-                        # Baggage, cargo, mail
-                        'arrivalBaggage': int(arrival_baggage) if arrival_baggage and str(arrival_baggage).strip() != '-' else None,
-                        'departureBaggage': int(departure_baggage) if departure_baggage and str(departure_baggage).strip() != '-' else None,
-                        'arrivalCargo': int(arrival_cargo) if arrival_cargo and str(arrival_cargo).strip() != '-' else None,
-                        'departureCargo': int(departure_cargo) if departure_cargo and str(departure_cargo).strip() != '-' else None,
-                        'arrivalMail': int(arrival_mail) if arrival_mail and str(arrival_mail).strip() != '-' else None,
-                        'departureMail': int(departure_mail) if departure_mail and str(departure_mail).strip() != '-' else None,
-
-                        'sourceFile': files[0],
-                        'sheet': sheet_name,
-                    }
-
-                    flights.append(flight)
-
-                except Exception as e:
-                    # Skip problematic rows silently
-                    pass
-
-        print(f"✅ {len(flights)} flights")
+            fingerprint = fingerprints.get(sheet_name)
+            records = cached_sheet(previous, sheet_name, fingerprint)
+
+            if records is None:
+                records = list(extract_sheet(wb[sheet_name], sheet_name, year, month_number, source_file))
+                parsed_sheets += 1
+
+            sheets[sheet_name] = {'fingerprint': fingerprint, 'records': records}
+            flights.extend(records)
+
         wb.close()
-        return flights
+
+        entry = file_entry(file_path, sheets)
+
+        log_month(f"📊 {month_folder}: ✅ {len(flights)} flights ({parsed_sheets}/{len(sheets)} sheets parsed)")
+        return flights, entry
 
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
-        return []
+        log_month(f"📊 {month_folder}: ❌ Error: {str(e)}")
+        return [], None
+
+def extract_sheet(ws, sheet_name, year, month_number, source_file):
+    """Stream flights from one day-sheet"""
+    # Detect format for THIS sheet (each sheet might have different structure!)
+    # Header is read with next(); the remaining rows are streamed
+    rows = ws.iter_rows(values_only=True)
+    header_row = next(rows, None)
+    if header_row is None:
+        return
+
+    plan = compile_format(header_row)
+
+    # Extract day from sheet name (2024/2025 format) or use None (2023 format - date in first column)
+    day_str = re.match(r'^(\d+)', sheet_name.strip())
+    sheet_date = f"{year}-{month_number}-{day_str.group(1).zfill(2)}" if day_str else None
+
+    yield from iter_sheet_flights(rows, plan, sheet_date, source_file, sheet_name)
+
+def parse_jobs(args):
+    """
+    Parse --jobs N / --jobs=N (number of parallel processes).
+    Returns (jobs, remaining_args); --jobs 0 means one process per CPU.
+    """
+    jobs = 1
+    remaining = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--jobs' and i + 1 < len(args):
+            jobs = int(args[i + 1])
+            i += 2
+            continue
+        if arg.startswith('--jobs='):
+            jobs = int(arg.split('=', 1)[1])
+        else:
+            remaining.append(arg)
+        i += 1
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return jobs, remaining
+
+def parse_format(args):
+    """
+    Parse --format json|jsonl / --format=jsonl (output format).
+    Returns (format, remaining_args).
+    """
+    output_format = 'json'
+    remaining = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--format' and i + 1 < len(args):
+            output_format = args[i + 1]
+            i += 2
+            continue
+        if arg.startswith('--format='):
+            output_format = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+        i += 1
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown --format {output_format} (expected one of: {', '.join(OUTPUT_FORMATS)})")
+    return output_format, remaining
+
+def iter_months(month_folders, jobs=1, manifest=None):
+    """
+    Extract several month folders, serially or in a process pool, and yield
+    each month's flights as soon as that month is done.
+    Months are yielded in month_folders order, so the output is the same
+    regardless of the number of jobs. With a manifest, unchanged workbooks
+    and sheets are taken from it (only entries written by the current parser
+    code) and the manifest is updated in place.
+    """
+    previous = [
+        manifest.reusable(path) if manifest and path else None
+        for path in map(find_month_file, month_folders)
+    ]
+
+    if jobs <= 1 or len(month_folders) <= 1:
+        results = (extract_month(folder, entry) for folder, entry in zip(month_folders, previous))
+        yield from _collect_months(month_folders, results, manifest)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(month_folders))) as executor:
+            results = executor.map(extract_month, month_folders, previous)
+            yield from _collect_months(month_folders, results, manifest)
+
+def _collect_months(month_folders, results, manifest):
+    for folder, (flights, entry) in zip(month_folders, results):
+        if manifest is not None and entry is not None:
+            manifest.set(find_month_file(folder), entry)
+        yield flights
+
+def extract_months(month_folders, jobs=1, manifest=None):
+    """All flights of several month folders as one list (see iter_months)"""
+    return [flight for flights in iter_months(month_folders, jobs, manifest) for flight in flights]
+
+def write_jsonl(months, output_file):
+    """
+    Write flights as JSON Lines (one flight per line) while months are extracted.
+    The file is flushed to disk after every month, so a crash late in the year
+    keeps all months that were already finished.
+    Returns the number of flights written.
+    """
+    count = 0
+    with open(output_file, 'w', encoding='utf-8') as f:
+        for flights in months:
+            for flight in flights:
+                f.write(json.dumps(flight, ensure_ascii=False))
+                f.write('\n')
+            count += len(flights)
+            f.flush()
+            os.fsync(f.fileno())
+    return count
 
 def main():
     """Main function"""
     # First argument is year (already handled in YEAR variable)
     # Second argument (if present) is month
-    args = sys.argv[2:]  # Skip year argument
+    jobs, args = parse_jobs(sys.argv[2:])  # Skip year argument
+    output_format, args = parse_format(args)
+    full_run = '--full' in args  # ignore the ingest manifest and re-parse everything
     month_arg = None
 
     for arg in args:
@@ -473,15 +589,21 @@ def main():
             month_arg = arg
             break
 
-    print(f'🚀 Extracting {YEAR} Flight Data to JSON (v2 - Multi-Format)...\\n')
+    print(f'🚀 Extracting {YEAR} Flight Data to {output_format.upper()} (v2 - Multi-Format)...\\n')
 
-    all_flights = []
+    output_dir = 'output'
+    os.makedirs(output_dir, exist_ok=True)
+    # Records depend on the parser code, so a change to it invalidates the manifest
+    parser_version = code_version(__file__, flight_row_plan.__file__, passenger_parser.__file__)
+    manifest = IngestManifest(os.path.join(output_dir, f'{YEAR}-flights-manifest.json'), parser_version)
+    if full_run:
+        manifest.files = {}
 
     if month_arg:
         # Extract specific month
         print(f"📅 Extracting single month: {month_arg}\\n")
-        flights = extract_month(month_arg)
-        all_flights.extend(flights)
+        month_folders = [month_arg]
+        jobs = 1
     else:
         # Extract all months
         month_folders = sorted([
@@ -490,29 +612,43 @@ def main():
         ])
 
         print(f"📅 Found {len(month_folders)} months\\n")
+        if jobs > 1:
+            print(f"⚙️  Parallel extraction with {jobs} processes\\n")
+
+    if output_format == 'jsonl':
+        # Stream: one flight per line, flushed per month
+        output_file = os.path.join(output_dir, f'{YEAR}-flights-data.jsonl')
+        total_flights = write_jsonl(iter_months(month_folders, jobs, manifest), output_file)
+        columns_file = None
+    else:
+        all_flights = extract_months(month_folders, jobs, manifest)
+        total_flights = len(all_flights)
 
-        for month_folder in month_folders:
-            flights = extract_month(month_folder)
-            all_flights.extend(flights)
+        # Save to JSON
+        output_file = os.path.join(output_dir, f'{YEAR}-flights-data.json')
 
-    # Save to JSON
-    output_dir = 'output'
-    os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, f'{YEAR}-flights-data.json')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'flights': all_flights,
+                'totalCount': total_flights,
+                'extractedAt': datetime.now().isoformat(),
+            }, f, indent=2, ensure_ascii=False)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'flights': all_flights,
-            'totalCount': len(all_flights),
-            'extractedAt': datetime.now().isoformat(),
-        }, f, indent=2, ensure_ascii=False)
+        # Compact columnar copy for the verification scripts
+        columns_file = write_flight_columns(all_flights, output_file)
+
+    manifest.save()
 
     print('\\n' + '='*80)
     print('✅ EXTRACTION COMPLETED')
     print('='*80)
     print(f'\\n📋 Summary:')
-    print(f'   - Total flights: {len(all_flights)}')
-    print(f'   - Output file: {output_file}\\n')
+    print(f'   - Total flights: {total_flights}')
+    if columns_file:
+        print(f'   - Output file: {output_file}')
+        print(f'   - Columnar file: {columns_file}\\n')
+    else:
+        print(f'   - Output file: {output_file}\\n')
 
 if __name__ == '__main__':
     main()
@@ -47,13 +47,14 @@ def extract_data_from_year(year):
 
             for sheet_name in wb.sheetnames:
                 ws = wb[sheet_name]
-                rows = list(ws.iter_rows(values_only=True))
+                rows = ws.iter_rows(values_only=True)
 
-                if len(rows) < 2:
+                # Skip header; remaining rows are streamed, not loaded into a list
+                if next(rows, None) is None:
                     continue
 
                 # Find airline and aircraft columns (usually at index 1 and 3/4)
-                for row in rows[1:]:  # Skip header
+                for row in rows:
                     if not row or len(row) < 5:
                         continue
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Columnar intermediate format for extracted flights
+
+Pored `output/<year>-flights-data.json` ekstraktor piše i kompaktan kolonski
+fajl, pa verifikacione skripte čitaju samo kolone koje im trebaju umjesto
+json.load cijelog dokumenta:
+- `<year>-flights-data.parquet` ako je pyarrow instaliran (stringovi su
+  dictionary-encoded, čitanje kroz memory map)
+- inače `<year>-flights-data.npz` (NumPy, bez kompresije): cijeli brojevi kao
+  int64 + maska za None, stringovi kao kodovi + tabela jedinstvenih vrijednosti
+
+Upotreba:
+    columns = read_flight_columns('output/2025-flights-data.json',
+                                  ['date', 'arrivalPassengers'])
+    columns['arrivalPassengers'].sum()   # numpy masked array, None je maskiran
+
+Ako kolonski fajl ne postoji ili je stariji od JSON-a, kolone se grade iz
+JSON-a (isti rezultat, samo sporije).
+"""
+import json
+import os
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Kolone flight dict-a (extract-flights.py) po tipu
+DATE_COLUMNS = ('date',)
+INT_COLUMNS = (
+    'availableSeats', 'mtow',
+    'arrivalPassengers', 'arrivalInfants', 'departurePassengers', 'departureInfants',
+    'arrivalBaggage', 'departureBaggage', 'arrivalCargo', 'departureCargo',
+    'arrivalMail', 'departureMail',
+)
+STRING_COLUMNS = (
+    'airline', 'route', 'departureAirport', 'arrivalAirport', 'aircraftModel',
+    'registration', 'operationType', 'arrivalFlightNumber', 'departureFlightNumber',
+    'scheduledArrivalTime', 'actualArrivalTime', 'scheduledDepartureTime', 'actualDepartureTime',
+    'sourceFile', 'sheet',
+)
+ALL_COLUMNS = DATE_COLUMNS + INT_COLUMNS + STRING_COLUMNS
+
+
+def columnar_paths(json_path):
+    """(parquet, npz) putanje pored JSON fajla"""
+    base = json_path[:-len('.json')] if json_path.endswith('.json') else json_path
+    return f'{base}.parquet', f'{base}.npz'
+
+
+def _to_arrays(flights, columns=ALL_COLUMNS):
+    """Lista flight dict-ova -> {kolona: numpy niz}; int kolone su masked array-i"""
+    arrays = {}
+    for name in columns:
+        values = [flight.get(name) for flight in flights]
+        if name in DATE_COLUMNS:
+            arrays[name] = np.array([v[:10] if v else 'NaT' for v in values], dtype='datetime64[D]')
+        elif name in INT_COLUMNS:
+            mask = np.array([v is None for v in values], dtype=bool)
+            data = np.array([0 if v is None else v for v in values], dtype=np.int64)
+            arrays[name] = np.ma.masked_array(data, mask=mask)
+        else:
+            arrays[name] = np.array(values, dtype=object)
+    return arrays
+
+
+def _write_npz(arrays, path):
+    payload = {}
+    for name, values in arrays.items():
+        if name in INT_COLUMNS:
+            payload[name] = values.data
+            payload[f'{name}__mask'] = np.ma.getmaskarray(values)
+        elif name in STRING_COLUMNS:
+            # Dictionary encoding: None je kod -1
+            table = sorted({v for v in values if v is not None})
+            index = {v: i for i, v in enumerate(table)}
+            payload[f'{name}__codes'] = np.array(
+                [-1 if v is None else index[v] for v in values], dtype=np.int32
+            )
+            payload[f'{name}__dict'] = np.array(table, dtype=str)
+        else:
+            payload[name] = values
+    np.savez(path, **payload)
+
+
+def _write_parquet(arrays, path):
+    table = pa.table({
+        name: (
+            pa.array(values.data, mask=np.ma.getmaskarray(values)) if name in INT_COLUMNS
+            else pa.array(values, type=pa.string()).dictionary_encode() if name in STRING_COLUMNS
+            else pa.array(values)
+        )
+        for name, values in arrays.items()
+    })
+    pq.write_table(table, path)
+
+
+def write_flight_columns(flights, json_path):
+    """
+    Zapiši kolonski fajl pored JSON izlaza ekstraktora.
+    Returns: putanja zapisanog fajla
+    """
+    parquet_path, npz_path = columnar_paths(json_path)
+    arrays = _to_arrays(flights)
+
+    if pq is not None:
+        path = parquet_path
+        _write_parquet(arrays, f'{path}.tmp')
+    else:
+        path = npz_path
+        # np.savez dodaje .npz ako ime ne završava na .npz
+        _write_npz(arrays, f'{path}.tmp.npz')
+        os.replace(f'{path}.tmp.npz', f'{path}.tmp')
+    os.replace(f'{path}.tmp', path)
+
+    # Ukloni zastarjeli fajl drugog formata
+    for stale in (parquet_path, npz_path):
+        if stale != path and os.path.exists(stale):
+            os.remove(stale)
+    return path
+
+
+def _read_npz(path, columns):
+    arrays = {}
+    with np.load(path) as data:
+        for name in columns:
+            if name in INT_COLUMNS:
+                arrays[name] = np.ma.masked_array(data[name], mask=data[f'{name}__mask'])
+            elif name in STRING_COLUMNS:
+                codes = data[f'{name}__codes']
+                table = np.append(data[f'{name}__dict'].astype(object), None)
+                arrays[name] = table[codes]  # kod -1 -> None
+            else:
+                arrays[name] = data[name]
+    return arrays
+
+
+def _read_parquet(path, columns):
+    table = pq.read_table(path, columns=list(columns), memory_map=True)
+    arrays = {}
+    for name in columns:
+        column = table.column(name)
+        if name in INT_COLUMNS:
+            mask = column.is_null().to_numpy(zero_copy_only=False)
+            data = column.fill_null(0).to_numpy().astype(np.int64)
+            arrays[name] = np.ma.masked_array(data, mask=mask)
+        elif name in STRING_COLUMNS:
+            arrays[name] = np.array(column.to_pylist(), dtype=object)
+        else:
+            arrays[name] = column.to_numpy().astype('datetime64[D]')
+    return arrays
+
+
+def read_flight_columns(json_path, columns=ALL_COLUMNS):
+    """
+    Učitaj samo tražene kolone ekstrahovanih letova.
+
+    Returns:
+        {kolona: numpy niz} - date kao datetime64[D], cijeli brojevi kao
+        masked array (None maskiran), stringovi kao object niz (None ostaje None)
+    """
+    unknown = set(columns) - set(ALL_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown flight columns: {', '.join(sorted(unknown))}")
+
+    json_mtime = os.path.getmtime(json_path) if os.path.exists(json_path) else None
+    parquet_path, npz_path = columnar_paths(json_path)
+
+    for path, reader in ((parquet_path, _read_parquet if pq is not None else None), (npz_path, _read_npz)):
+        if reader is None or not os.path.exists(path):
+            continue
+        if json_mtime is not None and os.path.getmtime(path) < json_mtime:
+            continue  # stariji od JSON-a - JSON je izvor istine
+        return reader(path, columns)
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        flights = json.load(f)['flights']
+    return _to_arrays(flights, columns)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Compiled column-mapping plans for the multi-format flight extractors
+
+detect_format() vraća dict sa indeksima kolona; umjesto ~25 poziva
+safe_get(row, fmt[...]) po redu, format se jednom kompajlira u RowPlan:
+fiksni operator.itemgetter nad indeksima kolona. Po redu ostaje jedan
+poziv extract() i raspakivanje tuple-a.
+
+Upotreba (u skripti, keširano po potpisu header reda):
+    @lru_cache(maxsize=None)
+    def compile_format(header_row):
+        return RowPlan(detect_format(header_row))
+
+    (airline_name, route_from, route_to, ...) = plan.extract(row)
+"""
+from operator import itemgetter
+
+# Redoslijed vrijednosti koje vraća RowPlan.extract()
+FLIGHT_FIELDS = (
+    'airline_col',
+    'route_from_col',
+    'route_to_col',
+    'aircraft_col',
+    'available_seats_col',
+    'registration_col',
+    'operation_type_col',
+    'mtow_col',
+    'arrival_flight_number_col',
+    'departure_flight_number_col',
+    'scheduled_arrival_time_col',
+    'actual_arrival_time_col',
+    'scheduled_departure_time_col',
+    'actual_departure_time_col',
+    'arrival_pax_col',
+    'departure_pax_col',
+    'arrival_inf_col',
+    'departure_inf_col',
+    'arrival_baggage_col',
+    'departure_baggage_col',
+    'arrival_cargo_col',
+    'departure_cargo_col',
+    'arrival_mail_col',
+    'departure_mail_col',
+)
+
+
+class RowPlan:
+    """
+    Fiksni row-extractor za jedan detektovani format.
+
+    Kolone koje format nema (None) i kolone izvan kraja reda daju None,
+    isto kao safe_get().
+    """
+
+    __slots__ = ('fmt', 'split_route', 'use_parse_passengers', '_width', '_tail', '_getter')
+
+    def __init__(self, fmt):
+        self.fmt = fmt
+        self.use_parse_passengers = fmt['use_parse_passengers']
+
+        # Ruta je jedna kolona ("Ruta") ili dvije ("Dolazak iz", "Odlazak za")
+        route_col = fmt.get('route_col')
+        self.split_route = isinstance(route_col, list)
+        if self.split_route:
+            route_from_col, route_to_col = route_col[0], route_col[1]
+        else:
+            route_from_col, route_to_col = route_col, None
+
+        columns = {**fmt, 'route_from_col': route_from_col, 'route_to_col': route_to_col}
+        indices = [columns.get(field) for field in FLIGHT_FIELDS]
+
+        # Red se skraćuje na `width` kolona i dopunjava sa width + 1 None vrijednosti,
+        # pa indeks `width` (za kolone kojih nema) i indeksi izvan reda uvijek daju None
+        self._width = max((i for i in indices if i is not None), default=-1) + 1
+        self._tail = (None,) * (self._width + 1)
+        self._getter = itemgetter(*[self._width if i is None else i for i in indices])
+
+    def extract(self, row):
+        """Vrijednosti reda u redoslijedu FLIGHT_FIELDS"""
+        return self._getter(row[:self._width] + self._tail)
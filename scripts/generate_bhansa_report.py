@@ -7,15 +7,13 @@ Format: Lista letova sa detaljima o avionima, putnicima i rutama
 """
 
 import sys
-import os
-import re
 import calendar
 from pathlib import Path
 from datetime import datetime
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from report_db import fetch_all
+from report_styles import register_styles
+from excel_sanitizer import sanitize_report_text as sanitize_text
 
 # Putanja do template-a (koristićemo novi template za BHANSA)
 SCRIPT_DIR = Path(__file__).parent
@@ -36,50 +34,15 @@ MONTH_NAMES_UPPER = {
     9: "SEPTEMBAR", 10: "OKTOBAR", 11: "NOVEMBAR", 12: "DECEMBAR"
 }
 
+# Kolone sa centriranim podacima (ostale su poravnate lijevo)
+CENTERED_COLUMNS = frozenset({1, 2, 4, 5, 6, 7, 8, 9, 13, 14})
 
-def get_db_connection():
-    """Konekcija na PostgreSQL bazu"""
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
 
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-
-
-def sanitize_text(value):
-    """
-    Gentle sanitization that preserves unicode (ć, č, š, ž, đ) but removes Excel-problematic characters.
-    openpyxl 3.1.5+ properly handles unicode, so we only need to remove control characters.
-    """
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        return value
-
-    # Step 1: Remove control characters (0x00-0x1F, 0x7F-0x9F)
-    value = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
-
-    # Step 2: Use openpyxl's built-in cleaner for illegal Excel characters
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Step 3: Remove zero-width spaces and BOM
-    value = value.replace('\ufeff', '').replace('\u200b', '').replace('\u200c', '').replace('\u200d', '')
-
-    # Step 4: Replace non-breaking space with regular space
-    value = value.replace('\xa0', ' ')
-
-    # Step 5: Strip whitespace
-    return value.strip()
-
-
-def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None):
+def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None, style=None):
     """
     Helper function to properly create merged cells with consistent formatting.
     Applies formatting to ALL cells in the range before merging to avoid Excel corruption.
+    `style` is a named style from report_styles (one assignment per cell).
     """
     # Convert column letters to numbers if needed
     if isinstance(start_col, str):
@@ -91,6 +54,8 @@ def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None,
         cell = ws.cell(row=row, column=col)
         if col == start_col and value is not None:
             cell.value = sanitize_text(value) if isinstance(value, str) else value
+        if style:
+            cell.style = style
         if font:
             cell.font = font
         if fill:
@@ -127,9 +92,6 @@ def get_flight_data(year: int, month: int):
     """
     Povuči sve letove za zadati mjesec sortiran po datumu
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     # Datum početka i kraja mjeseca
     first_day = f"{year}-{month:02d}-01"
     last_day = calendar.monthrange(year, month)[1]
@@ -185,15 +147,19 @@ def get_flight_data(year: int, month: int):
         ORDER BY f.date, f."departureScheduledTime", f."arrivalScheduledTime"
     """
 
-    cursor.execute(query, (first_day, last_date))
-    flights = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    flights = fetch_all(query, (first_day, last_date))
 
     return flights
 
 
+def apply_row_style(ws, row_idx):
+    """Primijeni BHANSA stil podataka na jedan red (kolone A-N)"""
+    for col in range(1, 15):
+        ws.cell(row=row_idx, column=col).style = (
+            "bhansa_cell_center" if col in CENTERED_COLUMNS else "bhansa_cell_left"
+        )
+
+
 def parse_route(route_str):
     """
     Parse route string to extract airport IATA code.
@@ -247,26 +213,14 @@ def generate_bhansa_report(year: int, month: int, output_path: Path = None):
     ws = wb.active
     ws.title = "Sheet1"
 
-    # 3. Stilovi
-    header_font = Font(name='Arial', size=11, bold=True)
-    header_fill = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
-    title_font = Font(name='Arial', size=14, bold=True)
-    regular_font = Font(name='Arial', size=10)
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    center_align = Alignment(horizontal='center', vertical='center')
-    left_align = Alignment(horizontal='left', vertical='center')
+    # 3. Stilovi (named styles, registrovani jednom po workbook-u)
+    register_styles(wb, ["bhansa_title", "bhansa_header", "bhansa_cell_center", "bhansa_cell_left"])
 
     # 4. Header - Row 1
     create_merged_cell(
         ws, 1, 'A', 'N',
         f"AERODROM TUZLA                    RIJD {MONTH_NAMES_UPPER[month]} {year}",
-        font=title_font,
-        alignment=center_align
+        style="bhansa_title"
     )
 
     # 5. Column Headers - Row 2
@@ -276,10 +230,7 @@ def generate_bhansa_report(year: int, month: int, output_path: Path = None):
     for col_idx, header in enumerate(headers, start=1):
         cell = ws.cell(row=2, column=col_idx)
         cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
-        cell.alignment = center_align
+        cell.style = "bhansa_header"
 
     # 6. Popunjavanje podataka
     print("Popunjavam podatke...")
@@ -344,14 +295,7 @@ def generate_bhansa_report(year: int, month: int, output_path: Path = None):
             ws.cell(row=row_idx, column=14).value = sanitize_text(flight['date'].strftime('%A'))  # Day of week
 
             # Apply styles
-            for col in range(1, 15):
-                cell = ws.cell(row=row_idx, column=col)
-                cell.font = regular_font
-                cell.border = border
-                if col in [1, 2, 4, 5, 6, 7, 8, 9, 13, 14]:
-                    cell.alignment = center_align
-                else:
-                    cell.alignment = left_align
+            apply_row_style(ws, row_idx)
 
             row_idx += 1
             flight_counter += 1
@@ -380,14 +324,7 @@ def generate_bhansa_report(year: int, month: int, output_path: Path = None):
                 ws.cell(row=row_idx, column=14).value = sanitize_text(flight['date'].strftime('%A'))
 
                 # Apply styles
-                for col in range(1, 15):
-                    cell = ws.cell(row=row_idx, column=col)
-                    cell.font = regular_font
-                    cell.border = border
-                    if col in [1, 2, 4, 5, 6, 7, 8, 9, 13, 14]:
-                        cell.alignment = center_align
-                    else:
-                        cell.alignment = left_align
+                apply_row_style(ws, row_idx)
 
                 row_idx += 1
                 flight_counter += 1
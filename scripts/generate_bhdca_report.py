@@ -10,15 +10,17 @@ Izvještaj sadrži 3 sheet-a:
 """
 
 import sys
-import os
-import re
 from datetime import datetime
 from pathlib import Path
 import openpyxl
 from openpyxl.styles import Alignment, Font, Border, Side
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import calendar
+from report_db import fetch_all
+from report_templates import load_template
+from excel_sanitizer import sanitize_report_text as sanitize_text
+
+# --debug: ispis međurezultata (prvi let, city-pairs, agregati, unmerge ćelija)
+DEBUG = False
 
 # Putanje
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -46,45 +48,6 @@ MONTH_NAMES = {
 }
 
 
-def get_db_connection():
-    """Konekcija na PostgreSQL bazu"""
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
-
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-
-
-def sanitize_text(value):
-    """
-    Gentle sanitization that preserves unicode (ć, č, š, ž, đ) but removes Excel-problematic characters.
-    openpyxl 3.1.5+ properly handles unicode, so we only need to remove control characters.
-    """
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        return value
-
-    # Step 1: Remove control characters (0x00-0x1F, 0x7F-0x9F)
-    value = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
-
-    # Step 2: Use openpyxl's built-in cleaner for illegal Excel characters
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Step 3: Remove zero-width spaces and BOM
-    value = value.replace('\ufeff', '').replace('\u200b', '').replace('\u200c', '').replace('\u200d', '')
-
-    # Step 4: Replace non-breaking space with regular space
-    value = value.replace('\xa0', ' ')
-
-    # Step 5: Strip whitespace
-    return value.strip()
-
-
 def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None):
     """
     Helper function to properly create merged cells with consistent formatting.
@@ -154,13 +117,8 @@ def clear_merged_cell_range(ws, start_row, end_row, columns):
 
 def get_flight_data(year: int, month: int):
     """Povuči podatke o letovima za zadati mjesec"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     # Datum početka i kraja mjeseca
-    first_day = f"{year}-{month:02d}-01"
-    last_day = calendar.monthrange(year, month)[1]
-    last_date = f"{year}-{month:02d}-{last_day:02d}"
+    first_day, last_date = month_date_range(year, month)
 
     query = """
         SELECT
@@ -242,11 +200,7 @@ def get_flight_data(year: int, month: int):
         ORDER BY f.date, f."arrivalScheduledTime", f."departureScheduledTime"
     """
 
-    cursor.execute(query, (first_day, last_date))
-    flights = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    flights = fetch_all(query, (first_day, last_date))
 
     return flights
 
@@ -294,7 +248,7 @@ def aggregate_airport_traffic(flights):
     }
 
     # Debug: Ispis prvog flight-a da vidimo strukturu
-    if len(flights) > 0:
+    if DEBUG and len(flights) > 0:
         print(f"\n[DEBUG] Prvi flight podaci:")
         print(f"  arrivalFlightNumber: {flights[0].get('arrivalFlightNumber')}")
         print(f"  departureFlightNumber: {flights[0].get('departureFlightNumber')}")
@@ -450,7 +404,8 @@ def write_city_pairs_sheet(ws, city_pairs, start_row=23):
 
     # AGGRESSIVE: Unmerge ALL merged cells in the entire data range first
     # This prevents MergedCell read-only errors
-    print(f"[DEBUG] Unmerging cells in range rows {start_row}-{end_row}...")
+    if DEBUG:
+        print(f"[DEBUG] Unmerging cells in range rows {start_row}-{end_row}...")
     merged_ranges_to_remove = []
     for merged_range in list(ws.merged_cells.ranges):
         # If any part of this merged range is in our data rows, unmerge it
@@ -461,7 +416,8 @@ def write_city_pairs_sheet(ws, city_pairs, start_row=23):
     for range_str in merged_ranges_to_remove:
         try:
             ws.unmerge_cells(range_str)
-            print(f"[DEBUG] Unmerged: {range_str}")
+            if DEBUG:
+                print(f"[DEBUG] Unmerged: {range_str}")
         except Exception as e:
             print(f"[WARNING] Could not unmerge {range_str}: {e}")
 
@@ -499,7 +455,7 @@ def aggregate_city_pair_data(flights, scheduled_only=True):
     city_pairs = {}
 
     # Debug: Prvi flight podaci
-    if len(flights) > 0:
+    if DEBUG and len(flights) > 0:
         print(f"\n[DEBUG City-Pair] Prvi flight:")
         print(f"  route: {flights[0].get('route')}")
         print(f"  departure_airport_iata (from DB): {flights[0].get('departure_airport_iata')}")
@@ -582,49 +538,242 @@ def aggregate_city_pair_data(flights, scheduled_only=True):
     city_pairs = dict(sorted(city_pairs.items(), key=lambda x: x[1]['passengers'], reverse=True))
 
     # Debug output
-    print(f"\n[DEBUG] Pronađeno {len(city_pairs)} city-pairs:")
-    for pair_key, data in list(city_pairs.items())[:5]:  # Prikaži prvih 5
-        print(f"  {pair_key}: {data['passengers']} putnika")
+    if DEBUG:
+        print(f"\n[DEBUG] Pronađeno {len(city_pairs)} city-pairs:")
+        for pair_key, data in list(city_pairs.items())[:5]:  # Prikaži prvih 5
+            print(f"  {pair_key}: {data['passengers']} putnika")
 
     return city_pairs
 
 
-def generate_bhdca_report(year: int, month: int, output_path: Path = None):
+# Scheduled/non-scheduled i domestic/international - isto kao is_scheduled_flight() i
+# provjera zemalja u aggregate_airport_traffic()
+IS_SCHEDULED_SQL = """
+    CASE WHEN COALESCE(ft.code, '') <> '' THEN UPPER(ft.code) = 'SCHEDULED'
+         ELSE UPPER(COALESCE(ot.code, '')) = 'SCHEDULED' END
+"""
+
+CATEGORY_SQL = f"""
+    CASE WHEN COALESCE(arr_ap.country = 'Bosnia and Herzegovina'
+                       AND dep_ap.country = 'Bosnia and Herzegovina', false) THEN 'domestic'
+         WHEN {IS_SCHEDULED_SQL} THEN 'international_scheduled'
+         ELSE 'international_non_scheduled' END
+"""
+
+FLIGHT_JOINS_SQL = """
+    FROM "Flight" f
+    INNER JOIN "Airline" a ON f."airlineId" = a.id
+    INNER JOIN "AircraftType" at ON f."aircraftTypeId" = at.id
+    INNER JOIN "OperationType" ot ON f."operationTypeId" = ot.id
+    LEFT JOIN "FlightType" ft ON f."flightTypeId" = ft.id
+    LEFT JOIN "Airport" arr_ap ON f."arrivalAirportId" = arr_ap.id
+    LEFT JOIN "Airport" dep_ap ON f."departureAirportId" = dep_ap.id
+    WHERE f.date >= %s AND f.date <= %s
+"""
+
+
+def month_date_range(year: int, month: int):
+    """Prvi i zadnji dan mjeseca kao 'YYYY-MM-DD'"""
+    last_day = calendar.monthrange(year, month)[1]
+    return f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last_day:02d}"
+
+
+def query_airport_traffic(year: int, month: int):
     """
-    Glavni metod za generisanje BHDCA izvještaja
+    Sheet 1 - AIRPORT TRAFFIC agregiran u bazi (GROUP BY kategorija, FILTER po movementu).
+
+    Vraća (data, broj letova); data ima istu strukturu kao aggregate_airport_traffic().
     """
-    print(f"Generišem BHDCA izvještaj za {MONTH_NAMES[month]} {year}...")
+    query = f"""
+        SELECT
+            {CATEGORY_SQL} AS category,
+            COUNT(*) AS flights,
+            COUNT(*) FILTER (
+                WHERE NOT f."arrivalFerryIn"
+                  AND (f."arrivalPassengers" > 0 OR f."arrivalStatus" = 'OPERATED')
+            ) + COUNT(*) FILTER (
+                WHERE NOT f."departureFerryOut"
+                  AND (f."departurePassengers" > 0 OR f."departureStatus" = 'OPERATED')
+            ) AS movements,
+            COALESCE(SUM(f."departurePassengers"), 0) AS embarked,
+            COALESCE(SUM(f."arrivalPassengers"), 0) AS disembarked,
+            COALESCE(SUM(f."departureCargo"), 0) AS freight_loaded_kg,
+            COALESCE(SUM(f."arrivalCargo"), 0) AS freight_unloaded_kg,
+            COALESCE(SUM(f."departureMail"), 0) AS mail_loaded_kg,
+            COALESCE(SUM(f."arrivalMail"), 0) AS mail_unloaded_kg
+        {FLIGHT_JOINS_SQL}
+        GROUP BY 1
+    """
+
+    data = {
+        category: {
+            'movements': 0,
+            'embarked': 0,
+            'disembarked': 0,
+            'freight_loaded': 0,
+            'freight_unloaded': 0,
+            'mail_loaded': 0,
+            'mail_unloaded': 0,
+        }
+        for category in ('international_scheduled', 'international_non_scheduled', 'domestic')
+    }
+
+    flight_count = 0
+    for row in fetch_all(query, month_date_range(year, month)):
+        flight_count += row['flights']
+        category = data[row['category']]
+        category['movements'] = row['movements']
+        category['embarked'] = row['embarked']
+        category['disembarked'] = row['disembarked']
+
+        # Freight i mail (kg -> tonne, 2 decimale)
+        category['freight_loaded'] = round(row['freight_loaded_kg'] / 1000.0, 2)
+        category['freight_unloaded'] = round(row['freight_unloaded_kg'] / 1000.0, 2)
+        category['mail_loaded'] = round(row['mail_loaded_kg'] / 1000.0, 2)
+        category['mail_unloaded'] = round(row['mail_unloaded_kg'] / 1000.0, 2)
 
-    # 1. Povući podatke iz baze
-    print("Povlačim podatke iz baze...")
-    flights = get_flight_data(year, month)
-    print(f"Pronađeno {len(flights)} letova.")
+    return data, flight_count
 
-    if len(flights) == 0:
-        print("UPOZORENJE: Nema letova za zadati period!")
-        return None
 
-    # 2. Agregirati podatke
-    print("Agregatiranje podataka...")
-    airport_traffic = aggregate_airport_traffic(flights)
-    city_pairs_scheduled = aggregate_city_pair_data(flights, scheduled_only=True)
-    city_pairs_non_scheduled = aggregate_city_pair_data(flights, scheduled_only=False)
+def query_city_pair_data(year: int, month: int):
+    """
+    Sheet 2/3 - city-pair podaci agregirani u bazi po (scheduled, ruta).
+
+    Baza vraća po jedan red za svaku rutu (departure i arrival leg odvojeno, sa
+    FILTER); ruta se u city-pair mapira sa parse_route() kao u
+    aggregate_city_pair_data(). Redoslijed prvog pojavljivanja para (seq) prati
+    ORDER BY iz get_flight_data(), pa je sortiranje isto kao u Python putanji.
+
+    Vraća (scheduled, non_scheduled) city_pairs dict-ove.
+    """
+    query = f"""
+        WITH legs AS (
+            SELECT
+                f.route,
+                {IS_SCHEDULED_SQL} AS is_scheduled,
+                ROW_NUMBER() OVER (
+                    ORDER BY f.date, f."arrivalScheduledTime", f."departureScheduledTime"
+                ) AS seq,
+                f."departurePassengers" > 0 AND NOT f."departureFerryOut" AS departure_leg,
+                f."arrivalPassengers" > 0 AND NOT f."arrivalFerryIn" AS arrival_leg,
+                f."departurePassengers", f."departureCargo", f."departureMail",
+                f."arrivalPassengers", f."arrivalCargo", f."arrivalMail"
+            {FLIGHT_JOINS_SQL}
+        )
+        SELECT
+            is_scheduled,
+            route,
+            MIN(seq) FILTER (WHERE departure_leg) AS departure_first,
+            COALESCE(SUM("departurePassengers") FILTER (WHERE departure_leg), 0) AS departure_passengers,
+            COALESCE(SUM("departureCargo") FILTER (WHERE departure_leg), 0) AS departure_cargo,
+            COALESCE(SUM("departureMail") FILTER (WHERE departure_leg), 0) AS departure_mail,
+            MIN(seq) FILTER (WHERE arrival_leg) AS arrival_first,
+            COALESCE(SUM("arrivalPassengers") FILTER (WHERE arrival_leg), 0) AS arrival_passengers,
+            COALESCE(SUM("arrivalCargo") FILTER (WHERE arrival_leg), 0) AS arrival_cargo,
+            COALESCE(SUM("arrivalMail") FILTER (WHERE arrival_leg), 0) AS arrival_mail
+        FROM legs
+        WHERE route <> ''
+        GROUP BY is_scheduled, route
+    """
+
+    TZL_IATA = 'TZL'
+
+    # (prvo pojavljivanje, scheduled, pair_key, putnici, cargo kg, mail kg)
+    legs = []
+    for row in fetch_all(query, month_date_range(year, month)):
+        dep_iata, arr_iata = parse_route(row['route'])
+        if not dep_iata or not arr_iata:
+            continue
+
+        # Departure leg: TZL -> Other
+        if row['departure_first'] is not None:
+            other_airport = arr_iata if dep_iata == TZL_IATA else dep_iata
+            if other_airport and other_airport != TZL_IATA:
+                legs.append((
+                    row['departure_first'] * 2, row['is_scheduled'], f"{TZL_IATA}-{other_airport}",
+                    row['departure_passengers'], row['departure_cargo'], row['departure_mail'],
+                ))
+
+        # Arrival leg: Other -> TZL (unutar istog leta dolazi poslije departure leg-a)
+        if row['arrival_first'] is not None:
+            other_airport = dep_iata if arr_iata == TZL_IATA else arr_iata
+            if other_airport and other_airport != TZL_IATA:
+                legs.append((
+                    row['arrival_first'] * 2 + 1, row['is_scheduled'], f"{other_airport}-{TZL_IATA}",
+                    row['arrival_passengers'], row['arrival_cargo'], row['arrival_mail'],
+                ))
+
+    scheduled = {}
+    non_scheduled = {}
+    for _, is_scheduled, pair_key, passengers, cargo, mail in sorted(legs, key=lambda leg: leg[0]):
+        city_pairs = scheduled if is_scheduled else non_scheduled
+        pair = city_pairs.setdefault(pair_key, {'passengers': 0, 'freight': 0, 'mail': 0})
+        pair['passengers'] += passengers
+        pair['freight'] += cargo
+        pair['mail'] += mail
+
+    def finish(city_pairs):
+        # kg -> tonne (2 decimale), sortirati po broju putnika (descending)
+        for pair in city_pairs.values():
+            pair['freight'] = round(pair['freight'] / 1000.0, 2)
+            pair['mail'] = round(pair['mail'] / 1000.0, 2)
+        return dict(sorted(city_pairs.items(), key=lambda x: x[1]['passengers'], reverse=True))
+
+    return finish(scheduled), finish(non_scheduled)
+
+
+def generate_bhdca_report(year: int, month: int, output_path: Path = None, aggregate_in_sql: bool = True):
+    """
+    Glavni metod za generisanje BHDCA izvještaja
+
+    aggregate_in_sql=True: sume i city-pair totali se računaju u bazi (GROUP BY/FILTER),
+    pa se prenosi samo nekoliko desetina redova; False povlači sve letove i agregira u Pythonu.
+    """
+    print(f"Generišem BHDCA izvještaj za {MONTH_NAMES[month]} {year}...")
+
+    if aggregate_in_sql:
+        # 1+2. Agregacija u bazi
+        print("Agregiram podatke u bazi...")
+        airport_traffic, flight_count = query_airport_traffic(year, month)
+        print(f"Pronađeno {flight_count} letova.")
+
+        if flight_count == 0:
+            print("UPOZORENJE: Nema letova za zadati period!")
+            return None
+
+        city_pairs_scheduled, city_pairs_non_scheduled = query_city_pair_data(year, month)
+    else:
+        # 1. Povući podatke iz baze
+        print("Povlačim podatke iz baze...")
+        flights = get_flight_data(year, month)
+        print(f"Pronađeno {len(flights)} letova.")
+
+        if len(flights) == 0:
+            print("UPOZORENJE: Nema letova za zadati period!")
+            return None
+
+        # 2. Agregirati podatke
+        print("Agregatiranje podataka...")
+        airport_traffic = aggregate_airport_traffic(flights)
+        city_pairs_scheduled = aggregate_city_pair_data(flights, scheduled_only=True)
+        city_pairs_non_scheduled = aggregate_city_pair_data(flights, scheduled_only=False)
 
     # Debug output
-    print("\n=== AGREGIRANI PODACI ===")
-    print(f"International Scheduled: {airport_traffic['international_scheduled']}")
-    print(f"International Non-Scheduled: {airport_traffic['international_non_scheduled']}")
-    print(f"Domestic: {airport_traffic['domestic']}")
-    print(f"\nCity-pairs Scheduled: {len(city_pairs_scheduled)} parova")
-    print(f"City-pairs Non-Scheduled: {len(city_pairs_non_scheduled)} parova")
-    print("========================\n")
+    if DEBUG:
+        print("\n=== AGREGIRANI PODACI ===")
+        print(f"International Scheduled: {airport_traffic['international_scheduled']}")
+        print(f"International Non-Scheduled: {airport_traffic['international_non_scheduled']}")
+        print(f"Domestic: {airport_traffic['domestic']}")
+        print(f"\nCity-pairs Scheduled: {len(city_pairs_scheduled)} parova")
+        print(f"City-pairs Non-Scheduled: {len(city_pairs_non_scheduled)} parova")
+        print("========================\n")
 
     # 3. Učitati template
     print(f"Učitavanje template-a: {TEMPLATE_PATH}")
     if not TEMPLATE_PATH.exists():
         raise FileNotFoundError(f"Template ne postoji: {TEMPLATE_PATH}")
 
-    wb = openpyxl.load_workbook(TEMPLATE_PATH)
+    wb = load_template(TEMPLATE_PATH)
 
     # 4. Popuniti Sheet 1 - AIRPORT TRAFFIC
     print("Popunjavam Sheet 1 - AIRPORT TRAFFIC...")
@@ -737,20 +886,27 @@ def generate_bhdca_report(year: int, month: int, output_path: Path = None):
 
 def main():
     """CLI interfejs za skriptu"""
-    if len(sys.argv) < 3:
-        print("Usage: python generate_bhdca_report.py <year> <month>")
+    global DEBUG
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args) < 2:
+        print("Usage: python generate_bhdca_report.py <year> <month> [--python-aggregation] [--debug]")
         print("Example: python generate_bhdca_report.py 2025 9")
         sys.exit(1)
 
+    # --python-aggregation: povuci sve letove i agregiraj u Pythonu (za poređenje)
+    aggregate_in_sql = '--python-aggregation' not in sys.argv
+    DEBUG = '--debug' in sys.argv
+
     try:
-        year = int(sys.argv[1])
-        month = int(sys.argv[2])
+        year = int(args[0])
+        month = int(args[1])
 
         if month < 1 or month > 12:
             print("Mjesec mora biti između 1 i 12!")
             sys.exit(1)
 
-        output_path = generate_bhdca_report(year, month)
+        output_path = generate_bhdca_report(year, month, aggregate_in_sql=aggregate_in_sql)
 
         if output_path:
             print(f"\n✅ Izvještaj generisan: {output_path}")
@@ -8,16 +8,15 @@ Generiše napredni custom izvještaj sa više sheet-ova:
 """
 
 import sys
-import os
 import json
 import calendar
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import defaultdict
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from report_db import fetch_all
+from report_styles import register_styles
 
 # Putanja
 SCRIPT_DIR = Path(__file__).parent
@@ -38,23 +37,18 @@ MONTH_NAMES_SHORT = {
 }
 
 
-def get_db_connection():
-    """Konekcija na PostgreSQL bazu"""
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-
-
-def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None):
+def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None, style=None):
     """
     Helper function to properly create merged cells with consistent formatting.
     Applies formatting to ALL cells in the range before merging to avoid Excel corruption.
+    `style` is a named style from report_styles (one assignment per cell).
     """
     for col in range(start_col, end_col + 1):
         cell = ws.cell(row=row, column=col)
         if col == start_col and value is not None:
             cell.value = value
+        if style:
+            cell.style = style
         if font:
             cell.font = font
         if fill:
@@ -88,9 +82,6 @@ def format_datetime(dt):
 
 def get_flight_data(date_from, date_to, operation_types=None, airlines=None, routes=None):
     """Povuči letove iz baze sa filterima"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     query = """
         SELECT
             f.id,
@@ -143,12 +134,8 @@ def get_flight_data(date_from, date_to, operation_types=None, airlines=None, rou
     
     query += " ORDER BY f.date, f.\"departureScheduledTime\", f.\"arrivalScheduledTime\""
     
-    cursor.execute(query, params)
-    flights = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
+    flights = fetch_all(query, params)
+        
     return flights
 
 
@@ -337,10 +324,9 @@ def create_summary_sheet(wb, all_flights, monthly_data, date_from, date_to, pass
         ]
         
         for col_idx, value in enumerate(row_data, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.border = thin_border
-            if col_idx > 1:
-                cell.alignment = Alignment(horizontal="center")
+            ws.cell(row=row_idx, column=col_idx, value=value).style = (
+                "report_data_center" if col_idx > 1 else "report_data"
+            )
         
         # Accumulate totals
         total_row_data[0] += stats['flights']
@@ -415,27 +401,20 @@ def create_airline_breakdown(ws, start_row, flights, passenger_type, thin_border
     
     if airline_data:
         # Header
-        breakdown_fill = PatternFill(start_color="64748B", end_color="64748B", fill_type="solid")
         header_text = "PREGLED PO AVIOKOMPANIJAMA (cijeli period)" if is_summary else "PREGLED PO AVIOKOMPANIJAMA"
         header_end_col = 8 if is_summary else 7
         
         create_merged_cell(
             ws, row_idx, 1, header_end_col,
             header_text,
-            font=Font(bold=True, size=11, color="FFFFFF"),
-            fill=breakdown_fill,
-            alignment=Alignment(horizontal="center"),
-            border=thin_border
+            style="report_section_header"
         )
         row_idx += 1
         
         # Column headers
         headers = ["Aviokompanija", "Letova", "Operacija", "Odlazeći", "Dolazeći", "Ukupno", "Prosječno"]
         for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=header)
-            cell.font = Font(bold=True)
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal="center")
+            ws.cell(row=row_idx, column=col_idx, value=header).style = "report_column_header"
         row_idx += 1
         
         # Data rows - sorted by passenger count (highest first)
@@ -448,10 +427,9 @@ def create_airline_breakdown(ws, start_row, flights, passenger_type, thin_border
                        data['departure'], data['arrival'], data['passengers'], avg]
             
             for col_idx, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                cell.border = thin_border
-                if col_idx > 1:
-                    cell.alignment = Alignment(horizontal="center")
+                ws.cell(row=row_idx, column=col_idx, value=value).style = (
+                    "report_data_center" if col_idx > 1 else "report_data"
+                )
             row_idx += 1
     
     return row_idx
@@ -488,27 +466,20 @@ def create_route_breakdown(ws, start_row, flights, passenger_type, thin_border,
     
     if route_data:
         # Header
-        breakdown_fill = PatternFill(start_color="64748B", end_color="64748B", fill_type="solid")
         header_text = "PREGLED PO RUTAMA (cijeli period)" if is_summary else "PREGLED PO RUTAMA"
         header_end_col = 8 if is_summary else 7
         
         create_merged_cell(
             ws, row_idx, 1, header_end_col,
             header_text,
-            font=Font(bold=True, size=11, color="FFFFFF"),
-            fill=breakdown_fill,
-            alignment=Alignment(horizontal="center"),
-            border=thin_border
+            style="report_section_header"
         )
         row_idx += 1
         
         # Column headers
         headers = ["Ruta", "Letova", "Operacija", "Odlazeći", "Dolazeći", "Ukupno", "Prosječno"]
         for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=header)
-            cell.font = Font(bold=True)
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal="center")
+            ws.cell(row=row_idx, column=col_idx, value=header).style = "report_column_header"
         row_idx += 1
         
         # Data rows - sorted by flight count
@@ -520,10 +491,9 @@ def create_route_breakdown(ws, start_row, flights, passenger_type, thin_border,
                        data['departure'], data['arrival'], data['passengers'], avg]
             
             for col_idx, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                cell.border = thin_border
-                if col_idx > 1:
-                    cell.alignment = Alignment(horizontal="center")
+                ws.cell(row=row_idx, column=col_idx, value=value).style = (
+                    "report_data_center" if col_idx > 1 else "report_data"
+                )
             row_idx += 1
     
     return row_idx
@@ -556,7 +526,6 @@ def create_monthly_sheet(wb, month_flights, year, month, passenger_type):
     
     # Monthly summary
     stats = calculate_monthly_stats(month_flights, passenger_type)
-    stats_fill = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
     
     create_merged_cell(
         ws, row_idx, 1, 4,
@@ -576,16 +545,8 @@ def create_monthly_sheet(wb, month_flights, year, month, passenger_type):
     ]
     
     for label, value in summary_data:
-        label_cell = ws.cell(row=row_idx, column=1, value=label)
-        label_cell.font = Font(bold=True)
-        label_cell.fill = stats_fill
-        label_cell.border = thin_border
-        
-        value_cell = ws.cell(row=row_idx, column=2, value=value)
-        value_cell.font = Font(bold=True)
-        value_cell.fill = stats_fill
-        value_cell.alignment = Alignment(horizontal="center")
-        value_cell.border = thin_border
+        ws.cell(row=row_idx, column=1, value=label).style = "report_stat_label"
+        ws.cell(row=row_idx, column=2, value=value).style = "report_stat_value"
         row_idx += 1
     
     row_idx += 1
@@ -635,11 +596,7 @@ def create_monthly_sheet(wb, month_flights, year, month, passenger_type):
         ]
     
     for col_idx, header in enumerate(headers, start=1):
-        cell = ws.cell(row=row_idx, column=col_idx, value=header)
-        cell.font = Font(bold=True, color="FFFFFF", size=10)
-        cell.fill = PatternFill(start_color="0F172A", end_color="0F172A", fill_type="solid")
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        cell.border = thin_border
+        ws.cell(row=row_idx, column=col_idx, value=header).style = "report_daily_header"
     row_idx += 1
     
     # Daily flight data
@@ -699,10 +656,9 @@ def create_monthly_sheet(wb, month_flights, year, month, passenger_type):
         row_data = base_data + passenger_data
         
         for col_idx, value in enumerate(row_data, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.border = thin_border
-            if col_idx > 6:
-                cell.alignment = Alignment(horizontal="center")
+            ws.cell(row=row_idx, column=col_idx, value=value).style = (
+                "report_data_center" if col_idx > 6 else "report_data"
+            )
         
         row_idx += 1
     
@@ -730,6 +686,7 @@ def create_advanced_report(date_from, date_to, passenger_type, operation_types=N
     # Create workbook
     sys.stderr.write("Kreiram Excel workbook...\n")
     wb = openpyxl.Workbook()
+    register_styles(wb)
     
     # Create summary sheet
     sys.stderr.write("Kreiram summary sheet...\n")
@@ -11,66 +11,29 @@ Generiše prilagođeni izvještaj sa naprednim filterima:
 """
 
 import sys
-import os
-import re
 import json
+from copy import copy
 from pathlib import Path
 from datetime import datetime
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from report_db import fetch_all, iter_rows
+from report_styles import register_styles
+from excel_sanitizer import sanitize_report_text as sanitize_text
 
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 OUTPUT_DIR = PROJECT_ROOT / "izvještaji" / "generated"
 
+# Periodi duži od ovoga se automatski generišu u streaming (write-only) modu
+STREAMING_THRESHOLD_DAYS = 366
 
-def get_db_connection():
-    """Konekcija na PostgreSQL bazu"""
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
 
-
-def sanitize_text(value):
-    """
-    Gentle sanitization that preserves unicode (ć, č, š, ž, đ) but removes Excel-problematic characters.
-    openpyxl 3.1.5+ properly handles unicode, so we only need to remove control characters.
-    """
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        return value
-
-    # Step 1: Remove control characters (0x00-0x1F, 0x7F-0x9F)
-    value = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
-
-    # Step 2: Use openpyxl's built-in cleaner for illegal Excel characters
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Step 3: Remove zero-width spaces and BOM
-    value = value.replace('\ufeff', '').replace('\u200b', '').replace('\u200c', '').replace('\u200d', '')
-
-    # Step 4: Replace non-breaking space with regular space
-    value = value.replace('\xa0', ' ')
-
-    # Step 5: Strip whitespace
-    return value.strip()
-
-
-def get_flight_data(date_from, date_to, operation_types, airlines, routes):
+def build_flight_query(date_from, date_to, operation_types, airlines, routes):
     """
-    Povuči letove sa filterima
+    Sastavi upit i parametre za letove sa filterima
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     # Build WHERE conditions
     where_conditions = ["f.date >= %s", "f.date <= %s"]
     params = [date_from, date_to]
@@ -138,14 +101,26 @@ def get_flight_data(date_from, date_to, operation_types, airlines, routes):
         ORDER BY f.date ASC, f."departureScheduledTime" ASC
     """
 
-    cursor.execute(query, params)
-    flights = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    return query, params
 
+
+def get_flight_data(date_from, date_to, operation_types, airlines, routes):
+    """
+    Povuči letove sa filterima
+    """
+    query, params = build_flight_query(date_from, date_to, operation_types, airlines, routes)
+    flights = fetch_all(query, params)
     return flights
 
 
+def iter_flight_data(date_from, date_to, operation_types, airlines, routes):
+    """
+    Letovi sa filterima, jedan po jedan kroz server-side cursor (za velike periode)
+    """
+    query, params = build_flight_query(date_from, date_to, operation_types, airlines, routes)
+    return iter_rows(query, params)
+
+
 def format_datetime(dt):
     """Format datetime za prikaz"""
     if not dt:
@@ -164,15 +139,18 @@ def format_date(dt):
     return dt.strftime("%d.%m.%Y")
 
 
-def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None):
+def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None, style=None):
     """
     Helper function to properly create merged cells with consistent formatting.
     Applies formatting to ALL cells in the range before merging to avoid Excel corruption.
+    `style` is a named style from report_styles (one assignment per cell).
     """
     for col in range(start_col, end_col + 1):
         cell = ws.cell(row=row, column=col)
         if col == start_col and value is not None:
             cell.value = sanitize_text(value) if isinstance(value, str) else value
+        if style:
+            cell.style = style
         if font:
             cell.font = font
         if fill:
@@ -186,19 +164,115 @@ def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None,
         ws.merge_cells(start_row=row, start_column=start_col, end_row=row, end_column=end_col)
 
 
+def get_report_headers(passenger_type):
+    """Kolone izvještaja prema tipu putnika"""
+    base_headers = ["Datum", "Aviokompanija", "Tip aviona", "Registracija", "Ruta", "Tip operacije"]
+
+    if passenger_type == "departure":
+        return base_headers + [
+            "Broj leta (odlazak)", "Planirano vrijeme", "Stvarno vrijeme",
+            "Putnici", "Muškarci", "Žene", "Djeca", "Bebe"
+        ]
+    if passenger_type == "arrival":
+        return base_headers + [
+            "Broj leta (dolazak)", "Planirano vrijeme", "Stvarno vrijeme",
+            "Putnici", "Muškarci", "Žene", "Djeca", "Bebe"
+        ]
+    if passenger_type == "infants":
+        return base_headers + [
+            "Broj leta (dolazak)", "Broj leta (odlazak)",
+            "Bebe (dolazak)", "Bebe (odlazak)", "Ukupno beba"
+        ]
+    # all
+    return base_headers + [
+        "Broj leta (dolazak)", "Putnici (dolazak)",
+        "Broj leta (odlazak)", "Putnici (odlazak)",
+        "Ukupno putnika"
+    ]
+
+
+def build_flight_row(flight, passenger_type):
+    """
+    Red podataka za jedan let i njegov doprinos ukupnim brojevima.
+
+    Returns:
+        (row_data, passengers, departure_passengers, arrival_passengers, infants, operations)
+    """
+    base_data = [
+        format_date(flight['date']),
+        flight['airline_name'] or "-",
+        flight['aircraft_model'] or "-",
+        flight['registration'] or "-",
+        flight['route'] or "-",
+        flight['operation_type_name'] or "-"
+    ]
+
+    if passenger_type == "departure":
+        dep_pax = flight['departurePassengers'] or 0
+        passenger_data = [
+            flight['departureFlightNumber'] or "-",
+            format_datetime(flight['departureScheduledTime']),
+            format_datetime(flight['departureActualTime']),
+            dep_pax,
+            flight['departureMalePassengers'] or 0,
+            flight['departureFemalePassengers'] or 0,
+            flight['departureChildren'] or 0,
+            flight['departureInfants'] or 0
+        ]
+        ops = 1 if flight['departureFlightNumber'] else 0
+        return base_data + passenger_data, dep_pax, dep_pax, 0, 0, ops
+
+    if passenger_type == "arrival":
+        arr_pax = flight['arrivalPassengers'] or 0
+        passenger_data = [
+            flight['arrivalFlightNumber'] or "-",
+            format_datetime(flight['arrivalScheduledTime']),
+            format_datetime(flight['arrivalActualTime']),
+            arr_pax,
+            flight['arrivalMalePassengers'] or 0,
+            flight['arrivalFemalePassengers'] or 0,
+            flight['arrivalChildren'] or 0,
+            flight['arrivalInfants'] or 0
+        ]
+        ops = 1 if flight['arrivalFlightNumber'] else 0
+        return base_data + passenger_data, arr_pax, 0, arr_pax, 0, ops
+
+    if passenger_type == "infants":
+        arr_infants = flight['arrivalInfants'] or 0
+        dep_infants = flight['departureInfants'] or 0
+        passenger_data = [
+            flight['arrivalFlightNumber'] or "-",
+            flight['departureFlightNumber'] or "-",
+            arr_infants,
+            dep_infants,
+            arr_infants + dep_infants
+        ]
+        return base_data + passenger_data, 0, 0, 0, arr_infants + dep_infants, 0
+
+    # all
+    arr_pax = flight['arrivalPassengers'] or 0
+    dep_pax = flight['departurePassengers'] or 0
+    passenger_data = [
+        flight['arrivalFlightNumber'] or "-",
+        arr_pax,
+        flight['departureFlightNumber'] or "-",
+        dep_pax,
+        arr_pax + dep_pax
+    ]
+    ops = (1 if flight['arrivalFlightNumber'] else 0) + (1 if flight['departureFlightNumber'] else 0)
+    return base_data + passenger_data, arr_pax + dep_pax, dep_pax, arr_pax, 0, ops
+
+
 def create_excel_report(flights, passenger_type, date_from, date_to):
     """
     Kreira Excel izvještaj sa filteriranim podacima
     """
     wb = openpyxl.Workbook()
+    register_styles(wb)
     ws = wb.active
     ws.title = "Custom izvještaj"
 
     # Styles
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    header_fill = PatternFill(start_color="0F172A", end_color="0F172A", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    
     thin_border = Border(
         left=Side(style='thin'),
         right=Side(style='thin'),
@@ -206,38 +280,11 @@ def create_excel_report(flights, passenger_type, date_from, date_to):
         bottom=Side(style='thin')
     )
 
-    # Define columns based on passenger type
-    base_headers = ["Datum", "Aviokompanija", "Tip aviona", "Registracija", "Ruta", "Tip operacije"]
-    
-    if passenger_type == "departure":
-        headers = base_headers + [
-            "Broj leta (odlazak)", "Planirano vrijeme", "Stvarno vrijeme",
-            "Putnici", "Muškarci", "Žene", "Djeca", "Bebe"
-        ]
-    elif passenger_type == "arrival":
-        headers = base_headers + [
-            "Broj leta (dolazak)", "Planirano vrijeme", "Stvarno vrijeme",
-            "Putnici", "Muškarci", "Žene", "Djeca", "Bebe"
-        ]
-    elif passenger_type == "infants":
-        headers = base_headers + [
-            "Broj leta (dolazak)", "Broj leta (odlazak)",
-            "Bebe (dolazak)", "Bebe (odlazak)", "Ukupno beba"
-        ]
-    else:  # all
-        headers = base_headers + [
-            "Broj leta (dolazak)", "Putnici (dolazak)",
-            "Broj leta (odlazak)", "Putnici (odlazak)",
-            "Ukupno putnika"
-        ]
+    headers = get_report_headers(passenger_type)
 
     # Write headers
     for col_idx, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
+        ws.cell(row=1, column=col_idx, value=header).style = "report_table_header"
 
     # Set column widths
     column_widths = [12, 25, 15, 12, 15, 15] + [18] * (len(headers) - 6)
@@ -253,83 +300,18 @@ def create_excel_report(flights, passenger_type, date_from, date_to):
     total_operations = 0
 
     for flight in flights:
-        base_data = [
-            format_date(flight['date']),
-            flight['airline_name'] or "-",
-            flight['aircraft_model'] or "-",
-            flight['registration'] or "-",
-            flight['route'] or "-",
-            flight['operation_type_name'] or "-"
-        ]
-
-        if passenger_type == "departure":
-            passenger_data = [
-                flight['departureFlightNumber'] or "-",
-                format_datetime(flight['departureScheduledTime']),
-                format_datetime(flight['departureActualTime']),
-                flight['departurePassengers'] or 0,
-                flight['departureMalePassengers'] or 0,
-                flight['departureFemalePassengers'] or 0,
-                flight['departureChildren'] or 0,
-                flight['departureInfants'] or 0
-            ]
-            dep_pax = flight['departurePassengers'] or 0
-            total_passengers += dep_pax
-            total_departure_passengers += dep_pax
-            if flight['departureFlightNumber']:
-                total_operations += 1
-        elif passenger_type == "arrival":
-            passenger_data = [
-                flight['arrivalFlightNumber'] or "-",
-                format_datetime(flight['arrivalScheduledTime']),
-                format_datetime(flight['arrivalActualTime']),
-                flight['arrivalPassengers'] or 0,
-                flight['arrivalMalePassengers'] or 0,
-                flight['arrivalFemalePassengers'] or 0,
-                flight['arrivalChildren'] or 0,
-                flight['arrivalInfants'] or 0
-            ]
-            arr_pax = flight['arrivalPassengers'] or 0
-            total_passengers += arr_pax
-            total_arrival_passengers += arr_pax
-            if flight['arrivalFlightNumber']:
-                total_operations += 1
-        elif passenger_type == "infants":
-            arr_infants = flight['arrivalInfants'] or 0
-            dep_infants = flight['departureInfants'] or 0
-            passenger_data = [
-                flight['arrivalFlightNumber'] or "-",
-                flight['departureFlightNumber'] or "-",
-                arr_infants,
-                dep_infants,
-                arr_infants + dep_infants
-            ]
-            total_infants += arr_infants + dep_infants
-        else:  # all
-            arr_pax = flight['arrivalPassengers'] or 0
-            dep_pax = flight['departurePassengers'] or 0
-            passenger_data = [
-                flight['arrivalFlightNumber'] or "-",
-                arr_pax,
-                flight['departureFlightNumber'] or "-",
-                dep_pax,
-                arr_pax + dep_pax
-            ]
-            total_passengers += arr_pax + dep_pax
-            total_arrival_passengers += arr_pax
-            total_departure_passengers += dep_pax
-            if flight['arrivalFlightNumber']:
-                total_operations += 1
-            if flight['departureFlightNumber']:
-                total_operations += 1
-
-        row_data = base_data + passenger_data
+        row_data, pax, dep_pax, arr_pax, infants, ops = build_flight_row(flight, passenger_type)
+        total_passengers += pax
+        total_departure_passengers += dep_pax
+        total_arrival_passengers += arr_pax
+        total_infants += infants
+        total_operations += ops
 
         for col_idx, value in enumerate(row_data, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.border = thin_border
-            if col_idx > 6:  # Numeric columns
-                cell.alignment = Alignment(horizontal="center")
+            # Numeric columns are centered
+            ws.cell(row=row_idx, column=col_idx, value=value).style = (
+                "report_data_center" if col_idx > 6 else "report_data"
+            )
 
         row_idx += 1
 
@@ -496,51 +478,47 @@ def create_excel_report(flights, passenger_type, date_from, date_to):
             airline_passengers[airline] = airline_passengers.get(airline, 0) + arr_pax + dep_pax
     
     if airline_counts:
-        breakdown_fill = PatternFill(start_color="64748B", end_color="64748B", fill_type="solid")
         # Determine header span based on passenger type
         header_end_col = 7 if passenger_type == "all" else 5
         create_merged_cell(
             ws, row_idx, 1, header_end_col,
             "PREGLED PO AVIOKOMPANIJAMA",
-            font=Font(bold=True, size=11, color="FFFFFF"),
-            fill=breakdown_fill,
-            alignment=Alignment(horizontal="center"),
-            border=thin_border
+            style="report_section_header"
         )
         row_idx += 1
         
         # Headers
-        ws.cell(row=row_idx, column=1, value="Aviokompanija").font = Font(bold=True)
-        ws.cell(row=row_idx, column=2, value="Letova").font = Font(bold=True)
-        ws.cell(row=row_idx, column=3, value="Operacija").font = Font(bold=True)
+        ws.cell(row=row_idx, column=1, value="Aviokompanija").style = "report_bold"
+        ws.cell(row=row_idx, column=2, value="Letova").style = "report_bold"
+        ws.cell(row=row_idx, column=3, value="Operacija").style = "report_bold"
         if passenger_type != "infants":
             if passenger_type == "all":
-                ws.cell(row=row_idx, column=4, value="Odlazeći").font = Font(bold=True)
-                ws.cell(row=row_idx, column=5, value="Dolazeći").font = Font(bold=True)
-                ws.cell(row=row_idx, column=6, value="Ukupno").font = Font(bold=True)
-                ws.cell(row=row_idx, column=7, value="Prosječno").font = Font(bold=True)
+                ws.cell(row=row_idx, column=4, value="Odlazeći").style = "report_bold"
+                ws.cell(row=row_idx, column=5, value="Dolazeći").style = "report_bold"
+                ws.cell(row=row_idx, column=6, value="Ukupno").style = "report_bold"
+                ws.cell(row=row_idx, column=7, value="Prosječno").style = "report_bold"
             else:
-                ws.cell(row=row_idx, column=4, value="Putnici").font = Font(bold=True)
-                ws.cell(row=row_idx, column=5, value="Prosječno").font = Font(bold=True)
+                ws.cell(row=row_idx, column=4, value="Putnici").style = "report_bold"
+                ws.cell(row=row_idx, column=5, value="Prosječno").style = "report_bold"
         row_idx += 1
         
         # Sort airlines by passenger count (highest first)
         sorted_airlines = sorted(airline_counts.keys(), key=lambda x: airline_passengers.get(x, 0), reverse=True)
         for airline in sorted_airlines:
             ws.cell(row=row_idx, column=1, value=airline)
-            ws.cell(row=row_idx, column=2, value=airline_counts[airline]).alignment = Alignment(horizontal="center")
-            ws.cell(row=row_idx, column=3, value=airline_operations.get(airline, 0)).alignment = Alignment(horizontal="center")
+            ws.cell(row=row_idx, column=2, value=airline_counts[airline]).style = "report_center"
+            ws.cell(row=row_idx, column=3, value=airline_operations.get(airline, 0)).style = "report_center"
             if passenger_type != "infants":
                 if passenger_type == "all":
-                    ws.cell(row=row_idx, column=4, value=airline_departure_passengers.get(airline, 0)).alignment = Alignment(horizontal="center")
-                    ws.cell(row=row_idx, column=5, value=airline_arrival_passengers.get(airline, 0)).alignment = Alignment(horizontal="center")
-                    ws.cell(row=row_idx, column=6, value=airline_passengers.get(airline, 0)).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=4, value=airline_departure_passengers.get(airline, 0)).style = "report_center"
+                    ws.cell(row=row_idx, column=5, value=airline_arrival_passengers.get(airline, 0)).style = "report_center"
+                    ws.cell(row=row_idx, column=6, value=airline_passengers.get(airline, 0)).style = "report_center"
                     avg = round(airline_passengers.get(airline, 0) / airline_operations.get(airline, 1), 1) if airline_operations.get(airline, 0) > 0 else 0
-                    ws.cell(row=row_idx, column=7, value=avg).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=7, value=avg).style = "report_center"
                 else:
-                    ws.cell(row=row_idx, column=4, value=airline_passengers.get(airline, 0)).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=4, value=airline_passengers.get(airline, 0)).style = "report_center"
                     avg = round(airline_passengers.get(airline, 0) / airline_operations.get(airline, 1), 1) if airline_operations.get(airline, 0) > 0 else 0
-                    ws.cell(row=row_idx, column=5, value=avg).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=5, value=avg).style = "report_center"
             row_idx += 1
         
         row_idx += 1
@@ -577,51 +555,47 @@ def create_excel_report(flights, passenger_type, date_from, date_to):
             route_passengers[route] = route_passengers.get(route, 0) + arr_pax + dep_pax
     
     if route_counts:
-        route_fill = PatternFill(start_color="64748B", end_color="64748B", fill_type="solid")
         # Determine header span based on passenger type
         header_end_col = 7 if passenger_type == "all" else 5
         create_merged_cell(
             ws, row_idx, 1, header_end_col,
             "PREGLED PO RUTAMA",
-            font=Font(bold=True, size=11, color="FFFFFF"),
-            fill=route_fill,
-            alignment=Alignment(horizontal="center"),
-            border=thin_border
+            style="report_section_header"
         )
         row_idx += 1
         
         # Headers
-        ws.cell(row=row_idx, column=1, value="Ruta").font = Font(bold=True)
-        ws.cell(row=row_idx, column=2, value="Letova").font = Font(bold=True)
-        ws.cell(row=row_idx, column=3, value="Operacija").font = Font(bold=True)
+        ws.cell(row=row_idx, column=1, value="Ruta").style = "report_bold"
+        ws.cell(row=row_idx, column=2, value="Letova").style = "report_bold"
+        ws.cell(row=row_idx, column=3, value="Operacija").style = "report_bold"
         if passenger_type != "infants":
             if passenger_type == "all":
-                ws.cell(row=row_idx, column=4, value="Odlazeći").font = Font(bold=True)
-                ws.cell(row=row_idx, column=5, value="Dolazeći").font = Font(bold=True)
-                ws.cell(row=row_idx, column=6, value="Ukupno").font = Font(bold=True)
-                ws.cell(row=row_idx, column=7, value="Prosječno").font = Font(bold=True)
+                ws.cell(row=row_idx, column=4, value="Odlazeći").style = "report_bold"
+                ws.cell(row=row_idx, column=5, value="Dolazeći").style = "report_bold"
+                ws.cell(row=row_idx, column=6, value="Ukupno").style = "report_bold"
+                ws.cell(row=row_idx, column=7, value="Prosječno").style = "report_bold"
             else:
-                ws.cell(row=row_idx, column=4, value="Putnici").font = Font(bold=True)
-                ws.cell(row=row_idx, column=5, value="Prosječno").font = Font(bold=True)
+                ws.cell(row=row_idx, column=4, value="Putnici").style = "report_bold"
+                ws.cell(row=row_idx, column=5, value="Prosječno").style = "report_bold"
         row_idx += 1
         
         # Sort by flight count and show ALL routes
         all_routes = sorted(route_counts.items(), key=lambda x: x[1], reverse=True)
         for route, count in all_routes:
             ws.cell(row=row_idx, column=1, value=route)
-            ws.cell(row=row_idx, column=2, value=count).alignment = Alignment(horizontal="center")
-            ws.cell(row=row_idx, column=3, value=route_operations.get(route, 0)).alignment = Alignment(horizontal="center")
+            ws.cell(row=row_idx, column=2, value=count).style = "report_center"
+            ws.cell(row=row_idx, column=3, value=route_operations.get(route, 0)).style = "report_center"
             if passenger_type != "infants":
                 if passenger_type == "all":
-                    ws.cell(row=row_idx, column=4, value=route_departure_passengers.get(route, 0)).alignment = Alignment(horizontal="center")
-                    ws.cell(row=row_idx, column=5, value=route_arrival_passengers.get(route, 0)).alignment = Alignment(horizontal="center")
-                    ws.cell(row=row_idx, column=6, value=route_passengers.get(route, 0)).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=4, value=route_departure_passengers.get(route, 0)).style = "report_center"
+                    ws.cell(row=row_idx, column=5, value=route_arrival_passengers.get(route, 0)).style = "report_center"
+                    ws.cell(row=row_idx, column=6, value=route_passengers.get(route, 0)).style = "report_center"
                     avg = round(route_passengers.get(route, 0) / route_operations.get(route, 1), 1) if route_operations.get(route, 0) > 0 else 0
-                    ws.cell(row=row_idx, column=7, value=avg).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=7, value=avg).style = "report_center"
                 else:
-                    ws.cell(row=row_idx, column=4, value=route_passengers.get(route, 0)).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=4, value=route_passengers.get(route, 0)).style = "report_center"
                     avg = round(route_passengers.get(route, 0) / route_operations.get(route, 1), 1) if route_operations.get(route, 0) > 0 else 0
-                    ws.cell(row=row_idx, column=5, value=avg).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=5, value=avg).style = "report_center"
             row_idx += 1
         
         row_idx += 1
@@ -658,49 +632,45 @@ def create_excel_report(flights, passenger_type, date_from, date_to):
             optype_passengers[optype] = optype_passengers.get(optype, 0) + arr_pax + dep_pax
     
     if optype_counts:
-        optype_fill = PatternFill(start_color="64748B", end_color="64748B", fill_type="solid")
         # Determine header span based on passenger type
         header_end_col = 7 if passenger_type == "all" else 5
         create_merged_cell(
             ws, row_idx, 1, header_end_col,
             "PREGLED PO TIPU SAOBRAĆAJA",
-            font=Font(bold=True, size=11, color="FFFFFF"),
-            fill=optype_fill,
-            alignment=Alignment(horizontal="center"),
-            border=thin_border
+            style="report_section_header"
         )
         row_idx += 1
         
         # Headers
-        ws.cell(row=row_idx, column=1, value="Tip saobraćaja").font = Font(bold=True)
-        ws.cell(row=row_idx, column=2, value="Letova").font = Font(bold=True)
-        ws.cell(row=row_idx, column=3, value="Operacija").font = Font(bold=True)
+        ws.cell(row=row_idx, column=1, value="Tip saobraćaja").style = "report_bold"
+        ws.cell(row=row_idx, column=2, value="Letova").style = "report_bold"
+        ws.cell(row=row_idx, column=3, value="Operacija").style = "report_bold"
         if passenger_type != "infants":
             if passenger_type == "all":
-                ws.cell(row=row_idx, column=4, value="Odlazeći").font = Font(bold=True)
-                ws.cell(row=row_idx, column=5, value="Dolazeći").font = Font(bold=True)
-                ws.cell(row=row_idx, column=6, value="Ukupno").font = Font(bold=True)
-                ws.cell(row=row_idx, column=7, value="Prosječno").font = Font(bold=True)
+                ws.cell(row=row_idx, column=4, value="Odlazeći").style = "report_bold"
+                ws.cell(row=row_idx, column=5, value="Dolazeći").style = "report_bold"
+                ws.cell(row=row_idx, column=6, value="Ukupno").style = "report_bold"
+                ws.cell(row=row_idx, column=7, value="Prosječno").style = "report_bold"
             else:
-                ws.cell(row=row_idx, column=4, value="Putnici").font = Font(bold=True)
-                ws.cell(row=row_idx, column=5, value="Prosječno").font = Font(bold=True)
+                ws.cell(row=row_idx, column=4, value="Putnici").style = "report_bold"
+                ws.cell(row=row_idx, column=5, value="Prosječno").style = "report_bold"
         row_idx += 1
         
         for optype in sorted(optype_counts.keys()):
             ws.cell(row=row_idx, column=1, value=optype)
-            ws.cell(row=row_idx, column=2, value=optype_counts[optype]).alignment = Alignment(horizontal="center")
-            ws.cell(row=row_idx, column=3, value=optype_operations.get(optype, 0)).alignment = Alignment(horizontal="center")
+            ws.cell(row=row_idx, column=2, value=optype_counts[optype]).style = "report_center"
+            ws.cell(row=row_idx, column=3, value=optype_operations.get(optype, 0)).style = "report_center"
             if passenger_type != "infants":
                 if passenger_type == "all":
-                    ws.cell(row=row_idx, column=4, value=optype_departure_passengers.get(optype, 0)).alignment = Alignment(horizontal="center")
-                    ws.cell(row=row_idx, column=5, value=optype_arrival_passengers.get(optype, 0)).alignment = Alignment(horizontal="center")
-                    ws.cell(row=row_idx, column=6, value=optype_passengers.get(optype, 0)).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=4, value=optype_departure_passengers.get(optype, 0)).style = "report_center"
+                    ws.cell(row=row_idx, column=5, value=optype_arrival_passengers.get(optype, 0)).style = "report_center"
+                    ws.cell(row=row_idx, column=6, value=optype_passengers.get(optype, 0)).style = "report_center"
                     avg = round(optype_passengers.get(optype, 0) / optype_operations.get(optype, 1), 1) if optype_operations.get(optype, 0) > 0 else 0
-                    ws.cell(row=row_idx, column=7, value=avg).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=7, value=avg).style = "report_center"
                 else:
-                    ws.cell(row=row_idx, column=4, value=optype_passengers.get(optype, 0)).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=4, value=optype_passengers.get(optype, 0)).style = "report_center"
                     avg = round(optype_passengers.get(optype, 0) / optype_operations.get(optype, 1), 1) if optype_operations.get(optype, 0) > 0 else 0
-                    ws.cell(row=row_idx, column=5, value=avg).alignment = Alignment(horizontal="center")
+                    ws.cell(row=row_idx, column=5, value=avg).style = "report_center"
             row_idx += 1
 
     # Set row height for header
@@ -709,6 +679,205 @@ def create_excel_report(flights, passenger_type, date_from, date_to):
     return wb
 
 
+def add_to_breakdown(breakdown, key, flight, passenger_type):
+    """Dodaj let u sumarni pregled (po aviokompaniji, ruti ili tipu saobraćaja)"""
+    entry = breakdown.setdefault(key, {
+        'flights': 0, 'operations': 0, 'departure': 0, 'arrival': 0, 'passengers': 0
+    })
+    entry['flights'] += 1
+    if flight['arrivalFlightNumber']:
+        entry['operations'] += 1
+    if flight['departureFlightNumber']:
+        entry['operations'] += 1
+
+    dep_pax = flight['departurePassengers'] or 0
+    arr_pax = flight['arrivalPassengers'] or 0
+    entry['departure'] += dep_pax
+    entry['arrival'] += arr_pax
+
+    if passenger_type == "departure":
+        entry['passengers'] += dep_pax
+    elif passenger_type == "arrival":
+        entry['passengers'] += arr_pax
+    elif passenger_type == "all":
+        entry['passengers'] += arr_pax + dep_pax
+
+
+def create_streaming_report(flights, passenger_type, date_from, date_to, output_path):
+    """
+    Write-only varijanta create_excel_report za velike periode.
+
+    Letovi se upisuju čim stignu (npr. iz iter_flight_data), a u memoriji ostaju
+    samo sumarni brojači, pa potrošnja memorije ne raste sa brojem letova.
+    Sažetak se ispisuje bez spojenih ćelija.
+
+    Returns:
+        Broj upisanih letova
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title="Custom izvještaj")
+
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    center = Alignment(horizontal="center")
+    stats_fill = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
+    section_fill = PatternFill(start_color="64748B", end_color="64748B", fill_type="solid")
+
+    def styled(value, font=None, fill=None, alignment=None, border=None):
+        cell = WriteOnlyCell(ws, value=sanitize_text(value) if isinstance(value, str) else value)
+        if font:
+            cell.font = font
+        if fill:
+            cell.fill = fill
+        if alignment:
+            cell.alignment = alignment
+        if border:
+            cell.border = border
+        return cell
+
+    # Stilovi za redove podataka se registruju jednom i samo kopiraju po ćeliji
+    text_style = styled(None, border=thin_border)._style
+    numeric_style = styled(None, border=thin_border, alignment=center)._style
+
+    def data_cell(value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell._style = copy(style)
+        return cell
+
+    headers = get_report_headers(passenger_type)
+    column_widths = [12, 25, 15, 12, 15, 15] + [18] * (len(headers) - 6)
+    for col_idx, width in enumerate(column_widths, start=1):
+        ws.column_dimensions[openpyxl.utils.get_column_letter(col_idx)].width = width
+
+    header_font = Font(bold=True, color="FFFFFF", size=11)
+    header_fill = PatternFill(start_color="0F172A", end_color="0F172A", fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    ws.append([styled(h, header_font, header_fill, header_alignment, thin_border) for h in headers])
+
+    total_flights = 0
+    total_passengers = 0
+    total_departure_passengers = 0
+    total_arrival_passengers = 0
+    total_infants = 0
+    total_operations = 0
+    by_airline = {}
+    by_route = {}
+    by_optype = {}
+
+    for flight in flights:
+        row_data, pax, dep_pax, arr_pax, infants, ops = build_flight_row(flight, passenger_type)
+        ws.append([
+            data_cell(value, numeric_style if col_idx > 6 else text_style)
+            for col_idx, value in enumerate(row_data, start=1)
+        ])
+
+        total_flights += 1
+        total_passengers += pax
+        total_departure_passengers += dep_pax
+        total_arrival_passengers += arr_pax
+        total_infants += infants
+        total_operations += ops
+        add_to_breakdown(by_airline, flight['airline_name'] or "Nepoznato", flight, passenger_type)
+        add_to_breakdown(by_route, flight['route'] or "Nepoznato", flight, passenger_type)
+        add_to_breakdown(by_optype, flight['operation_type_name'] or "Nepoznato", flight, passenger_type)
+
+    # Sažetak
+    ws.append([])
+    ws.append([])
+    summary_fill = PatternFill(start_color="F59E0B", end_color="F59E0B", fill_type="solid")
+    summary_font = Font(bold=True, size=14, color="FFFFFF")
+    ws.append(
+        [styled("SAŽETAK IZVJEŠTAJA", summary_font, summary_fill, Alignment(horizontal="center", vertical="center"), thin_border)]
+        + [styled(None, fill=summary_fill, border=thin_border) for _ in headers[1:]]
+    )
+    ws.append([
+        styled("Period:", Font(bold=True), border=thin_border),
+        styled(f"{date_from} do {date_to}", border=thin_border),
+    ])
+
+    def stat_row(label, value, label_font, value_font):
+        ws.append([
+            styled(label, label_font, stats_fill, border=thin_border),
+            styled(value, value_font, stats_fill, center, thin_border),
+        ])
+
+    bold = Font(bold=True)
+    stat_row("Ukupno letova:", total_flights, bold, Font(bold=True, size=12))
+    stat_row("Ukupno operacija:", total_operations, bold, Font(bold=True, size=12))
+    if passenger_type == "infants":
+        stat_row("Ukupno beba:", total_infants, bold, Font(bold=True, size=12, color="D97706"))
+    else:
+        stat_row("Ukupno putnika:", total_passengers, bold, Font(bold=True, size=12, color="D97706"))
+        italic = Font(bold=False, italic=True)
+        if total_departure_passengers > 0:
+            stat_row("  - Odlazeći putnici:", total_departure_passengers, italic, bold)
+        if total_arrival_passengers > 0:
+            stat_row("  - Dolazeći putnici:", total_arrival_passengers, italic, bold)
+        if total_flights > 0:
+            stat_row("Prosječno putnika po letu:", round(total_passengers / total_flights, 1), bold, bold)
+        if total_operations > 0:
+            stat_row("Prosječno putnika po operaciji:", round(total_passengers / total_operations, 1), bold, bold)
+
+    def breakdown_section(title, first_header, items):
+        if not items:
+            return
+        ws.append([])
+        header_end_col = 7 if passenger_type == "all" else 5
+        section_font = Font(bold=True, size=11, color="FFFFFF")
+        ws.append(
+            [styled(title, section_font, section_fill, center, thin_border)]
+            + [styled(None, fill=section_fill, border=thin_border) for _ in range(header_end_col - 1)]
+        )
+
+        column_names = [first_header, "Letova", "Operacija"]
+        if passenger_type == "all":
+            column_names += ["Odlazeći", "Dolazeći", "Ukupno", "Prosječno"]
+        elif passenger_type != "infants":
+            column_names += ["Putnici", "Prosječno"]
+        ws.append([styled(name, bold) for name in column_names])
+
+        for key, entry in items:
+            avg = round(entry['passengers'] / entry['operations'], 1) if entry['operations'] > 0 else 0
+            values = [entry['flights'], entry['operations']]
+            if passenger_type == "all":
+                values += [entry['departure'], entry['arrival'], entry['passengers'], avg]
+            elif passenger_type != "infants":
+                values += [entry['passengers'], avg]
+            ws.append([styled(key)] + [styled(value, alignment=center) for value in values])
+
+    breakdown_section(
+        "PREGLED PO AVIOKOMPANIJAMA", "Aviokompanija",
+        sorted(by_airline.items(), key=lambda item: item[1]['passengers'], reverse=True)
+    )
+    breakdown_section(
+        "PREGLED PO RUTAMA", "Ruta",
+        sorted(by_route.items(), key=lambda item: item[1]['flights'], reverse=True)
+    )
+    breakdown_section(
+        "PREGLED PO TIPU SAOBRAĆAJA", "Tip saobraćaja",
+        sorted(by_optype.items())
+    )
+
+    wb.save(output_path)
+    wb.close()
+
+    return total_flights
+
+
+def is_large_period(date_from, date_to):
+    """Da li je period dovoljno dug da se izvještaj generiše u streaming modu"""
+    try:
+        start = datetime.fromisoformat(str(date_from)[:10])
+        end = datetime.fromisoformat(str(date_to)[:10])
+    except ValueError:
+        return False
+    return (end - start).days > STREAMING_THRESHOLD_DAYS
+
+
 def main():
     """Main function"""
     if len(sys.argv) < 2:
@@ -728,6 +897,7 @@ def main():
         airlines = filters.get('airlines', [])
         routes = filters.get('routes', [])
         passenger_type = filters.get('passengerType', 'all')
+        streaming = filters.get('streaming')
 
         if not date_from or not date_to:
             print(json.dumps({
@@ -736,26 +906,34 @@ def main():
             }))
             sys.exit(1)
 
-        # Fetch data
-        flights = get_flight_data(date_from, date_to, operation_types, airlines, routes)
-
-        # Generate Excel
-        wb = create_excel_report(flights, passenger_type, date_from, date_to)
-
-        # Save file
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d")
         filename = f"Custom_izvjestaj_{timestamp}.xlsx"
         output_path = OUTPUT_DIR / filename
 
-        wb.iso_dates = True
-        wb.save(output_path)
-        wb.close()
+        if streaming is None:
+            streaming = is_large_period(date_from, date_to)
+
+        if streaming:
+            # Write-only: redovi idu direktno iz server-side cursora u fajl
+            flights = iter_flight_data(date_from, date_to, operation_types, airlines, routes)
+            flight_count = create_streaming_report(flights, passenger_type, date_from, date_to, output_path)
+        else:
+            # Fetch data
+            flights = get_flight_data(date_from, date_to, operation_types, airlines, routes)
+            flight_count = len(flights)
+
+            # Generate Excel
+            wb = create_excel_report(flights, passenger_type, date_from, date_to)
+
+            wb.iso_dates = True
+            wb.save(output_path)
+            wb.close()
 
         print(json.dumps({
             "success": True,
             "fileName": filename,
-            "message": f"Custom izvještaj uspješno generisan ({len(flights)} letova)"
+            "message": f"Custom izvještaj uspješno generisan ({flight_count} letova)"
         }))
 
     except Exception as e:
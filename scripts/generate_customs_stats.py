@@ -8,15 +8,13 @@ Generiše mjesečni statistički izvještaj za carinu sa:
 """
 
 import sys
-import os
-import re
 import calendar
 from pathlib import Path
 from datetime import datetime
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from report_db import fetch_all
+from excel_sanitizer import sanitize_report_text as sanitize_text
 
 # Putanja
 SCRIPT_DIR = Path(__file__).parent
@@ -31,45 +29,6 @@ MONTH_NAMES = {
 }
 
 
-def get_db_connection():
-    """Konekcija na PostgreSQL bazu"""
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
-
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-
-
-def sanitize_text(value):
-    """
-    Gentle sanitization that preserves unicode (ć, č, š, ž, đ) but removes Excel-problematic characters.
-    openpyxl 3.1.5+ properly handles unicode, so we only need to remove control characters.
-    """
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        return value
-
-    # Step 1: Remove control characters (0x00-0x1F, 0x7F-0x9F)
-    value = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
-
-    # Step 2: Use openpyxl's built-in cleaner for illegal Excel characters
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Step 3: Remove zero-width spaces and BOM
-    value = value.replace('\ufeff', '').replace('\u200b', '').replace('\u200c', '').replace('\u200d', '')
-
-    # Step 4: Replace non-breaking space with regular space
-    value = value.replace('\xa0', ' ')
-
-    # Step 5: Strip whitespace
-    return value.strip()
-
-
 def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None):
     """
     Helper function to properly create merged cells with consistent formatting.
@@ -102,9 +61,6 @@ def get_flight_data(year: int, month: int):
     """
     Povuči sve letove za zadati mjesec
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     # Datum početka i kraja mjeseca
     first_day = f"{year}-{month:02d}-01"
     last_day = calendar.monthrange(year, month)[1]
@@ -144,11 +100,7 @@ def get_flight_data(year: int, month: int):
         ORDER BY a.name
     """
 
-    cursor.execute(query, (first_day, last_date))
-    flights = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    flights = fetch_all(query, (first_day, last_date))
 
     return flights
 
@@ -7,15 +7,13 @@ uz završni summary ukupnih statistika.
 """
 
 import sys
-import os
-import re
 import calendar
 from pathlib import Path
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
+from report_db import fetch_all
+from excel_sanitizer import sanitize_report_text as sanitize_text
 
 # Putanja
 SCRIPT_DIR = Path(__file__).parent
@@ -30,45 +28,6 @@ MONTH_NAMES = {
 }
 
 
-def get_db_connection():
-    """Konekcija na PostgreSQL bazu"""
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
-
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-
-
-def sanitize_text(value):
-    """
-    Gentle sanitization that preserves unicode (ć, č, š, ž, đ) but removes Excel-problematic characters.
-    openpyxl 3.1.5+ properly handles unicode, so we only need to remove control characters.
-    """
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        return value
-
-    # Step 1: Remove control characters (0x00-0x1F, 0x7F-0x9F)
-    value = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
-
-    # Step 2: Use openpyxl's built-in cleaner for illegal Excel characters
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Step 3: Remove zero-width spaces and BOM
-    value = value.replace('\ufeff', '').replace('\u200b', '').replace('\u200c', '').replace('\u200d', '')
-
-    # Step 4: Replace non-breaking space with regular space
-    value = value.replace('\xa0', ' ')
-
-    # Step 5: Strip whitespace
-    return value.strip()
-
-
 def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None):
     """
     Helper function to properly create merged cells with consistent formatting.
@@ -97,14 +56,13 @@ def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None,
         ws.merge_cells(start_row=row, start_column=start_col, end_row=row, end_column=end_col)
 
 
-def get_flight_data(year: int, month: int):
-    """Povuči sve letove za zadati mjesec"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    first_day = f"{year}-{month:02d}-01"
-    last_day = calendar.monthrange(year, month)[1]
-    last_date = f"{year}-{month:02d}-{last_day:02d}"
+def get_flight_data(year: int, month_from: int, month_to: int = None):
+    """Povuči sve letove za zadati mjesec ili raspon mjeseci (jednim upitom)"""
+    if month_to is None:
+        month_to = month_from
+    first_day = f"{year}-{month_from:02d}-01"
+    last_day = calendar.monthrange(year, month_to)[1]
+    last_date = f"{year}-{month_to:02d}-{last_day:02d}"
 
     query = """
         SELECT
@@ -140,15 +98,21 @@ def get_flight_data(year: int, month: int):
         ORDER BY a.name
     """
 
-    cursor.execute(query, (first_day, last_date))
-    flights = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    flights = fetch_all(query, (first_day, last_date))
 
     return flights
 
 
+def group_flights_by_month(flights, month_to: int):
+    """Podijeli letove iz jednog upita po mjesecima (1..month_to), čuvajući redoslijed"""
+    flights_by_month = {month: [] for month in range(1, month_to + 1)}
+    for flight in flights:
+        month = flight['date'].month
+        if month in flights_by_month:
+            flights_by_month[month].append(flight)
+    return flights_by_month
+
+
 def normalize_airline_name(flight):
     """Group Wizz Air entities under a single name."""
     name = (flight.get('airline_name') or '').strip()
@@ -441,14 +405,15 @@ def generate_director_stats(year: int, month_to: int, output_path: Path = None):
         'freight': {'loaded': 0.0, 'unloaded': 0.0}
     }
 
-    total_flights_all = 0
     row = 1
 
+    print(f"Povlačim podatke za Januar-{MONTH_NAMES[month_to]} {year}...")
+    flights = get_flight_data(year, 1, month_to)
+    total_flights_all = len(flights)
+    flights_by_month = group_flights_by_month(flights, month_to)
+
     for month in range(1, month_to + 1):
-        print(f"Povlačim podatke za {MONTH_NAMES[month]} {year}...")
-        flights = get_flight_data(year, month)
-        total_flights_all += len(flights)
-        data = aggregate_customs_data(flights)
+        data = aggregate_customs_data(flights_by_month[month])
         combine_customs_data(total_data, data)
         row = add_customs_block(ws, row, f"{MONTH_NAMES[month]} {year}", data, styles)
 
@@ -12,18 +12,16 @@ Generiše mjesečni Excel izvještaj sa:
 """
 
 import sys
-import os
 import calendar
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import openpyxl
 from openpyxl.styles import Font, Alignment
 from openpyxl.utils import get_column_letter
 from openpyxl.cell import MergedCell
+from report_db import fetch_all
+from report_templates import load_template
 
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -48,13 +46,6 @@ DAY_NAMES = {
 }
 
 
-def get_db_connection():
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable not set")
-    return psycopg2.connect(database_url, cursor_factory=RealDictCursor)
-
-
 def get_operation_type_code(operation_type_code):
     if not operation_type_code:
         return ""
@@ -83,9 +74,6 @@ def get_route_other_iata(route):
 
 
 def get_flight_data(year: int, month: int):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     first_day = f"{year}-{month:02d}-01"
     last_day = calendar.monthrange(year, month)[1]
     last_date = f"{year}-{month:02d}-{last_day:02d}"
@@ -134,10 +122,7 @@ def get_flight_data(year: int, month: int):
         ORDER BY f.date
     """
 
-    cursor.execute(query, (first_day, last_date))
-    flights = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    flights = fetch_all(query, (first_day, last_date))
     return flights
 
 
@@ -652,7 +637,7 @@ def generate_local_stats(year: int, month: int, output_path: Path = None):
     if not TEMPLATE_PATH.exists():
         raise FileNotFoundError(f"Template nije pronađen: {TEMPLATE_PATH}")
 
-    wb = openpyxl.load_workbook(TEMPLATE_PATH, data_only=False)
+    wb = load_template(TEMPLATE_PATH, data_only=False)
 
     populate_redovni_sheet(
         wb['Redovni promet'],
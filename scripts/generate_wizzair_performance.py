@@ -7,16 +7,14 @@ Times are exported as stored in flight records (no timezone conversion).
 """
 
 import sys
-import os
-import re
 import pytz
 import calendar
 from pathlib import Path
 from datetime import datetime, timedelta
-import psycopg2
-from psycopg2.extras import RealDictCursor
 import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from report_db import fetch_all
+from report_styles import register_styles
+from excel_sanitizer import sanitize_report_text as sanitize_text
 
 # Putanja
 SCRIPT_DIR = Path(__file__).parent
@@ -30,19 +28,14 @@ MONTH_NAMES = {
     9: "Septembar", 10: "Oktobar", 11: "Novembar", 12: "Decembar"
 }
 
-def get_db_connection():
-    """Konekcija na PostgreSQL bazu"""
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable not set")
+# Kolone sa centriranim podacima (ostale su poravnate lijevo)
+CENTERED_COLUMNS = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 15, 16, 18, 19, 21})
 
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-
-
-def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None):
+def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None, alignment=None, border=None, style=None):
     """
     Helper function to properly create merged cells with consistent formatting.
     Applies formatting to ALL cells in the range before merging to avoid Excel corruption.
+    `style` is a named style from report_styles (one assignment per cell).
     """
     # Convert column letters to numbers if needed
     if isinstance(start_col, str):
@@ -54,6 +47,8 @@ def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None,
         cell = ws.cell(row=row, column=col)
         if col == start_col and value is not None:
             cell.value = value
+        if style:
+            cell.style = style
         if font:
             cell.font = font
         if fill:
@@ -66,35 +61,6 @@ def create_merged_cell(ws, row, start_col, end_col, value, font=None, fill=None,
     if start_col != end_col:
         ws.merge_cells(start_row=row, start_column=start_col, end_row=row, end_column=end_col)
 
-def sanitize_text(value):
-    """
-    Gentle sanitization that preserves unicode (ć, č, š, ž, đ) but removes Excel-problematic characters.
-    openpyxl 3.1.5+ properly handles unicode, so we only need to remove control characters.
-    """
-    if value is None:
-        return None
-    if not isinstance(value, str):
-        return value
-
-    # Step 1: Remove control characters (0x00-0x1F, 0x7F-0x9F)
-    value = re.sub(r'[\x00-\x1F\x7F-\x9F]', '', value)
-
-    # Step 2: Use openpyxl's built-in cleaner for illegal Excel characters
-    try:
-        from openpyxl.utils.cell import ILLEGAL_CHARACTERS_RE
-        value = ILLEGAL_CHARACTERS_RE.sub('', value)
-    except Exception:
-        pass
-
-    # Step 3: Remove zero-width spaces and BOM
-    value = value.replace('\ufeff', '').replace('\u200b', '').replace('\u200c', '').replace('\u200d', '')
-
-    # Step 4: Replace non-breaking space with regular space
-    value = value.replace('\xa0', ' ')
-
-    # Step 5: Strip whitespace
-    return value.strip()
-
 SARAJEVO_TZ = pytz.timezone('Europe/Sarajevo')
 UTC_TZ = pytz.utc
 
@@ -139,9 +105,6 @@ def get_flight_data(year: int, month: int, day: int = None):
     """
     Povuči sve Wizz Air letove za zadati mjesec ili dan
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
     # Datum početka i kraja perioda
     if day:
         first_day = f"{year}-{month:02d}-{day:02d}"
@@ -186,27 +149,25 @@ def get_flight_data(year: int, month: int, day: int = None):
         ORDER BY f.date, f."departureScheduledTime", f."arrivalScheduledTime"
     """
 
-    cursor.execute(query, (first_day, last_date))
-    flights = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    flights = fetch_all(query, (first_day, last_date))
 
     return flights
 
 
-def get_flight_delays(flight_id):
+def get_flight_delays_by_flight(flight_ids):
     """
-    Povuči delay kodove za zadati let iz FlightDelay tabele
+    Povuči delay kodove za sve zadate letove jednim upitom iz FlightDelay tabele
 
     Returns:
-        List of delays: [{'phase': 'DEP', 'code': 'G8', 'minutes': 30, 'comment': '...'}, ...]
+        Dict keyed by flightId: {flight_id: [{'phase': 'DEP', 'delay_code': 'G8', 'minutes': 30, ...}, ...]}
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    delays_by_flight = {}
+    if not flight_ids:
+        return delays_by_flight
 
     query = """
         SELECT
+            fd."flightId",
             fd.phase,
             fd.minutes,
             fd."isPrimary",
@@ -216,17 +177,14 @@ def get_flight_delays(flight_id):
             dc.description as delay_description
         FROM "FlightDelay" fd
         INNER JOIN "DelayCode" dc ON fd."delayCodeId" = dc.id
-        WHERE fd."flightId" = %s
-        ORDER BY fd.phase, fd."isPrimary" DESC, fd.minutes DESC
+        WHERE fd."flightId" = ANY(%s)
+        ORDER BY fd."flightId", fd.phase, fd."isPrimary" DESC, fd.minutes DESC
     """
 
-    cursor.execute(query, (flight_id,))
-    delays = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
+    for delay in fetch_all(query, (list(flight_ids),)):
+        delays_by_flight.setdefault(delay['flightId'], []).append(delay)
 
-    return delays
+    return delays_by_flight
 
 
 def parse_route(route_str):
@@ -261,6 +219,9 @@ def generate_wizzair_performance(year: int, month: int, day: int = None, output_
         print("UPOZORENJE: Nema Wizz Air letova za zadati period!")
         return None
 
+    # Delay kodovi za cijeli period, jednim upitom
+    delays_by_flight = get_flight_delays_by_flight([flight['id'] for flight in flights])
+
     # 2. Grupiši letove po danima
     print("Grupisanje letova po danima...")
     flights_by_day = {}
@@ -280,19 +241,8 @@ def generate_wizzair_performance(year: int, month: int, day: int = None, output_
     if 'Sheet' in wb.sheetnames:
         wb.remove(wb['Sheet'])
 
-    # 4. Stilovi
-    header_font = Font(name='Arial', size=10, bold=True)
-    header_fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-    title_font = Font(name='Arial', size=12, bold=True)
-    regular_font = Font(name='Arial', size=9)
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    center_align = Alignment(horizontal='center', vertical='center')
-    left_align = Alignment(horizontal='left', vertical='center')
+    # 4. Stilovi (named styles, registrovani jednom po workbook-u)
+    register_styles(wb, ["wizz_title", "wizz_header", "wizz_cell_center", "wizz_cell_left"])
 
     # 5. Kreiranje sheet-a za svaki dan u mjesecu (ili jedan dan)
     num_days = calendar.monthrange(year, month)[1]
@@ -307,8 +257,7 @@ def generate_wizzair_performance(year: int, month: int, day: int = None, output_
         create_merged_cell(
             ws, 1, 'A', 'U',
             "WIZZ Air Daily Performance Table",
-            font=title_font,
-            alignment=center_align
+            style="wizz_title"
         )
 
         # Header - Row 2: Column headers
@@ -326,10 +275,7 @@ def generate_wizzair_performance(year: int, month: int, day: int = None, output_
         for col_idx, header_text in enumerate(headers, start=1):
             cell = ws.cell(row=2, column=col_idx)
             cell.value = header_text
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = center_align
+            cell.style = "wizz_header"
 
         # Popuni podatke za ovaj dan
         day_flights = flights_by_day.get(day, [])
@@ -351,8 +297,8 @@ def generate_wizzair_performance(year: int, month: int, day: int = None, output_
             # Calculate total delay based on door close time
             total_delay_minutes = calculate_delay_minutes(std_local, dct_local)
 
-            # Get delays from database
-            delays = get_flight_delays(flight['id'])
+            # Delays pre-loaded for the whole period
+            delays = delays_by_flight.get(flight['id'], [])
 
             # Filter only departure delays for this report
             dep_delays = [d for d in delays if d['phase'] == 'DEP']
@@ -395,13 +341,9 @@ def generate_wizzair_performance(year: int, month: int, day: int = None, output_
 
             # Apply styles
             for col in range(1, 22):
-                cell = ws.cell(row=row_idx, column=col)
-                cell.font = regular_font
-                cell.border = border
-                if col in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 15, 16, 18, 19, 21]:
-                    cell.alignment = center_align
-                else:
-                    cell.alignment = left_align
+                ws.cell(row=row_idx, column=col).style = (
+                    "wizz_cell_center" if col in CENTERED_COLUMNS else "wizz_cell_left"
+                )
 
             row_idx += 1
             flight_nr += 1
@@ -3,12 +3,43 @@
 import openpyxl
 import os
 import sys
-import re
 from datetime import datetime
 from prisma import Prisma
 import asyncio
 
+import passenger_parser
+from ingest_manifest import (
+    IngestManifest,
+    cached_sheet,
+    code_version,
+    entry_records,
+    file_entry,
+    file_unchanged,
+    sheet_fingerprints,
+)
+from passenger_parser import parse_passengers
+
 STATS_DIR = "/Users/emir_mw/stats/STATS/2025/Dnevni izvještaji"
+MANIFEST_FILE = os.path.join('output', '2025-import-manifest.json')
+
+# --bulk: broj redova po multi-row INSERT-u
+BULK_CHUNK_SIZE = 1000
+
+# Flight nema prirodni jedinstveni ključ, pa INSERT nema ON CONFLICT: ponovno
+# pokretanje je sigurno samo zato što se letovi prethodnog importa promijenjenih
+# sheet-ova prvo brišu po id-jevima iz ingest manifesta
+FLIGHT_INSERT_SQL = '''
+    INSERT INTO "Flight" (
+        id, date, "airlineId", route, registration, "aircraftTypeId", "operationTypeId",
+        "departureAirportId", "arrivalAirportId", "arrivalPassengers", "arrivalInfants",
+        "dataSource", "importedFile", "isVerified", "createdAt", "updatedAt"
+    ) VALUES %s
+    RETURNING id
+'''
+FLIGHT_INSERT_TEMPLATE = (
+    "(gen_random_uuid()::text, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, "
+    "'EXCEL_IMPORT_2025', %s, false, now(), now())"
+)
 
 # Map Excel operation types to database codes
 OPERATION_TYPE_MAP = {
@@ -25,28 +56,6 @@ OPERATION_TYPE_MAP = {
     'MILITARY': 'MILITARY',
 }
 
-def parse_passengers(value):
-    """Parse passenger string like '165+6 INF' or '110' or '-'"""
-    if not value or value == '-' or value == 'N/A':
-        return None
-
-    str_val = str(value).strip()
-
-    # Pattern: "110+6 INF" or "110+6"
-    match = re.match(r'^(\d+)\s*\+\s*(\d+)', str_val)
-    if match:
-        adults = int(match.group(1))
-        infants = int(match.group(2))
-        return {'adults': adults, 'infants': infants, 'total': adults + infants}
-
-    # Pattern: just a number "110"
-    match = re.match(r'^(\d+)$', str_val)
-    if match:
-        adults = int(match.group(1))
-        return {'adults': adults, 'infants': 0, 'total': adults}
-
-    return None
-
 def parse_route(route):
     """Parse route like 'TZL-AYT' and return [departure, arrival]"""
     if not route or route == '-' or route == 'N/A':
@@ -86,154 +95,519 @@ async def get_or_create_airport(prisma, iata_code):
 
     return airport.id
 
-async def import_month(prisma, month_folder, dry_run=False):
-    """Import one month of flight data"""
-    month_path = os.path.join(STATS_DIR, month_folder)
+async def import_sheet(prisma, ws, source_file, dry_run=False, flight_ids=None):
+    """
+    Import one day-sheet.
+    Created flight ids are appended to flight_ids as each flight is created.
+    Returns (created flight ids, flight count, error count).
+    """
+    if flight_ids is None:
+        flight_ids = []
+    flight_count = 0
+    error_count = 0
+
+    for i, row in enumerate(ws.iter_rows(values_only=True), 1):
+        # Skip header
+        if i == 1:
+            continue
+
+        # Skip empty rows
+        if not row[0]:
+            continue
+
+        try:
+            # Extract data from row
+            # [0] datum, [1] kompanija, [2] ruta, [3] tip a/c, [4] reg, [5] tip OPER
+            date_value = row[0]
+            airline_name = row[1]
+            route_str = row[2]
+            aircraft_model = row[3]
+            registration = row[4]
+            operation_type_str = row[5]
+            passengers_str = row[6] if len(row) > 6 else None
+
+            # Parse date
+            if isinstance(date_value, datetime):
+                flight_date = date_value
+            else:
+                try:
+                    flight_date = datetime.strptime(str(date_value), '%Y-%m-%d')
+                except:
+                    print(f"   ⚠️  Invalid date: {date_value}")
+                    error_count += 1
+                    continue
 
-    # Find Excel file
+            # Find airline
+            airline = await prisma.airline.find_first(
+                where={'name': str(airline_name).strip().upper()}
+            )
+
+            if not airline:
+                print(f"   ⚠️  Airline not found: {airline_name}")
+                error_count += 1
+                continue
+
+            # Parse route
+            route = parse_route(str(route_str))
+            if not route:
+                print(f"   ⚠️  Invalid route: {route_str}")
+                error_count += 1
+                continue
+
+            # Get or create airports
+            departure_airport_id = await get_or_create_airport(prisma, route['departure'])
+            arrival_airport_id = await get_or_create_airport(prisma, route['arrival'])
+
+            # Find aircraft type
+            aircraft_type = await prisma.aircrafttype.find_first(
+                where={'model': str(aircraft_model).strip()}
+            )
+
+            if not aircraft_type:
+                print(f"   ⚠️  Aircraft type not found: {aircraft_model}")
+                error_count += 1
+                continue
+
+            # Get operation type
+            operation_type_code = map_operation_type(operation_type_str)
+            operation_type = await prisma.operationtype.find_unique(
+                where={'code': operation_type_code}
+            )
+
+            if not operation_type:
+                print(f"   ⚠️  Operation type not found: {operation_type_code}")
+                error_count += 1
+                continue
+
+            # Parse passengers
+            passengers = parse_passengers(passengers_str)
+
+            if not dry_run:
+                # Create flight record
+                flight = await prisma.flight.create(data={
+                    'date': flight_date,
+                    'airlineId': airline.id,
+                    'route': route_str,
+                    'registration': str(registration or ''),
+                    'aircraftTypeId': aircraft_type.id,
+                    'operationTypeId': operation_type.id,
+                    'departureAirportId': departure_airport_id,
+                    'arrivalAirportId': arrival_airport_id,
+
+                    # Passenger data
+                    'arrivalPassengers': passengers[0] if passengers else None,
+                    'arrivalInfants': passengers[1] if passengers else None,
+
+                    # Metadata
+                    'dataSource': 'EXCEL_IMPORT_2025',
+                    'importedFile': source_file,
+                    'isVerified': False,
+                })
+                flight_ids.append(flight.id)
+
+            flight_count += 1
+
+        except Exception as e:
+            print(f"   ❌ Error importing row {i}: {str(e)}")
+            error_count += 1
+
+    return flight_ids, flight_count, error_count
+
+def find_month_file(month_folder):
+    """Path of the month's daily traffic report workbook, or None"""
+    month_path = os.path.join(STATS_DIR, month_folder)
     files = [
         f for f in os.listdir(month_path)
         if 'Dnevni izvještaj o saobraćaju' in f and f.endswith('.xlsx')
     ]
-
-    if not files:
+    return os.path.join(month_path, files[0]) if files else None
+
+def sheet_record(fingerprint, flight_ids, error_count):
+    """Manifest record of an imported sheet; a sheet with row errors is never reused from the manifest"""
+    record = {'fingerprint': fingerprint, 'records': flight_ids}
+    if error_count:
+        record['errors'] = error_count
+    return record
+
+async def import_month(prisma, month_folder, dry_run=False, manifest=None):
+    """
+    Import one month of flight data.
+
+    With an ingest manifest, an unchanged workbook is skipped, and in a
+    changed one only new/changed sheets are imported; flights created from
+    the previous version of a changed (or removed) sheet are deleted first.
+    The manifest entry is updated as each flight is created, so a failure
+    later in the month does not lose track of flights already in the database.
+    """
+    file_path = find_month_file(month_folder)
+
+    if not file_path:
         print(f"   ⚠️  No Excel file found in {month_folder}")
         return {'success': False, 'count': 0, 'errors': 0}
 
-    file_path = os.path.join(month_path, files[0])
+    source_file = os.path.basename(file_path)
+    previous = manifest.get(file_path) if manifest else None
+    reusable = manifest.reusable(file_path) if manifest else None
 
     try:
         print(f"\n📊 {month_folder}:")
-        print(f"   File: {files[0]}")
+        print(f"   File: {source_file}")
+
+        if file_unchanged(reusable, file_path):
+            print("   ⏭️  Unchanged since last import")
+            return {'success': True, 'count': 0, 'errors': 0}
 
+        fingerprints = sheet_fingerprints(file_path)
         wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        sheet_names = wb.sheetnames
         flight_count = 0
         error_count = 0
+        skipped_sheets = 0
+
+        # In-progress entry: sheets not imported yet keep their old ids without a
+        # fingerprint (so they are re-imported after a failure), imported sheets
+        # get their new ids as the flights are created
+        sheets = {
+            sheet_name: {'fingerprint': None, 'records': sheet['records']}
+            for sheet_name, sheet in (previous['sheets'].items() if previous else ())
+        }
+        if manifest is not None and not dry_run:
+            manifest.set(file_path, {'sheets': sheets})
 
         # Iterate through all sheets (days)
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
+        for sheet_name in sheet_names:
+            fingerprint = fingerprints.get(sheet_name)
+            flight_ids = cached_sheet(reusable, sheet_name, fingerprint)
+
+            if flight_ids is not None:
+                skipped_sheets += 1
+                sheets[sheet_name] = sheet_record(fingerprint, flight_ids, 0)
+                continue
+
+            # New or changed sheet: remove flights from its previous import first
+            old_ids = sheets.get(sheet_name, {}).get('records', [])
+            if old_ids and not dry_run:
+                await prisma.flight.delete_many(where={'id': {'in': old_ids}})
+
+            sheets[sheet_name] = {'fingerprint': None, 'records': []}
+            flight_ids, sheet_flights, sheet_errors = await import_sheet(
+                prisma, wb[sheet_name], source_file, dry_run, sheets[sheet_name]['records']
+            )
+            sheets[sheet_name] = sheet_record(fingerprint, flight_ids, sheet_errors)
+            flight_count += sheet_flights
+            error_count += sheet_errors
 
-            for i, row in enumerate(ws.iter_rows(values_only=True), 1):
-                # Skip header
-                if i == 1:
-                    continue
+        wb.close()
 
-                # Skip empty rows
-                if not row[0]:
-                    continue
+        # Sheets removed from the workbook: their flights go as well
+        for sheet_name in [name for name in sheets if name not in sheet_names]:
+            if sheets[sheet_name]['records'] and not dry_run:
+                await prisma.flight.delete_many(where={'id': {'in': sheets[sheet_name]['records']}})
+            del sheets[sheet_name]
 
+        status = '(DRY RUN)' if dry_run else ''
+        print(f"   ✅ Imported {flight_count} flights {status}")
+        if skipped_sheets > 0:
+            print(f"   ⏭️  {skipped_sheets} unchanged sheets skipped")
+        if error_count > 0:
+            print(f"   ⚠️  {error_count} errors (those sheets are imported again on the next run)")
+
+        if manifest is not None and not dry_run:
+            manifest.set(file_path, file_entry(file_path, {name: sheets[name] for name in sheet_names}))
+
+        return {'success': True, 'count': flight_count, 'errors': error_count}
+
+    except Exception as e:
+        print(f"   ❌ Error: {str(e)}")
+        return {'success': False, 'count': 0, 'errors': 1}
+
+class BulkLookups:
+    """
+    Airlines, aircraft types, operation types and airports for --bulk mode,
+    loaded with one query per table instead of one lookup per row.
+    """
+
+    def __init__(self):
+        from report_db import fetch_all
+
+        self.airlines = {}
+        for row in fetch_all('SELECT id, name FROM "Airline" ORDER BY "createdAt"'):
+            self.airlines.setdefault(row['name'], row['id'])
+        self.aircraft_types = {
+            row['model']: row['id'] for row in fetch_all('SELECT id, model FROM "AircraftType"')
+        }
+        self.operation_types = {
+            row['code']: row['id'] for row in fetch_all('SELECT id, code FROM "OperationType"')
+        }
+        self.airports = {
+            row['iataCode']: row['id'] for row in fetch_all('SELECT id, "iataCode" FROM "Airport"')
+        }
+
+    def create_missing_airports(self, conn, iata_codes):
+        """
+        Create all unknown airports with one multi-row INSERT (same placeholders as get_or_create_airport).
+
+        Returns {iataCode: id} of the created airports without caching them:
+        the rows exist only once conn's transaction commits, so the caller
+        merges them into self.airports after that (see import_month_bulk).
+        """
+        from psycopg2.extras import execute_values
+
+        missing = sorted(set(iata_codes) - set(self.airports))
+        if not missing:
+            return {}
+
+        with conn.cursor() as cursor:
+            execute_values(
+                cursor,
+                '''
+                INSERT INTO "Airport" (id, "iataCode", name, country, "createdAt", "updatedAt")
+                VALUES %s
+                ON CONFLICT ("iataCode") DO NOTHING
+                ''',
+                [(code, code) for code in missing],
+                template="(gen_random_uuid()::text, %s, %s, 'Unknown', now(), now())",
+            )
+            # Re-read so airports created concurrently (ON CONFLICT) also get their id
+            cursor.execute(
+                'SELECT id, "iataCode" FROM "Airport" WHERE "iataCode" = ANY(%s)', (missing,)
+            )
+            return {row['iataCode']: row['id'] for row in cursor.fetchall()}
+
+
+def parse_sheet_rows(ws, lookups):
+    """
+    Parse one day-sheet for --bulk mode without touching the database.
+    Returns (rows, error count); airport ids are resolved later, so each row
+    keeps the departure/arrival IATA codes.
+    """
+    rows = []
+    error_count = 0
+
+    for i, row in enumerate(ws.iter_rows(values_only=True), 1):
+        # Skip header and empty rows
+        if i == 1 or not row[0]:
+            continue
+
+        try:
+            date_value = row[0]
+            airline_name = row[1]
+            route_str = row[2]
+            aircraft_model = row[3]
+            registration = row[4]
+            operation_type_str = row[5]
+            passengers_str = row[6] if len(row) > 6 else None
+
+            if isinstance(date_value, datetime):
+                flight_date = date_value
+            else:
                 try:
-                    # Extract data from row
-                    # [0] datum, [1] kompanija, [2] ruta, [3] tip a/c, [4] reg, [5] tip OPER
-                    date_value = row[0]
-                    airline_name = row[1]
-                    route_str = row[2]
-                    aircraft_model = row[3]
-                    registration = row[4]
-                    operation_type_str = row[5]
-                    passengers_str = row[6] if len(row) > 6 else None
-
-                    # Parse date
-                    if isinstance(date_value, datetime):
-                        flight_date = date_value
-                    else:
-                        try:
-                            flight_date = datetime.strptime(str(date_value), '%Y-%m-%d')
-                        except:
-                            print(f"   ⚠️  Invalid date: {date_value}")
-                            error_count += 1
-                            continue
-
-                    # Find airline
-                    airline = await prisma.airline.find_first(
-                        where={'name': str(airline_name).strip().upper()}
-                    )
-
-                    if not airline:
-                        print(f"   ⚠️  Airline not found: {airline_name}")
-                        error_count += 1
-                        continue
-
-                    # Parse route
-                    route = parse_route(str(route_str))
-                    if not route:
-                        print(f"   ⚠️  Invalid route: {route_str}")
-                        error_count += 1
-                        continue
-
-                    # Get or create airports
-                    departure_airport_id = await get_or_create_airport(prisma, route['departure'])
-                    arrival_airport_id = await get_or_create_airport(prisma, route['arrival'])
-
-                    # Find aircraft type
-                    aircraft_type = await prisma.aircrafttype.find_first(
-                        where={'model': str(aircraft_model).strip()}
-                    )
-
-                    if not aircraft_type:
-                        print(f"   ⚠️  Aircraft type not found: {aircraft_model}")
-                        error_count += 1
-                        continue
-
-                    # Get operation type
-                    operation_type_code = map_operation_type(operation_type_str)
-                    operation_type = await prisma.operationtype.find_unique(
-                        where={'code': operation_type_code}
-                    )
-
-                    if not operation_type:
-                        print(f"   ⚠️  Operation type not found: {operation_type_code}")
-                        error_count += 1
-                        continue
-
-                    # Parse passengers
-                    passengers = parse_passengers(passengers_str)
-
-                    if not dry_run:
-                        # Create flight record
-                        await prisma.flight.create(data={
-                            'date': flight_date,
-                            'airlineId': airline.id,
-                            'route': route_str,
-                            'registration': str(registration or ''),
-                            'aircraftTypeId': aircraft_type.id,
-                            'operationTypeId': operation_type.id,
-                            'departureAirportId': departure_airport_id,
-                            'arrivalAirportId': arrival_airport_id,
-
-                            # Passenger data
-                            'arrivalPassengers': passengers['adults'] if passengers else None,
-                            'arrivalInfants': passengers['infants'] if passengers else None,
-
-                            # Metadata
-                            'dataSource': 'EXCEL_IMPORT_2025',
-                            'importedFile': files[0],
-                            'isVerified': False,
-                        })
-
-                    flight_count += 1
-
-                except Exception as e:
-                    print(f"   ❌ Error importing row {i}: {str(e)}")
+                    flight_date = datetime.strptime(str(date_value), '%Y-%m-%d')
+                except ValueError:
+                    print(f"   ⚠️  Invalid date: {date_value}")
                     error_count += 1
+                    continue
+
+            airline_id = lookups.airlines.get(str(airline_name).strip().upper())
+            if not airline_id:
+                print(f"   ⚠️  Airline not found: {airline_name}")
+                error_count += 1
+                continue
+
+            route = parse_route(str(route_str))
+            if not route:
+                print(f"   ⚠️  Invalid route: {route_str}")
+                error_count += 1
+                continue
+
+            aircraft_type_id = lookups.aircraft_types.get(str(aircraft_model).strip())
+            if not aircraft_type_id:
+                print(f"   ⚠️  Aircraft type not found: {aircraft_model}")
+                error_count += 1
+                continue
+
+            operation_type_code = map_operation_type(operation_type_str)
+            operation_type_id = lookups.operation_types.get(operation_type_code)
+            if not operation_type_id:
+                print(f"   ⚠️  Operation type not found: {operation_type_code}")
+                error_count += 1
+                continue
+
+            passengers = parse_passengers(passengers_str)
+            rows.append((
+                flight_date, airline_id, route_str, str(registration or ''),
+                aircraft_type_id, operation_type_id, route['departure'], route['arrival'],
+                passengers[0] if passengers else None,
+                passengers[1] if passengers else None,
+            ))
+
+        except Exception as e:
+            print(f"   ❌ Error importing row {i}: {str(e)}")
+            error_count += 1
+
+    return rows, error_count
+
+
+def insert_flights(conn, rows, airports, source_file):
+    """
+    Multi-row INSERT of parsed rows in chunks of BULK_CHUNK_SIZE; returns created flight ids.
+    airports maps IATA codes to airport ids (cached plus those created in this transaction).
+    """
+    from psycopg2.extras import execute_values
+
+    values = [
+        (
+            flight_date, airline_id, route_str, registration, aircraft_type_id, operation_type_id,
+            airports[departure], airports[arrival], adults, infants, source_file,
+        )
+        for (flight_date, airline_id, route_str, registration, aircraft_type_id, operation_type_id,
+             departure, arrival, adults, infants) in rows
+    ]
+
+    with conn.cursor() as cursor:
+        created = execute_values(
+            cursor, FLIGHT_INSERT_SQL, values,
+            template=FLIGHT_INSERT_TEMPLATE, page_size=BULK_CHUNK_SIZE, fetch=True,
+        )
+    return [row['id'] for row in created]
+
+
+def import_month_bulk(month_folder, lookups, dry_run=False, manifest=None):
+    """
+    Bulk variant of import_month.
+
+    All changed sheets of the month are parsed first, missing airports are
+    created in one batch, and the month's deletes (previous import of changed
+    sheets) and flight inserts run in a single transaction.
+    """
+    from report_db import get_connection
+
+    file_path = find_month_file(month_folder)
+
+    if not file_path:
+        print(f"   ⚠️  No Excel file found in {month_folder}")
+        return {'success': False, 'count': 0, 'errors': 0}
+
+    source_file = os.path.basename(file_path)
+    previous = manifest.get(file_path) if manifest else None
+    reusable = manifest.reusable(file_path) if manifest else None
+
+    try:
+        print(f"\n📊 {month_folder}:")
+        print(f"   File: {source_file}")
+
+        if file_unchanged(reusable, file_path):
+            print("   ⏭️  Unchanged since last import")
+            return {'success': True, 'count': 0, 'errors': 0}
+
+        fingerprints = sheet_fingerprints(file_path)
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        error_count = 0
+        skipped_sheets = 0
+        sheets = {}
+        changed = {}
+
+        for sheet_name in wb.sheetnames:
+            fingerprint = fingerprints.get(sheet_name)
+            flight_ids = cached_sheet(reusable, sheet_name, fingerprint)
+
+            if flight_ids is not None:
+                skipped_sheets += 1
+                sheet_errors = 0
+            else:
+                rows, sheet_errors = parse_sheet_rows(wb[sheet_name], lookups)
+                changed[sheet_name] = rows
+                error_count += sheet_errors
+                flight_ids = []
+
+            sheets[sheet_name] = sheet_record(fingerprint, flight_ids, sheet_errors)
+
+        wb.close()
+
+        flight_count = sum(len(rows) for rows in changed.values())
+        airport_codes = {code for rows in changed.values() for row in rows for code in row[6:8]}
+
+        if dry_run:
+            new_airports = len(airport_codes - set(lookups.airports))
+        else:
+            # Previous import of changed sheets and of sheets removed from the workbook
+            old_ids = [
+                flight_id
+                for sheet_name, sheet in (previous['sheets'].items() if previous else ())
+                if sheet_name in changed or sheet_name not in sheets
+                for flight_id in sheet['records']
+            ]
+
+            # One transaction per month: on any error nothing from this month is written
+            # and the manifest keeps the previous entry
+            with get_connection() as conn:
+                created_airports = lookups.create_missing_airports(conn, airport_codes)
+                airports = {**lookups.airports, **created_airports}
+                if old_ids:
+                    with conn.cursor() as cursor:
+                        cursor.execute('DELETE FROM "Flight" WHERE id = ANY(%s)', (old_ids,))
+                for sheet_name, rows in changed.items():
+                    sheets[sheet_name]['records'] = insert_flights(conn, rows, airports, source_file)
+
+            # Cached only after the commit; on a rollback those airports do not exist
+            lookups.airports.update(created_airports)
+            new_airports = len(created_airports)
 
         status = '(DRY RUN)' if dry_run else ''
         print(f"   ✅ Imported {flight_count} flights {status}")
+        if new_airports > 0:
+            print(f"   ✈️  {new_airports} new airports")
+        if skipped_sheets > 0:
+            print(f"   ⏭️  {skipped_sheets} unchanged sheets skipped")
         if error_count > 0:
-            print(f"   ⚠️  {error_count} errors")
+            print(f"   ⚠️  {error_count} errors (those sheets are imported again on the next run)")
+
+        if manifest is not None and not dry_run:
+            manifest.set(file_path, file_entry(file_path, sheets))
 
-        wb.close()
         return {'success': True, 'count': flight_count, 'errors': error_count}
 
     except Exception as e:
         print(f"   ❌ Error: {str(e)}")
         return {'success': False, 'count': 0, 'errors': 1}
 
+async def delete_tracked_flights(prisma, manifest, file_paths, dry_run=False):
+    """
+    --full: delete every flight the manifest still tracks for file_paths and
+    drop their entries, so the following import starts from a clean slate.
+    """
+    flight_ids = [
+        flight_id
+        for file_path in file_paths
+        for flight_id in entry_records(manifest.get(file_path) or {})
+    ]
+
+    if flight_ids and not dry_run:
+        if prisma is not None:
+            # Chunked: a whole year of ids would exceed the bind parameter limit
+            for start in range(0, len(flight_ids), BULK_CHUNK_SIZE):
+                chunk = flight_ids[start:start + BULK_CHUNK_SIZE]
+                await prisma.flight.delete_many(where={'id': {'in': chunk}})
+        else:
+            from report_db import get_connection
+
+            with get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute('DELETE FROM "Flight" WHERE id = ANY(%s)', (flight_ids,))
+
+    for file_path in file_paths:
+        manifest.pop(file_path)
+    if not dry_run:
+        manifest.save()
+
+    status = ' (DRY RUN)' if dry_run else ''
+    print(f"🗑️  --full: deleted {len(flight_ids)} previously imported flights{status}\n")
+
 async def main():
     """Main function"""
     args = sys.argv[1:]
     dry_run = '--dry-run' in args
+    full_run = '--full' in args  # delete flights tracked by the ingest manifest and import every sheet
+    bulk = '--bulk' in args  # preloaded lookups + multi-row INSERT, one transaction per month
     month_arg = None
 
     for arg in args:
@@ -242,16 +616,40 @@ async def main():
             break
 
     print('🚀 Starting 2025 Flight Import...')
-    print(f"   Mode: {'DRY RUN' if dry_run else 'LIVE IMPORT'}\n")
+    print(f"   Mode: {'DRY RUN' if dry_run else 'LIVE IMPORT'}{' (BULK)' if bulk else ''}\n")
+
+    # Flights depend on the row parsing code, so a change to it re-imports every sheet
+    manifest = IngestManifest(MANIFEST_FILE, code_version(__file__, passenger_parser.__file__))
 
-    prisma = Prisma()
-    await prisma.connect()
+    if bulk:
+        prisma = None
+        lookups = BulkLookups()
+    else:
+        prisma = Prisma()
+        await prisma.connect()
+
+    async def run_month(month_folder):
+        if bulk:
+            result = import_month_bulk(month_folder, lookups, dry_run, manifest)
+        else:
+            result = await import_month(prisma, month_folder, dry_run, manifest)
+        if not dry_run:
+            # Saved after every month, so an interrupted run keeps the ids of committed months
+            manifest.save()
+        return result
 
     try:
+        if full_run:
+            if month_arg:
+                file_paths = [path for path in [find_month_file(month_arg)] if path]
+            else:
+                file_paths = list(manifest.files)
+            await delete_tracked_flights(prisma, manifest, file_paths, dry_run)
+
         if month_arg:
             # Import specific month
             print(f"📅 Importing single month: {month_arg}")
-            await import_month(prisma, month_arg, dry_run)
+            await run_month(month_arg)
         else:
             # Import all months
             month_folders = sorted([
@@ -265,7 +663,7 @@ async def main():
             total_errors = 0
 
             for month_folder in month_folders:
-                result = await import_month(prisma, month_folder, dry_run)
+                result = await run_month(month_folder)
                 total_flights += result['count']
                 total_errors += result.get('errors', 0)
 
@@ -280,7 +678,13 @@ async def main():
         print(f'❌ Fatal error: {str(e)}')
         raise e
     finally:
-        await prisma.disconnect()
+        if not dry_run:
+            manifest.save()
+        if prisma is not None:
+            await prisma.disconnect()
+        else:
+            from report_db import close_pool
+            close_pool()
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -3,6 +3,7 @@
 import { PrismaClient } from '@prisma/client';
 import * as fs from 'fs';
 import * as path from 'path';
+import * as readline from 'readline';
 
 const prisma = new PrismaClient();
 
@@ -153,24 +154,56 @@ async function getOperationTypeId(code: string): Promise<string | null> {
   return null;
 }
 
+// Stream flights from a JSON Lines file (one flight per line, from
+// `extract-flights.py --format jsonl`) without loading the whole file
+async function* readJsonLines(filePath: string): AsyncGenerator<FlightData> {
+  const lines = readline.createInterface({
+    input: fs.createReadStream(filePath, { encoding: 'utf-8' }),
+    crlfDelay: Infinity,
+  });
+
+  for await (const line of lines) {
+    if (line.trim()) {
+      yield JSON.parse(line) as FlightData;
+    }
+  }
+}
+
+// --format json|jsonl (default json)
+function parseFormat(args: string[]): 'json' | 'jsonl' {
+  const index = args.indexOf('--format');
+  const value = index >= 0 ? args[index + 1] : args.find(arg => arg.startsWith('--format='))?.split('=')[1];
+  if (!value || value === 'json') return 'json';
+  if (value === 'jsonl') return 'jsonl';
+  throw new Error(`Unknown --format ${value} (expected json or jsonl)`);
+}
+
 // Map operation type from Excel to database
 function mapOperationType(excelType: string): string {
   const normalized = excelType.trim().toUpperCase();
   return OPERATION_TYPE_MAP[normalized] || 'SCHEDULED';
 }
 
-async function importFlights(dryRun: boolean = false) {
-  console.log('🚀 Starting Flight Import from JSON...');
+async function importFlights(dryRun: boolean = false, format: 'json' | 'jsonl' = 'json') {
+  console.log(`🚀 Starting Flight Import from ${format.toUpperCase()}...`);
   console.log(`   Mode: ${dryRun ? 'DRY RUN' : 'LIVE IMPORT'}\n`);
 
-  // Read JSON file
-  const jsonPath = path.join(process.cwd(), 'output', '2025-flights-data.json');
-  const rawData = fs.readFileSync(jsonPath, 'utf-8');
-  const data: ExtractedData = JSON.parse(rawData);
+  const dataPath = path.join(process.cwd(), 'output', `2025-flights-data.${format}`);
+  let flights: Iterable<FlightData> | AsyncIterable<FlightData>;
 
   console.log(`📊 Data source:`);
-  console.log(`   - Total flights: ${data.totalCount}`);
-  console.log(`   - Extracted at: ${data.extractedAt}\n`);
+  if (format === 'jsonl') {
+    // Stream flights line by line
+    flights = readJsonLines(dataPath);
+    console.log(`   - File: ${dataPath} (streamed)\n`);
+  } else {
+    // Read JSON file
+    const rawData = fs.readFileSync(dataPath, 'utf-8');
+    const data: ExtractedData = JSON.parse(rawData);
+    flights = data.flights;
+    console.log(`   - Total flights: ${data.totalCount}`);
+    console.log(`   - Extracted at: ${data.extractedAt}\n`);
+  }
 
   let importedCount = 0;
   let skippedCount = 0;
@@ -178,8 +211,9 @@ async function importFlights(dryRun: boolean = false) {
 
   console.log('🔄 Processing flights...\n');
 
-  for (let i = 0; i < data.flights.length; i++) {
-    const flight = data.flights[i];
+  let i = -1;
+  for await (const flight of flights) {
+    i++;
 
     try {
       // Get airline
@@ -323,9 +357,10 @@ async function importFlights(dryRun: boolean = false) {
 async function main() {
   const args = process.argv.slice(2);
   const dryRun = args.includes('--dry-run');
+  const format = parseFormat(args);
 
   try {
-    await importFlights(dryRun);
+    await importFlights(dryRun, format);
   } catch (error) {
     console.error('❌ Fatal error:', error);
     throw error;
@@ -3,6 +3,7 @@
 import { PrismaClient } from '@prisma/client';
 import * as fs from 'fs';
 import * as path from 'path';
+import * as readline from 'readline';
 
 const prisma = new PrismaClient();
 
@@ -152,31 +153,63 @@ async function getOperationTypeId(code: string): Promise<string | null> {
   return null;
 }
 
+// Stream flights from a JSON Lines file (one flight per line, from
+// `extract-flights.py --format jsonl`) without loading the whole file
+async function* readJsonLines(filePath: string): AsyncGenerator<FlightData> {
+  const lines = readline.createInterface({
+    input: fs.createReadStream(filePath, { encoding: 'utf-8' }),
+    crlfDelay: Infinity,
+  });
+
+  for await (const line of lines) {
+    if (line.trim()) {
+      yield JSON.parse(line) as FlightData;
+    }
+  }
+}
+
+// --format json|jsonl (default json)
+function parseFormat(args: string[]): 'json' | 'jsonl' {
+  const index = args.indexOf('--format');
+  const value = index >= 0 ? args[index + 1] : args.find(arg => arg.startsWith('--format='))?.split('=')[1];
+  if (!value || value === 'json') return 'json';
+  if (value === 'jsonl') return 'jsonl';
+  throw new Error(`Unknown --format ${value} (expected json or jsonl)`);
+}
+
 // Map operation type from Excel to database
 function mapOperationType(excelType: string): string {
   const normalized = excelType.trim().toUpperCase();
   return OPERATION_TYPE_MAP[normalized] || 'SCHEDULED';
 }
 
-async function importFlights(year: string, dryRun: boolean = false) {
+async function importFlights(year: string, dryRun: boolean = false, format: 'json' | 'jsonl' = 'json') {
   console.log(`🚀 Starting Flight Import for ${year}...`);
   console.log(`   Mode: ${dryRun ? 'DRY RUN' : 'LIVE IMPORT'}\n`);
 
-  // Read JSON file
-  const jsonPath = path.join(process.cwd(), 'output', `${year}-flights-data.json`);
+  // Read JSON / JSON Lines file
+  const dataPath = path.join(process.cwd(), 'output', `${year}-flights-data.${format}`);
 
-  if (!fs.existsSync(jsonPath)) {
-    console.error(`❌ File not found: ${jsonPath}`);
-    console.log(`\n💡 Run extraction first: python3 scripts/extract-flights.py ${year}`);
+  if (!fs.existsSync(dataPath)) {
+    console.error(`❌ File not found: ${dataPath}`);
+    console.log(`\n💡 Run extraction first: python3 scripts/extract-flights.py ${year}${format === 'jsonl' ? ' --format jsonl' : ''}`);
     process.exit(1);
   }
 
-  const rawData = fs.readFileSync(jsonPath, 'utf-8');
-  const data: ExtractedData = JSON.parse(rawData);
+  let flights: Iterable<FlightData> | AsyncIterable<FlightData>;
 
   console.log(`📊 Data source:`);
-  console.log(`   - Total flights: ${data.totalCount}`);
-  console.log(`   - Extracted at: ${data.extractedAt}\n`);
+  if (format === 'jsonl') {
+    // Stream flights line by line
+    flights = readJsonLines(dataPath);
+    console.log(`   - File: ${dataPath} (streamed)\n`);
+  } else {
+    const rawData = fs.readFileSync(dataPath, 'utf-8');
+    const data: ExtractedData = JSON.parse(rawData);
+    flights = data.flights;
+    console.log(`   - Total flights: ${data.totalCount}`);
+    console.log(`   - Extracted at: ${data.extractedAt}\n`);
+  }
 
   let importedCount = 0;
   let skippedCount = 0;
@@ -184,8 +217,9 @@ async function importFlights(year: string, dryRun: boolean = false) {
 
   console.log('🔄 Processing flights...\n');
 
-  for (let i = 0; i < data.flights.length; i++) {
-    const flight = data.flights[i];
+  let i = -1;
+  for await (const flight of flights) {
+    i++;
 
     try {
       const airlineId = await getAirlineId(flight.airline);
@@ -308,19 +342,21 @@ async function main() {
   const args = process.argv.slice(2);
 
   if (args.length === 0 || args[0] === '--help') {
-    console.log('Usage: npx tsx scripts/import-year.ts <year> [--dry-run]');
+    console.log('Usage: npx tsx scripts/import-year.ts <year> [--dry-run] [--format json|jsonl]');
     console.log('');
     console.log('Examples:');
     console.log('  npx tsx scripts/import-year.ts 2024');
     console.log('  npx tsx scripts/import-year.ts 2023 --dry-run');
+    console.log('  npx tsx scripts/import-year.ts 2025 --format jsonl');
     process.exit(0);
   }
 
   const year = args[0];
   const dryRun = args.includes('--dry-run');
+  const format = parseFormat(args);
 
   try {
-    await importFlights(year, dryRun);
+    await importFlights(year, dryRun, format);
   } catch (error) {
     console.error('❌ Fatal error:', error);
     throw error;
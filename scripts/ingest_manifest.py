@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Ingestion manifest for incremental Excel extraction/import
+
+Za svaki workbook pamti putanju, veličinu, mtime i sha256, a za svaki sheet
+fingerprint sadržaja i zapise koje je taj sheet proizveo. Ponovno pokretanje
+tako parsira samo promijenjene fajlove, a unutar promijenjenog fajla samo
+promijenjene sheet-ove; ostali zapisi se preuzimaju iz manifesta.
+
+Fingerprint sheet-a se računa direktno iz .xlsx arhive (sirovi XML sheet-a +
+shared strings na koje sheet referencira), bez openpyxl parsiranja.
+
+Zapisi zavise i od koda koji ih je proizveo: svaki entry nosi codeVersion
+(sha256 izvornog koda parsera, vidi code_version), a entry zapisan drugom
+verzijom koda se ne preuzima (IngestManifest.reusable). Sheet sa greškama u
+redovima ("errors") se nikad ne preuzima iz manifesta.
+
+Format manifesta:
+    {
+      "version": 1,
+      "files": {
+        "<apsolutna putanja>": {
+          "size": 123, "mtime": 1700000000.0, "sha256": "...", "codeVersion": "...",
+          "sheets": {"<sheet>": {"fingerprint": "...", "records": [...], "errors": 2}}
+        }
+      }
+    }
+"""
+import hashlib
+import json
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+MANIFEST_VERSION = 1
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+# <c r="B2" t="s"><v>12</v></c> - ćelija koja referencira shared string 12
+_SHARED_STRING_REF = re.compile(rb'<(?:\w+:)?c\b[^>]*\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)<')
+
+
+def file_sha256(file_path, chunk_size=1024 * 1024):
+    """sha256 sadržaja fajla"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_version(*paths):
+    """
+    Verzija koda parsera: sha256 izvornih fajlova (npr. __file__ skripte i
+    modula čiji izlaz završava u zapisima). Svaka izmjena tih fajlova
+    invalidira zapise u manifestu.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def _shared_strings(archive):
+    """Lista shared string-ova (rich text se spaja u jedan string)"""
+    try:
+        root = ET.fromstring(archive.read('xl/sharedStrings.xml'))
+    except KeyError:
+        return []
+    return [
+        ''.join(t.text or '' for t in si.iter(f'{{{MAIN_NS}}}t'))
+        for si in root.iter(f'{{{MAIN_NS}}}si')
+    ]
+
+
+def sheet_fingerprints(file_path):
+    """
+    Fingerprint po sheet-u: sha256 XML-a sheet-a + shared string-ova koje koristi.
+
+    Vraća {sheet_name: fingerprint}; ako se struktura arhive ne može pročitati,
+    vraća {} (tada se svi sheet-ovi tretiraju kao promijenjeni).
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+            rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+            targets = {rel.get('Id'): rel.get('Target') for rel in rels}
+            shared = _shared_strings(archive)
+
+            fingerprints = {}
+            for sheet in workbook.iter(f'{{{MAIN_NS}}}sheet'):
+                target = targets.get(sheet.get(f'{{{REL_NS}}}id'))
+                if not target:
+                    continue
+                xml_path = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+                data = archive.read(xml_path)
+
+                digest = hashlib.sha256(data)
+                for index in sorted({int(i) for i in _SHARED_STRING_REF.findall(data)}):
+                    value = shared[index] if index < len(shared) else ''
+                    digest.update(f'\x00{index}\x00{value}'.encode('utf-8'))
+                fingerprints[sheet.get('name')] = digest.hexdigest()
+            return fingerprints
+    except (KeyError, zipfile.BadZipFile, ET.ParseError):
+        return {}
+
+
+def file_unchanged(entry, file_path):
+    """
+    Da li je workbook isti kao u manifest entry-ju.
+
+    Ista veličina i mtime -> nepromijenjen bez čitanja fajla; ako se promijenio
+    samo mtime (npr. kopiranje), provjerava se sha256 i entry se osvježava.
+    Workbook čiji je neki sheet imao greške se uvijek obrađuje ponovo.
+    """
+    if not entry:
+        return False
+    if any(sheet.get('errors') for sheet in entry.get('sheets', {}).values()):
+        return False
+
+    stat = os.stat(file_path)
+    if entry.get('size') != stat.st_size:
+        return False
+    if entry.get('mtime') == stat.st_mtime:
+        return True
+    if entry.get('sha256') == file_sha256(file_path):
+        entry['mtime'] = stat.st_mtime
+        return True
+    return False
+
+
+def cached_sheet(entry, sheet_name, fingerprint):
+    """Zapisi sheet-a iz prethodnog pokretanja, ako se fingerprint nije promijenio i sheet nije imao grešaka"""
+    if not entry or not fingerprint:
+        return None
+    sheet = entry.get('sheets', {}).get(sheet_name)
+    if sheet and sheet.get('fingerprint') == fingerprint and not sheet.get('errors'):
+        return sheet['records']
+    return None
+
+
+def entry_records(entry):
+    """Svi zapisi workbook-a, redom po sheet-ovima"""
+    return [record for sheet in entry.get('sheets', {}).values() for record in sheet['records']]
+
+
+def file_entry(file_path, sheets):
+    """
+    Novi manifest entry za workbook.
+
+    Args:
+        sheets: {sheet_name: {'fingerprint': ..., 'records': [...]}} u redoslijedu sheet-ova;
+            sheet sa greškama u redovima dobija i 'errors': broj grešaka
+    """
+    stat = os.stat(file_path)
+    return {
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'sha256': file_sha256(file_path),
+        'sheets': sheets,
+    }
+
+
+class IngestManifest:
+    """
+    Manifest sačuvan kao JSON fajl; entry-ji su indeksirani apsolutnom putanjom workbook-a.
+
+    code_version (vidi code_version()) se upisuje u svaki entry pri set();
+    reusable() vraća samo entry-je zapisane istom verzijom koda.
+    """
+
+    def __init__(self, path, code_version=None):
+        self.path = path
+        self.code_version = code_version
+        self.files = {}
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.files = data.get('files', {})
+
+    def get(self, file_path):
+        """Entry workbook-a bez obzira na verziju koda (npr. za brisanje starih zapisa)"""
+        return self.files.get(os.path.abspath(file_path))
+
+    def reusable(self, file_path):
+        """Entry čiji se zapisi smiju preuzeti, tj. zapisan trenutnom verzijom koda"""
+        entry = self.get(file_path)
+        if entry and entry.get('codeVersion') == self.code_version:
+            return entry
+        return None
+
+    def set(self, file_path, entry):
+        entry['codeVersion'] = self.code_version
+        self.files[os.path.abspath(file_path)] = entry
+
+    def pop(self, file_path):
+        return self.files.pop(os.path.abspath(file_path), None)
+
+    def save(self):
+        """Atomski upis (tmp fajl + rename)"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
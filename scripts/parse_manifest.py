@@ -5,11 +5,31 @@ Manifest Parser for STW Predboarding System
 Parses passenger manifest .txt files from airlines (Wizz Air format)
 Extracts passenger list with boarding information
 Returns JSON for API consumption
+
+Upotreba:
+    python3 parse_manifest.py <file>                  # jedan manifest, JSON (indent=2)
+    python3 parse_manifest.py <file> <file> ...       # batch: JSON Lines, jedan red po manifestu
+    python3 parse_manifest.py <direktorij>            # batch: svi *.txt u direktoriju
+    ls *.txt | python3 parse_manifest.py -            # batch: putanje sa stdin-a
+    python3 parse_manifest.py --jobs 4 <direktorij>   # batch kroz process pool
+    python3 parse_manifest.py <file> --previous <prev.json>   # samo razlike u odnosu na prethodni upload
+
+Batch red: {"file": "<putanja>", "success": true, "data": {...}} - redoslijed
+redova je isti kao redoslijed ulaznih putanja, bez obzira na --jobs.
+
+Sa --previous, <prev.json> je raniji izlaz ovog parsera (ili samo njegov
+"passengerHashes" objekat {passengerId: hash}); umjesto cijele liste putnika
+vraćaju se samo dodani, uklonjeni i promijenjeni putnici (vidi diff_passengers).
 """
 
+import os
 import sys
 import json
 import re
+import hashlib
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -28,17 +48,15 @@ def parse_manifest(file_path):
     }
     """
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
-        # Extract flight info
-        flight_info = extract_flight_info(content)
+        with map_manifest(file_path) as content:
+            # Extract flight info
+            flight_info = extract_flight_info(content)
 
-        # Extract passenger list
-        passengers = extract_passengers(content)
+            # Extract passenger list
+            passengers = extract_passengers(content)
 
-        # Extract summary
-        summary = extract_summary(content)
+            # Extract summary
+            summary = extract_summary(content)
 
         return {
             "success": True,
@@ -55,19 +73,109 @@ def parse_manifest(file_path):
         }
 
 
+# Regex-i su kompajlirani jednom; svaki počinje fiksnim literalom, pa se
+# pretraga počinje od prvog pojavljivanja literala (str.find) umjesto od početka
+FLIGHT_DATE_RE = re.compile(r'Flight Date:\s+(\d{2}\w{3}\d{2})')
+FLIGHT_INFO_RE = re.compile(r'Flight Info:\s+(\w+)\s+(\d+)\s+\w+\s+(\w+)\s+(\w+)')
+TIMES_RE = re.compile(r'Dep\.\s+(\d{2}:\d{2})\s+Arv\.\s+(\d{2}:\d{2})')
+SUMMARY_RE = re.compile(
+    r'Total Confirm Manifested:\s+(\d+)\s+Male:\s+(\d+)\s+Female:\s+(\d+)\s+Child:\s+(\d+)\s+Infant:\s+(\d+)'
+)
+
+# Linije passenger sekcije
+SECTION_START = 'Listed Confirmed Passengers:'
+SECTION_END = 'Total Confirm Manifested:'
+ROUTE_LINE_RE = re.compile(r'\s+(DTM|TZL|[A-Z]{3})[A-Z]{3}\s+\d{2}\w{3}\d{2}')
+MAIN_PASSENGER_RE = re.compile(
+    r'\s{2}([A-Za-z\-\s]+,[A-Za-z\-\s]+?)\s+(i\s+)?([A-Z]{2,5})\s+(\d{2}\w{3}\d{2})?\s+(\w+)?\s+(\w+)?\s+(F)?\s+(\d{1,2}[A-F])?\s*'
+)
+COMPANION_RE = re.compile(
+    r'\s{3,}([A-Za-z\-\s]+,[A-Za-z\-\s]+?)\s+(i\s+)?([A-Z]{2,5})?\s+(\w+)?\s+(F)?\s+(\d{1,2}[A-F])?\s*'
+)
+COMPANION_TITLES = frozenset(('MR', 'MS', 'MRS', 'CHD', 'MSTR', 'MISS'))
+
+# Regex nad mapiranim fajlom se pokreće na prozoru od literala nadalje
+MATCH_WINDOW = 4096
+
+
+@contextmanager
+def map_manifest(file_path):
+    """
+    Manifest kao read-only mmap (bez učitavanja i kopiranja cijelog fajla).
+    Prazan fajl se ne može mapirati, pa se tada dobija prazan string.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield ''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _search_from_literal(pattern, literal, content):
+    """
+    pattern.search(content), ali skeniranje počinje od prvog pojavljivanja literala.
+
+    content je tekst ili mmap (bajtovi); kod mmap-a se literal traži u bajtovima,
+    a regex se pokreće samo nad dekodiranim prozorom od MATCH_WINDOW bajtova.
+    """
+    if isinstance(content, str):
+        pos = content.find(literal)
+        if pos == -1:
+            return None
+        return pattern.search(content, pos)
+
+    literal = literal.encode('ascii')
+    pos = content.find(literal)
+    while pos != -1:
+        # Svaki pattern počinje literalom, pa match može početi samo na literalu
+        match = pattern.match(content[pos:pos + MATCH_WINDOW].decode('utf-8', errors='ignore'))
+        if match:
+            return match
+        pos = content.find(literal, pos + 1)
+    return None
+
+
+def _section_lines(content):
+    """
+    Linije iza "Listed Confirmed Passengers:" (tekst ili mmap), bez '\\n'.
+    Kod mmap-a se linije dekodiraju jedna po jedna, tek kada se zatraže.
+    """
+    if isinstance(content, str):
+        start = content.find(SECTION_START)
+        start = content.find('\n', start) if start != -1 else -1
+        if start != -1:
+            yield from content[start + 1:].split('\n')
+        return
+
+    start = content.find(SECTION_START.encode('ascii'))
+    start = content.find(b'\n', start) if start != -1 else -1
+    if start == -1:
+        return
+    pos = start + 1
+    size = len(content)
+    while True:
+        end = content.find(b'\n', pos)
+        if end == -1:
+            yield content[pos:size].decode('utf-8', errors='ignore')
+            return
+        yield content[pos:end].decode('utf-8', errors='ignore')
+        pos = end + 1
+
+
 def extract_flight_info(content):
     """Extract flight information from header"""
     flight_info = {}
 
     # Extract flight date
     # Format: | Flight Date:  15Nov25
-    date_match = re.search(r'Flight Date:\s+(\d{2}\w{3}\d{2})', content)
+    date_match = _search_from_literal(FLIGHT_DATE_RE, 'Flight Date:', content)
     if date_match:
         flight_info['date'] = date_match.group(1)
 
     # Extract flight number and route
     # Format: | Flight Info:  W6  4298    Open     DTM         TZL  |
-    flight_match = re.search(r'Flight Info:\s+(\w+)\s+(\d+)\s+\w+\s+(\w+)\s+(\w+)', content)
+    flight_match = _search_from_literal(FLIGHT_INFO_RE, 'Flight Info:', content)
     if flight_match:
         airline_code = flight_match.group(1)
         flight_num = flight_match.group(2)
@@ -82,7 +190,7 @@ def extract_flight_info(content):
 
     # Extract departure and arrival times
     # Format: Dep. 10:25  Arv. 12:25
-    times_match = re.search(r'Dep\.\s+(\d{2}:\d{2})\s+Arv\.\s+(\d{2}:\d{2})', content)
+    times_match = _search_from_literal(TIMES_RE, 'Dep.', content)
     if times_match:
         flight_info['departureTime'] = times_match.group(1)
         flight_info['arrivalTime'] = times_match.group(2)
@@ -90,7 +198,49 @@ def extract_flight_info(content):
     return flight_info
 
 
-def extract_passengers(content):
+def _main_passenger(match):
+    name, infant, title, date_confirm, fare_class, passenger_id, flight_status, seat = match.groups()
+    return {
+        'passengerName': name.strip(),
+        'title': title,
+        'isInfant': infant is not None,
+        'confirmationDate': date_confirm,
+        'fareClass': fare_class,
+        'passengerId': passenger_id,
+        'seatNumber': seat,
+        'flightStatus': flight_status
+    }
+
+
+def _companion(match):
+    name, infant, title_match, group4, group5, group6 = match.groups()
+
+    # Title might be missing for companions
+    if title_match in COMPANION_TITLES:
+        title = title_match
+        passenger_id = group4
+        flight_status = group5
+        seat = group6
+    else:
+        # No title, so what we thought was title is actually passenger ID
+        title = 'CHD'  # Default for companions without title
+        passenger_id = title_match
+        flight_status = group4
+        seat = group5
+
+    return {
+        'passengerName': name.strip(),
+        'title': title,
+        'isInfant': infant is not None,
+        'confirmationDate': None,
+        'fareClass': None,
+        'passengerId': passenger_id,
+        'seatNumber': seat,
+        'flightStatus': flight_status
+    }
+
+
+def iter_passengers(content):
     """
     Extract passenger list from manifest
 
@@ -98,125 +248,73 @@ def extract_passengers(content):
       Abazaj,Damir             MR     13Nov25  KREG      TT8U3B01             1C
       Cerni,Kristina        i  MS     07Aug25  BOREG     AKSG8G01            30D
        Cerni,Dino              MR                        AKSG8G02            34F
-    """
-    passengers = []
-
-    # Find the passenger list section
-    lines = content.split('\n')
 
-    in_passenger_section = False
-    current_main_passenger = None
+    Jedan prolaz kroz linije iza "Listed Confirmed Passengers:". Linija se prvo
+    klasifikuje po fiksnom prefiksu (2 razmaka = glavni putnik, 3-4 = companion),
+    a regex se pokreće samo nad kandidatima. Companion se veže za prethodnog
+    glavnog putnika.
 
-    for line in lines:
-        # Start of passenger section
-        if 'Listed Confirmed Passengers:' in line:
-            in_passenger_section = True
-            continue
+    Polja se i dalje čitaju regex-om, a ne isijecanjem fiksnih kolona: da bi
+    rezultat ostao identičan (lazy ime, opcione kolone), isijecanje mora
+    provjeriti svako polje, što je izmjereno sporije od jednog kompajliranog
+    regex-a (~3.6 vs ~3.1 µs po liniji glavnog putnika).
 
-        # End of passenger section (only on "Total Confirm" or final separator)
-        if in_passenger_section:
-            # End when we hit the summary line
-            if 'Total Confirm Manifested:' in line:
-                break
+    content je tekst manifesta ili mmap (map_manifest); putnici se vraćaju
+    lijeno, redom kao u manifestu.
+    """
+    match_main = MAIN_PASSENGER_RE.match
+    match_companion = COMPANION_RE.match
+    match_route = ROUTE_LINE_RE.match
+    has_main_passenger = False
+    found = False
+
+    for line in _section_lines(content):
+        # End when we hit the summary line
+        if SECTION_END in line:
+            break
+
+        if '---' in line and line.lstrip().startswith('---'):
             # Or end on a very long separator line AFTER we've started collecting passengers
-            if line.strip().startswith('---') and len(line.strip()) > 70 and len(passengers) > 0:
+            if found and len(line.strip()) > 70:
                 break
-
-        if not in_passenger_section:
             continue
 
-        # Skip header lines and initial separator
-        if 'Passenger' in line or 'Name (i= INF)' in line:
+        # Klasifikacija po prefiksu: 2 razmaka = glavni putnik, 3-4 = companion;
+        # sve ostalo (prazne linije, naslovi, SSR, route linije) se preskače
+        if line[:2] != '  ':
             continue
-
-        # Skip separator lines at the start of passenger section (before any passengers)
-        if line.strip().startswith('---'):
-            continue
-
-        # Skip SSR lines and route lines
-        if 'SSR(s):' in line or re.match(r'^\s+(DTM|TZL|[A-Z]{3})[A-Z]{3}\s+\d{2}\w{3}\d{2}', line):
+        if line[2:3] != ' ':
+            if ',' not in line[:35]:
+                continue
+            is_main = True
+        elif line[3:5] != '  ' and has_main_passenger and ',' in line:
+            is_main = False
+        else:
             continue
 
-        # Empty line
-        if not line.strip():
+        # Skip header lines, SSR lines and route lines
+        if 'Passenger' in line or 'Name (i= INF)' in line or 'SSR(s):' in line or match_route(line):
             continue
 
-        # Check if this is a passenger line (main or companion)
-        # Main passengers start with exactly 2 spaces
-        if line.startswith('  ') and not line.startswith('   ') and ',' in line[:35]:
-            # This is a main passenger
+        if is_main:
             # Format: "  Name (may have spaces)    Title  Date     FareClass PassID   [F]  Seat"
-            # Example: "  Abazaj,Damir             MR     13Nov25  KREG      TT8U3B01             1C"
-            # Example: "  Abdelwahed,Shehab Moh    MR     12Oct25  KLREG     OHVWSV02   F         9A"
-
-            # Use regex with flexible spacing
-            passenger_match = re.match(
-                r'^\s{2}([A-Za-z\-\s]+,[A-Za-z\-\s]+?)\s+(i\s+)?([A-Z]{2,5})\s+(\d{2}\w{3}\d{2})?\s+(\w+)?\s+(\w+)?\s+(F)?\s+(\d{1,2}[A-F])?\s*',
-                line
-            )
-
-            if passenger_match:
-                name = passenger_match.group(1).strip()
-                is_infant = passenger_match.group(2) is not None
-                title = passenger_match.group(3)
-                date_confirm = passenger_match.group(4)
-                fare_class = passenger_match.group(5)
-                passenger_id = passenger_match.group(6)
-                flight_status = passenger_match.group(7)
-                seat = passenger_match.group(8)
-
-                passenger = {
-                    'passengerName': name,
-                    'title': title,
-                    'isInfant': is_infant,
-                    'confirmationDate': date_confirm,
-                    'fareClass': fare_class,
-                    'passengerId': passenger_id,
-                    'seatNumber': seat,
-                    'flightStatus': flight_status
-                }
-                passengers.append(passenger)
-                current_main_passenger = passenger
-
-        elif line.startswith('   ') and not line.startswith('     ') and ',' in line and current_main_passenger:
-            # This is a companion passenger (starts with 3+ spaces)
+            match = match_main(line)
+            if match:
+                yield _main_passenger(match)
+                has_main_passenger = True
+                found = True
+        else:
+            # Companion ide uz prethodnog glavnog putnika
             # Format: "   Name              Title              PassID      [F]  Seat"
-            companion_match = re.match(
-                r'^\s{3,}([A-Za-z\-\s]+,[A-Za-z\-\s]+?)\s+(i\s+)?([A-Z]{2,5})?\s+(\w+)?\s+(F)?\s+(\d{1,2}[A-F])?\s*',
-                line
-            )
+            match = match_companion(line)
+            if match:
+                yield _companion(match)
+                found = True
+
 
-            if companion_match:
-                name = companion_match.group(1).strip()
-                is_infant = companion_match.group(2) is not None
-                title_match = companion_match.group(3)
-
-                # Title might be missing for companions
-                if title_match and title_match in ['MR', 'MS', 'MRS', 'CHD', 'MSTR', 'MISS']:
-                    title = title_match
-                    passenger_id = companion_match.group(4)
-                    flight_status = companion_match.group(5)
-                    seat = companion_match.group(6)
-                else:
-                    # No title, so what we thought was title is actually passenger ID
-                    title = 'CHD'  # Default for companions without title
-                    passenger_id = title_match
-                    flight_status = companion_match.group(4)
-                    seat = companion_match.group(5)
-
-                companion = {
-                    'passengerName': name,
-                    'title': title,
-                    'isInfant': is_infant,
-                    'confirmationDate': None,
-                    'fareClass': None,
-                    'passengerId': passenger_id,
-                    'seatNumber': seat,
-                    'flightStatus': flight_status
-                }
-                passengers.append(companion)
-
-    return passengers
+def extract_passengers(content):
+    """Lista putnika iz manifesta (vidi iter_passengers)"""
+    return list(iter_passengers(content))
 
 
 def extract_summary(content):
@@ -225,7 +323,7 @@ def extract_summary(content):
 
     # Total passengers
     # Format: Total Confirm Manifested:  241  Male: 147  Female:  80  Child:   6  Infant:   8
-    total_match = re.search(r'Total Confirm Manifested:\s+(\d+)\s+Male:\s+(\d+)\s+Female:\s+(\d+)\s+Child:\s+(\d+)\s+Infant:\s+(\d+)', content)
+    total_match = _search_from_literal(SUMMARY_RE, SECTION_END, content)
     if total_match:
         summary['totalPax'] = int(total_match.group(1))
         summary['male'] = int(total_match.group(2))
@@ -236,22 +334,285 @@ def extract_summary(content):
     return summary
 
 
-if __name__ == '__main__':
-    if len(sys.argv) < 2:
+def passenger_hash(passenger):
+    """Kratki hash svih polja putnika (redoslijed ključeva nije bitan)"""
+    data = json.dumps(passenger, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+def passenger_hashes(passengers):
+    """
+    {ključ: hash} za listu putnika, redom kao u manifestu.
+
+    Ključ je passengerId; putnik bez ID-a dobija "name:<ime>", a ponovljeni
+    ključ sufiks "#2", "#3"... (po redoslijedu pojavljivanja).
+    """
+    hashes = {}
+    for passenger in passengers:
+        base = passenger.get('passengerId') or f"name:{passenger.get('passengerName')}"
+        key = base
+        occurrence = 1
+        while key in hashes:
+            occurrence += 1
+            key = f'{base}#{occurrence}'
+        hashes[key] = passenger_hash(passenger)
+    return hashes
+
+
+def _hash_map(hashes):
+    """{ključ: hash} samo ako su sve vrijednosti stringovi"""
+    if not all(isinstance(digest, str) for digest in hashes.values()):
+        raise ValueError("passenger hashes must map keys to string hashes")
+    return hashes
+
+
+def _passenger_list(passengers):
+    if not all(isinstance(passenger, dict) for passenger in passengers):
+        raise ValueError("passenger list must contain only passenger objects")
+    return passenger_hashes(passengers)
+
+
+def previous_hashes(previous):
+    """
+    {ključ: hash} iz prethodnog rezultata: cijeli izlaz parse_manifest()
+    ({"data": {"passengers": [...]}} ili {"data": {"passengerHashes": {...}}}),
+    lista putnika, ili već gotov {passengerId: hash} objekat.
+
+    Raises:
+        ValueError: za bilo šta drugo (npr. neuspješan rezultat {"success": false, ...})
+    """
+    if isinstance(previous, list):
+        return _passenger_list(previous)
+    if not isinstance(previous, dict):
+        raise ValueError(f"expected a parse result, passenger list or hash map, got {type(previous).__name__}")
+
+    # Rezultat parse_manifest() / parse_manifest_diff()
+    if 'success' in previous or 'data' in previous:
+        if previous.get('success') is False:
+            raise ValueError(f"previous parse failed: {previous.get('error', 'unknown error')}")
+        data = previous.get('data')
+        if not isinstance(data, dict):
+            raise ValueError("parse result has no data object")
+        if isinstance(data.get('passengerHashes'), dict):
+            return _hash_map(data['passengerHashes'])
+        if isinstance(data.get('passengers'), list):
+            return _passenger_list(data['passengers'])
+        raise ValueError("parse result has neither data.passengers nor data.passengerHashes")
+
+    return _hash_map(previous)
+
+
+def diff_passengers(passengers, previous):
+    """
+    Razlika novog manifesta u odnosu na prethodni upload.
+
+    Args:
+        passengers: putnici iz extract_passengers()
+        previous: prethodni rezultat ili hash-evi (vidi previous_hashes)
+
+    Returns:
+        {
+          "added": [putnik, ...],        # ključ ne postoji u prethodnom
+          "changed": [putnik, ...],      # isti ključ, drugačiji hash
+          "removed": [ključ, ...],       # ključ više ne postoji
+          "unchanged": broj
+        }
+    """
+    old = previous_hashes(previous)
+    new = passenger_hashes(passengers)
+
+    added = []
+    changed = []
+    for passenger, (key, digest) in zip(passengers, new.items()):
+        previous_digest = old.get(key)
+        if previous_digest is None:
+            added.append(passenger)
+        elif previous_digest != digest:
+            changed.append(passenger)
+
+    return {
+        "added": added,
+        "changed": changed,
+        "removed": [key for key in old if key not in new],
+        "unchanged": len(new) - len(added) - len(changed),
+    }
+
+
+def parse_manifest_diff(file_path, previous):
+    """
+    parse_manifest() koji umjesto liste putnika vraća samo razlike (diff) i
+    hash-eve svih putnika, koje pozivalac čuva za sljedeći upload.
+    Neispravan previous daje {"success": false, "error": ...}.
+    """
+    try:
+        old = previous_hashes(previous)
+    except ValueError as e:
+        return {"success": False, "error": f"Invalid previous manifest: {e}"}
+
+    result = parse_manifest(file_path)
+    if not result["success"]:
+        return result
+
+    data = result["data"]
+    passengers = data.pop("passengers")
+    data["diff"] = diff_passengers(passengers, old)
+    data["passengerHashes"] = passenger_hashes(passengers)
+    return result
+
+
+def parse_previous(args):
+    """
+    Parse --previous PATH / --previous=PATH (prethodni rezultat za diff).
+    Returns (path ili None, remaining_args).
+    """
+    previous = None
+    remaining = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--previous' and i + 1 < len(args):
+            previous = args[i + 1]
+            i += 2
+            continue
+        if arg.startswith('--previous='):
+            previous = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+        i += 1
+    return previous, remaining
+
+
+MANIFEST_SUFFIX = '.txt'
+
+
+def parse_jobs(args):
+    """
+    Parse --jobs N / --jobs=N (number of parallel processes).
+    Returns (jobs, remaining_args); --jobs 0 means one process per CPU.
+    """
+    jobs = 1
+    remaining = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--jobs' and i + 1 < len(args):
+            jobs = int(args[i + 1])
+            i += 2
+            continue
+        if arg.startswith('--jobs='):
+            jobs = int(arg.split('=', 1)[1])
+        else:
+            remaining.append(arg)
+        i += 1
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return jobs, remaining
+
+
+def expand_paths(args, stdin=None):
+    """
+    Manifest putanje iz argumenata: fajlovi ostaju kakvi jesu, direktorij daje
+    sve *.txt fajlove (sortirano), a '-' čita putanje sa stdin-a (jedna po liniji).
+    """
+    paths = []
+    for arg in args:
+        if arg == '-':
+            paths.extend(line.strip() for line in (stdin or sys.stdin) if line.strip())
+        elif os.path.isdir(arg):
+            paths.extend(
+                str(path) for path in sorted(Path(arg).iterdir())
+                if path.suffix.lower() == MANIFEST_SUFFIX and path.is_file()
+            )
+        else:
+            paths.append(arg)
+    return paths
+
+
+def parse_manifest_file(file_path):
+    """parse_manifest() sa putanjom u rezultatu; nepostojeći fajl je greška tog manifesta"""
+    if not Path(file_path).exists():
+        result = {"success": False, "error": f"File not found: {file_path}"}
+    else:
+        result = parse_manifest(file_path)
+    return {"file": file_path, **result}
+
+
+def iter_manifests(paths, jobs=1):
+    """
+    Parsiraj manifeste serijski ili u process pool-u; rezultati dolaze
+    redoslijedom ulaznih putanja.
+    """
+    if jobs <= 1 or len(paths) <= 1:
+        yield from map(parse_manifest_file, paths)
+        return
+
+    workers = min(jobs, len(paths))
+    # Manifest se parsira za ~1 ms, pa se putanje šalju u grupama
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(parse_manifest_file, paths, chunksize=chunksize)
+
+
+def write_jsonl(results, out=None):
+    """Kompaktan JSON Lines izlaz, jedan red po manifestu (flush nakon svakog reda)"""
+    out = out or sys.stdout
+    count = 0
+    for result in results:
+        out.write(json.dumps(result, ensure_ascii=False, separators=(',', ':')))
+        out.write('\n')
+        out.flush()
+        count += 1
+    return count
+
+
+def main():
+    jobs, args = parse_jobs(sys.argv[1:])
+    previous_path, args = parse_previous(args)
+
+    if not args:
         print(json.dumps({
             "success": False,
             "error": "File path is required as argument"
         }))
         sys.exit(1)
 
-    file_path = sys.argv[1]
-
-    if not Path(file_path).exists():
+    # Jedan fajl: originalni izlaz (JSON objekat, indent=2)
+    if len(args) == 1 and args[0] != '-' and not os.path.isdir(args[0]):
+        file_path = args[0]
+
+        if not Path(file_path).exists():
+            print(json.dumps({
+                "success": False,
+                "error": f"File not found: {file_path}"
+            }))
+            sys.exit(1)
+
+        if previous_path:
+            try:
+                with open(previous_path, 'r', encoding='utf-8') as f:
+                    previous = json.load(f)
+            except (OSError, ValueError) as e:
+                print(json.dumps({
+                    "success": False,
+                    "error": f"Cannot read previous manifest: {e}"
+                }))
+                sys.exit(1)
+            result = parse_manifest_diff(file_path, previous)
+        else:
+            result = parse_manifest(file_path)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    if previous_path:
         print(json.dumps({
             "success": False,
-            "error": f"File not found: {file_path}"
+            "error": "--previous requires a single manifest file"
         }))
         sys.exit(1)
 
-    result = parse_manifest(file_path)
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    write_jsonl(iter_manifests(expand_paths(args), jobs))
+
+
+if __name__ == '__main__':
+    main()
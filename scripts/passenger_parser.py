@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Shared parser for passenger cells ('165+6 INF', '110', 110, '-', 'N/A')
+
+Regex je kompajliran jednom na nivou modula, a rezultat je keširan po
+vrijednosti ćelije: u jednoj godini ima svega nekoliko stotina različitih
+vrijednosti, pa se većina poziva svodi na lookup u LRU kešu.
+
+Upotreba:
+    from passenger_parser import parse_passengers
+
+    pax = parse_passengers(row[13])      # (adults, infants) ili None
+    adults, infants = pax or (0, 0)
+"""
+import re
+from functools import lru_cache
+
+# "110+6 INF" ili "110+6" - ostatak iza broja beba se ignoriše
+_WITH_INFANTS = re.compile(r'(\d+)\s*\+\s*(\d+)')
+
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE, typed=True)
+def parse_passengers(value):
+    """
+    Parse passenger cell into (adults, infants).
+
+    Returns None for empty cells, '-', 'N/A' and anything that is not
+    'N' or 'N+M...'. Cijeli broj bez '+' znači 0 beba.
+    """
+    if not value:
+        return None
+
+    str_val = str(value).strip()
+
+    # Najčešći slučaj: samo broj putnika
+    if str_val.isdecimal():
+        return int(str_val), 0
+
+    match = _WITH_INFANTS.match(str_val)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+
+    return None
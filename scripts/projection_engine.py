@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Vectorized projection engine shared by calculate_projections and advanced_projections.
+
+Rute se jednom pretvore u NumPy nizove (datumi, sedmične operacije, kapacitet),
+a zatim se izgradi matrica ruta × mjesec sa brojem operacija. Svaki rollup
+(godina, kvartali, sezone, mjeseci, breakdown, scenariji) je onda samo
+redukcija nad tom matricom, bez ponovnog parsiranja datuma po ruti i periodu.
+"""
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+# Charter letovi tipično imaju veći load factor
+CHARTER_MIN_LOAD_FACTOR = 0.92
+CHARTER_BOOST_BELOW = 0.90
+
+
+def charter_adjusted(load_factor: np.ndarray, is_charter: np.ndarray) -> np.ndarray:
+    """Podigni load factor charter ruta koje su ispod 90% na 92%"""
+    boost = is_charter & (load_factor < CHARTER_BOOST_BELOW)
+    return np.where(boost, np.maximum(load_factor, CHARTER_MIN_LOAD_FACTOR), load_factor)
+
+
+def load_factor_percent(passengers: float, capacity: float) -> float:
+    """Prosječni load factor u procentima (0 ako nema kapaciteta)"""
+    return float(passengers / capacity * 100) if capacity > 0 else 0
+
+
+class ProjectionEngine:
+    """
+    Rute kao nizovi + matrica operacija ruta × mjesec za jednu godinu.
+
+    Args:
+        routes: lista ruta (startDate/endDate kao 'YYYY-MM-DD', weeklyOperations)
+        year: godina projekcije
+        capacities: kapacitet aviona po ruti (isti redoslijed kao routes)
+    """
+
+    def __init__(self, routes: List[Dict[str, Any]], year: int, capacities: Sequence[float]):
+        self.year = year
+
+        self.start = np.array([r['startDate'] for r in routes], dtype='datetime64[D]')
+        self.end = np.array([r['endDate'] for r in routes], dtype='datetime64[D]')
+        self.weekly_operations = np.array([r['weeklyOperations'] for r in routes], dtype=float)
+        self.capacity = np.asarray(capacities, dtype=float)
+        self.is_charter = np.array([bool(r.get('isCharter', False)) for r in routes], dtype=bool)
+
+        # Ukupne operacije za cijeli period rute (startDate..endDate)
+        active_days = (self.end - self.start).astype(int) + 1
+        self.route_operations = self.weekly_operations * (active_days / 7.0)
+
+        self.monthly_operations = self._build_monthly_operations()
+
+    def _build_monthly_operations(self) -> np.ndarray:
+        """Operacije po ruti i mjesecu: preklapanje [start, end] sa svakim mjesecem u danima"""
+        months = np.arange(f'{self.year}-01', f'{self.year + 1}-01', dtype='datetime64[M]')
+        month_start = months.astype('datetime64[D]')
+        month_end = (months + 1).astype('datetime64[D]') - 1
+
+        overlap_start = np.maximum(self.start[:, None], month_start[None, :])
+        overlap_end = np.minimum(self.end[:, None], month_end[None, :])
+        overlap_days = np.clip((overlap_end - overlap_start).astype(int) + 1, 0, None)
+
+        return self.weekly_operations[:, None] * (overlap_days / 7.0)
+
+    def monthly_totals(self, load_factor: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Ukupno (operacije, putnici, kapacitet) po mjesecu - nizovi dužine 12"""
+        capacity = self.monthly_operations * self.capacity[:, None]
+        passengers = capacity * load_factor[:, None]
+        return (
+            self.monthly_operations.sum(axis=0),
+            passengers.sum(axis=0),
+            capacity.sum(axis=0),
+        )
+
+    def active_routes_per_month(self) -> np.ndarray:
+        """Broj ruta sa bar jednom operacijom u svakom mjesecu"""
+        return (self.monthly_operations > 0).sum(axis=0)
+
+    def route_totals(self, load_factor: np.ndarray, operations: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(operacije, putnici, kapacitet) po ruti za cijeli period rute"""
+        if operations is None:
+            operations = self.route_operations
+        capacity = operations * self.capacity
+        return operations, capacity * load_factor, capacity
+
+
+def group_months(monthly: Tuple[np.ndarray, np.ndarray, np.ndarray], months: Iterable[int]) -> Tuple[float, float, float]:
+    """Saberi mjesečne totale (iz monthly_totals) za listu mjeseci 1-12"""
+    idx = [m - 1 for m in months]
+    operations, passengers, capacity = monthly
+    return float(operations[idx].sum()), float(passengers[idx].sum()), float(capacity[idx].sum())
+
+
+# Monte Carlo
+DEFAULT_DRAWS = 5000
+MAX_DRAWS = 50000
+DEFAULT_DISRUPTION_RATE = 0.02
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Najviše ćelija (draw × ruta) u jednom batch-u, da memorija ostane ograničena
+MAX_BATCH_CELLS = 2_000_000
+
+
+def simulate(
+    engine: ProjectionEngine,
+    load_factor: np.ndarray,
+    std_dev: np.ndarray,
+    lf_min: np.ndarray,
+    lf_max: np.ndarray,
+    draws: int = DEFAULT_DRAWS,
+    disruption_rate: float = DEFAULT_DISRUPTION_RATE,
+    seed: int = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Monte Carlo simulacija operacija i putnika po mjesecu.
+
+    U svakom draw-u:
+    - load factor rute ~ Normal(load_factor, std_dev), ograničen na [lf_min, lf_max]
+    - svaka planirana operacija u mjesecu se otkazuje sa vjerovatnoćom
+      disruption_rate; broj otkazanih po mjesecu je Binomial(planirane, rate),
+      a otkazivanja se raspoređuju na rute proporcionalno njihovim operacijama
+
+    Draw-ovi se generišu u batch-evima, pa je cijela simulacija par NumPy
+    operacija (jedan matmul draw × ruta @ ruta × mjesec po batch-u).
+
+    Returns:
+        (operations, passengers) - nizovi oblika (draws, 12)
+    """
+    rng = np.random.default_rng(seed)
+    route_count = len(engine.capacity)
+    operations = engine.monthly_operations
+    planned = operations.sum(axis=0)
+    planned_count = np.rint(planned).astype(np.int64)
+
+    # Udio letova koji je odletio u svakom mjesecu i draw-u
+    cancelled = rng.binomial(planned_count, disruption_rate, size=(draws, 12))
+    flown_share = 1.0 - cancelled / np.maximum(planned_count, 1)
+
+    month_operations = planned * flown_share
+    month_passengers = np.zeros((draws, 12))
+    if route_count == 0:
+        return month_operations, month_passengers
+
+    seats = operations * engine.capacity[:, None]
+    batch_size = max(1, MAX_BATCH_CELLS // route_count)
+    for lo in range(0, draws, batch_size):
+        n = min(batch_size, draws - lo)
+        sampled_lf = np.clip(rng.normal(load_factor, std_dev, size=(n, route_count)), lf_min, lf_max)
+        month_passengers[lo:lo + n] = sampled_lf @ seats
+
+    return month_operations, month_passengers * flown_share
+
+
+def percentile_bands(values: np.ndarray, axis: int = 0) -> Dict[str, Any]:
+    """mean + p5/p25/p50/p75/p95 duž ose draw-ova"""
+    bands = np.percentile(values, PERCENTILES, axis=axis)
+    result = {'mean': values.mean(axis=axis)}
+    for p, band in zip(PERCENTILES, bands):
+        result[f'p{p}'] = band
+    return result
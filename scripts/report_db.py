@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Shared PostgreSQL access layer for all report generators
+
+Jedan connection pool po procesu umjesto nove konekcije za svaki upit.
+Konfiguracija kroz environment varijable:
+- DATABASE_URL                      konekcijski string (obavezno)
+- REPORT_DB_POOL_MIN                minimalan broj konekcija u pool-u (default 1)
+- REPORT_DB_POOL_MAX                maksimalan broj konekcija u pool-u (default 5)
+- REPORT_DB_STATEMENT_TIMEOUT_MS    statement_timeout za upite izvještaja (default bez limita)
+"""
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+
+POOL_MIN = int(os.getenv("REPORT_DB_POOL_MIN", "1"))
+POOL_MAX = int(os.getenv("REPORT_DB_POOL_MAX", "5"))
+STATEMENT_TIMEOUT_MS = int(os.getenv("REPORT_DB_STATEMENT_TIMEOUT_MS", "0"))
+
+# Broj redova koje server-side cursor povlači po round-trip-u
+DEFAULT_ITERSIZE = 2000
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Vrati (i po potrebi kreiraj) zajednički connection pool"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                database_url = os.getenv("DATABASE_URL")
+                if not database_url:
+                    raise ValueError("DATABASE_URL environment variable not set")
+                _pool = ThreadedConnectionPool(
+                    POOL_MIN, POOL_MAX, database_url, cursor_factory=RealDictCursor
+                )
+    return _pool
+
+
+def close_pool():
+    """Zatvori sve konekcije u pool-u"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+@contextmanager
+def get_connection(statement_timeout_ms=None):
+    """
+    Posudi konekciju iz pool-a za jednu transakciju.
+
+    statement_timeout se postavlja sa SET LOCAL, pa važi samo do kraja
+    transakcije i ne prelazi na sljedećeg korisnika iste konekcije.
+    """
+    db_pool = get_pool()
+    conn = db_pool.getconn()
+    broken = False
+    try:
+        timeout = STATEMENT_TIMEOUT_MS if statement_timeout_ms is None else statement_timeout_ms
+        if timeout:
+            with conn.cursor() as cursor:
+                cursor.execute("SET LOCAL statement_timeout = %s", (int(timeout),))
+        yield conn
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            broken = True
+        raise
+    finally:
+        db_pool.putconn(conn, close=broken or bool(conn.closed))
+
+
+def fetch_all(query, params=None, statement_timeout_ms=None):
+    """Izvrši upit i vrati sve redove kao listu dict-ova"""
+    with get_connection(statement_timeout_ms) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+
+def iter_rows(query, params=None, itersize=DEFAULT_ITERSIZE, statement_timeout_ms=None):
+    """
+    Izvrši upit kroz server-side (named) cursor i vraćaj redove jedan po jedan.
+
+    Za velike periode (višegodišnji exporti) - u memoriji je najviše
+    `itersize` redova odjednom umjesto cijelog rezultata.
+    """
+    with get_connection(statement_timeout_ms) as conn:
+        with conn.cursor(name=f"report_{uuid.uuid4().hex}") as cursor:
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+            for row in cursor:
+                yield row
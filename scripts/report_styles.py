@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Shared named cell styles for all report generators
+
+Umjesto da se Font/Border/PatternFill/Alignment kreiraju i dodjeljuju za svaku
+ćeliju, stilovi su definisani jednom kao NamedStyle i primjenjuju se jednom
+dodjelom: `cell.style = "report_data"`. Workbook tako dobija po jedan zapis
+za svaki stil, bez obzira na broj ćelija.
+
+Upotreba:
+    wb = openpyxl.Workbook()
+    register_styles(wb)
+    ws.cell(row=2, column=1, value="...").style = "report_data"
+"""
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+THIN_SIDE = Side(style='thin')
+THIN_BORDER = Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE)
+
+CENTER = Alignment(horizontal="center")
+CENTER_MIDDLE = Alignment(horizontal="center", vertical="center")
+LEFT_MIDDLE = Alignment(horizontal="left", vertical="center")
+CENTER_WRAP = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+
+def _solid(color):
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+# name -> atributi NamedStyle-a
+STYLE_DEFINITIONS = {
+    # Custom izvještaji (generate_custom_report, generate_custom_advanced_report)
+    "report_data": dict(border=THIN_BORDER),
+    "report_data_center": dict(border=THIN_BORDER, alignment=CENTER),
+    "report_bold": dict(font=Font(bold=True)),
+    "report_center": dict(alignment=CENTER),
+    "report_column_header": dict(font=Font(bold=True), border=THIN_BORDER, alignment=CENTER),
+    "report_table_header": dict(
+        font=Font(bold=True, color="FFFFFF", size=11), fill=_solid("0F172A"),
+        alignment=CENTER_WRAP, border=THIN_BORDER,
+    ),
+    "report_daily_header": dict(
+        font=Font(bold=True, color="FFFFFF", size=10), fill=_solid("0F172A"),
+        alignment=CENTER_WRAP, border=THIN_BORDER,
+    ),
+    "report_section_header": dict(
+        font=Font(bold=True, size=11, color="FFFFFF"), fill=_solid("64748B"),
+        alignment=CENTER, border=THIN_BORDER,
+    ),
+    "report_stat_label": dict(font=Font(bold=True), fill=_solid("FEF3C7"), border=THIN_BORDER),
+    "report_stat_value": dict(
+        font=Font(bold=True), fill=_solid("FEF3C7"), alignment=CENTER, border=THIN_BORDER,
+    ),
+
+    # BHANSA izvještaj
+    "bhansa_title": dict(font=Font(name='Arial', size=14, bold=True), alignment=CENTER_MIDDLE),
+    "bhansa_header": dict(
+        font=Font(name='Arial', size=11, bold=True), fill=_solid("D9D9D9"),
+        border=THIN_BORDER, alignment=CENTER_MIDDLE,
+    ),
+    "bhansa_cell_center": dict(font=Font(name='Arial', size=10), border=THIN_BORDER, alignment=CENTER_MIDDLE),
+    "bhansa_cell_left": dict(font=Font(name='Arial', size=10), border=THIN_BORDER, alignment=LEFT_MIDDLE),
+
+    # Wizz Air Daily Performance Table
+    "wizz_title": dict(font=Font(name='Arial', size=12, bold=True), alignment=CENTER_MIDDLE),
+    "wizz_header": dict(
+        font=Font(name='Arial', size=10, bold=True), fill=_solid("CCCCCC"),
+        border=THIN_BORDER, alignment=CENTER_MIDDLE,
+    ),
+    "wizz_cell_center": dict(font=Font(name='Arial', size=9), border=THIN_BORDER, alignment=CENTER_MIDDLE),
+    "wizz_cell_left": dict(font=Font(name='Arial', size=9), border=THIN_BORDER, alignment=LEFT_MIDDLE),
+}
+
+
+def register_styles(wb, names=None):
+    """
+    Registruj named style-ove u workbook (idempotentno).
+
+    Args:
+        wb: openpyxl Workbook
+        names: lista imena iz STYLE_DEFINITIONS; None registruje sve
+    """
+    registered = set(wb.named_styles)
+    for name in names or STYLE_DEFINITIONS:
+        if name in registered:
+            continue
+        wb.add_named_style(NamedStyle(name=name, **STYLE_DEFINITIONS[name]))
+        registered.add(name)
+    return wb
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Cache for pre-parsed Excel report templates
+
+openpyxl.load_workbook() stilizovanih template-a (mnogo sheet-ova, merge-ova i
+stilova) je veliki dio vremena generisanja izvještaja. U dugotrajnom workeru
+(report_worker.py) moduli ostaju u memoriji, pa se svaki template parsira samo
+jednom: čuva se netaknuta kopija kao pickle, a svaki poziv dobija novu kopiju
+preko pickle.loads (red veličine brže od ponovnog parsiranja XML-a).
+
+Keš se invalidira kada se promijeni mtime ili veličina template fajla.
+Kopije su nezavisne - izmjene jednog izvještaja ne utiču na keš.
+
+Upotreba:
+    from report_templates import load_template
+
+    wb = load_template(TEMPLATE_PATH)            # umjesto openpyxl.load_workbook
+    wb = load_template(path, data_only=False)    # isti kwargs kao load_workbook
+"""
+import os
+import pickle
+import threading
+
+import openpyxl
+
+# {(putanja, kwargs): (mtime_ns, size, pickle bytes)}
+_cache = {}
+_lock = threading.Lock()
+
+
+def _fresh_copy(path, kwargs, stat):
+    """Parsiraj template i sačuvaj pickle netaknute kopije u keš"""
+    workbook = openpyxl.load_workbook(path, **kwargs)
+    try:
+        data = pickle.dumps(workbook, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Workbook koji se ne može pickle-ovati (npr. read_only) se ne kešira
+        return workbook, None
+    return workbook, (stat.st_mtime_ns, stat.st_size, data)
+
+
+def load_template(path, **kwargs):
+    """
+    Kopija template workbook-a, parsirana najviše jednom po verziji fajla.
+
+    Args:
+        path: putanja do .xlsx template-a
+        **kwargs: prosljeđuju se openpyxl.load_workbook (npr. data_only=False)
+
+    Returns:
+        openpyxl Workbook koji pozivalac smije mijenjati i snimati
+    """
+    path = os.path.abspath(path)
+    key = (path, tuple(sorted(kwargs.items())))
+    stat = os.stat(path)
+
+    with _lock:
+        cached = _cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return pickle.loads(cached[2])
+
+    workbook, entry = _fresh_copy(path, kwargs, stat)
+    with _lock:
+        if entry is None:
+            _cache.pop(key, None)
+        else:
+            _cache[key] = entry
+    return workbook
+
+
+def clear_template_cache():
+    """Isprazni keš (npr. u testovima ili nakon zamjene template-a)"""
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Persistent Python worker for report, projection and manifest scripts
+
+Umjesto novog `python3` procesa za svaki API zahtjev, Next.js drži mali pool
+dugotrajnih worker procesa (vidi src/lib/python-worker.ts). Importi
+(openpyxl, psycopg2) i connection pool iz report_db ostaju "topli" između poslova.
+
+Protokol - JSON Lines preko stdin/stdout, jedan posao po liniji:
+    zahtjev:  {"id": "1", "script": "generate_bhansa_report.py", "args": ["2025", "10"]}
+    odgovor:  {"id": "1", "code": 0, "stdout": "...", "stderr": "..."}
+
+Skripta se izvršava kao da je pokrenuta sa `python3 <script> <args>`:
+isti sys.argv, __name__ == "__main__", a sys.exit(<code>) postaje "code".
+stdin posla je prazan (stdin workera je kanal za poslove).
+Dozvoljene su samo skripte iz ovog direktorija.
+"""
+import io
+import json
+import runpy
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Moduli koje vrijedi učitati jednom, prije prvog posla
+WARM_MODULES = ("openpyxl", "psycopg2", "pytz", "numpy", "report_db", "report_templates")
+
+
+def warm_up():
+    """Unaprijed importuj teške module (ako su instalirani)"""
+    for module_name in WARM_MODULES:
+        try:
+            __import__(module_name)
+        except ImportError:
+            pass
+
+
+def resolve_script(script):
+    """Vrati apsolutnu putanju skripte, samo ako je iz SCRIPT_DIR"""
+    path = Path(script)
+    if not path.is_absolute():
+        path = SCRIPT_DIR / path
+    path = path.resolve()
+    if path.parent != SCRIPT_DIR or path.suffix != ".py":
+        raise ValueError(f"Script not allowed: {script}")
+    if not path.is_file():
+        raise FileNotFoundError(f"Script not found: {script}")
+    return path
+
+
+def exit_code(code):
+    """Prevedi SystemExit.code u numerički exit code (kao interpreter)"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_job(job):
+    """Izvrši jedan posao i vrati odgovor sa exit code-om i uhvaćenim output-om"""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    code = 0
+    saved_argv = sys.argv
+    saved_stdin = sys.stdin
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            script_path = resolve_script(job["script"])
+            # Skripta koja čita stdin (npr. parse_manifest.py -) ne smije čitati protokol
+            sys.stdin = io.StringIO()
+            sys.argv = [str(script_path)] + [str(arg) for arg in job.get("args", [])]
+            runpy.run_path(str(script_path), run_name="__main__")
+        except SystemExit as exc:
+            code = exit_code(exc.code)
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.argv = saved_argv
+            sys.stdin = saved_stdin
+
+    return {
+        "id": job.get("id"),
+        "code": code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def main():
+    protocol_in = sys.stdin
+    protocol_out = sys.stdout
+    warm_up()
+
+    for line in protocol_in:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"id": None, "code": 1, "stdout": "", "stderr": f"Invalid job: {e}\n"}
+        else:
+            response = run_job(job)
+
+        protocol_out.write(json.dumps(response) + "\n")
+        protocol_out.flush()
+
+
+if __name__ == "__main__":
+    main()
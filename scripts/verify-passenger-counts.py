@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
-import json
-from datetime import datetime
+import numpy as np
+
+from flight_columns import read_flight_columns
 
 # Expected totals from user (adults + children, NOT including infants)
 expected = {
@@ -18,32 +19,25 @@ expected = {
     11: 21934,
 }
 
-# Load extracted data
-with open('output/2025-flights-data.json', 'r') as f:
-    data = json.load(f)
+# Load only the needed columns (columnar file written by the extractor)
+columns = read_flight_columns('output/2025-flights-data.json', [
+    'date', 'arrivalPassengers', 'departurePassengers', 'arrivalInfants', 'departureInfants',
+])
+months = columns['date'].astype('datetime64[M]').astype(int) % 12 + 1
+total_flights = len(months)
 
 # Calculate per-month totals
 month_stats = {}
 
-for flight in data['flights']:
-    date_str = flight['date']
-    date = datetime.fromisoformat(date_str)
-    month = date.month
-
-    if month not in month_stats:
-        month_stats[month] = {
-            'flights': 0,
-            'arrival': 0,
-            'departure': 0,
-            'arrival_infants': 0,
-            'departure_infants': 0,
-        }
-
-    month_stats[month]['flights'] += 1
-    month_stats[month]['arrival'] += flight.get('arrivalPassengers') or 0
-    month_stats[month]['departure'] += flight.get('departurePassengers') or 0
-    month_stats[month]['arrival_infants'] += flight.get('arrivalInfants') or 0
-    month_stats[month]['departure_infants'] += flight.get('departureInfants') or 0
+for month in np.unique(months):
+    in_month = months == month
+    month_stats[int(month)] = {
+        'flights': int(in_month.sum()),
+        'arrival': int(columns['arrivalPassengers'][in_month].filled(0).sum()),
+        'departure': int(columns['departurePassengers'][in_month].filled(0).sum()),
+        'arrival_infants': int(columns['arrivalInfants'][in_month].filled(0).sum()),
+        'departure_infants': int(columns['departureInfants'][in_month].filled(0).sum()),
+    }
 
 # Print comparison
 print("\n📊 Passenger Count Verification (Adults + Children, NO infants)\n")
@@ -70,7 +64,7 @@ for month in sorted(month_stats.keys()):
     total_actual += actual
 
 print("="*80)
-print(f"{'TOTAL':<12} {len(data['flights']):>8} {total_expected:>10,} {total_actual:>10,} {total_actual - total_expected:>+10,}")
+print(f"{'TOTAL':<12} {total_flights:>8} {total_expected:>10,} {total_actual:>10,} {total_actual - total_expected:>+10,}")
 print("="*80)
 
 # Show infant totals
@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { requireNaplateAccess } from '@/lib/route-guards';
 import { prisma } from '@/lib/prisma';
-import { spawn } from 'child_process';
+import { runPythonScript } from '@/lib/python-worker';
 import { promises as fs } from 'fs';
 import path from 'path';
 import os from 'os';
@@ -90,39 +90,29 @@ export async function GET(request: NextRequest) {
       })
     );
 
-    const pythonProcess = spawn('python3', [scriptPath, mode, jsonPath, templatePath, outputPath]);
+    const { code, stderr } = await runPythonScript(scriptPath, [mode, jsonPath, templatePath, outputPath]);
 
-    let stderr = '';
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
+    if (code !== 0) {
+      console.error('Monthly export error:', stderr);
+      return NextResponse.json({ error: 'Greška pri eksportu' }, { status: 500 });
+    }
 
-    return await new Promise<NextResponse>((resolve) => {
-      pythonProcess.on('close', async (code) => {
-        if (code !== 0) {
-          console.error('Monthly export error:', stderr);
-          resolve(NextResponse.json({ error: 'Greška pri eksportu' }, { status: 500 }));
-          return;
-        }
-
-        try {
-          const fileBuffer = await fs.readFile(outputPath);
-          const response = new NextResponse(fileBuffer);
-          response.headers.set(
-            'Content-Type',
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-          );
-          response.headers.set(
-            'Content-Disposition',
-            `attachment; filename=\"${outputName}\"`
-          );
-          resolve(response);
-        } catch (error) {
-          console.error('Monthly export read error:', error);
-          resolve(NextResponse.json({ error: 'Greška pri eksportu' }, { status: 500 }));
-        }
-      });
-    });
+    try {
+      const fileBuffer = await fs.readFile(outputPath);
+      const response = new NextResponse(fileBuffer);
+      response.headers.set(
+        'Content-Type',
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+      );
+      response.headers.set(
+        'Content-Disposition',
+        `attachment; filename=\"${outputName}\"`
+      );
+      return response;
+    } catch (error) {
+      console.error('Monthly export read error:', error);
+      return NextResponse.json({ error: 'Greška pri eksportu' }, { status: 500 });
+    }
   } catch (error) {
     console.error('Monthly export error:', error);
     return NextResponse.json({ error: 'Greška pri eksportu' }, { status: 500 });
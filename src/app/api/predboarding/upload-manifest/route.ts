@@ -4,7 +4,7 @@ import { join } from 'path';
 import { existsSync } from 'fs';
 import { prisma } from '@/lib/prisma';
 import { requireSTW } from '@/lib/route-guards';
-import { spawn } from 'child_process';
+import { runPythonScript } from '@/lib/python-worker';
 
 /**
  * POST /api/predboarding/upload-manifest
@@ -103,93 +103,68 @@ export async function POST(request: Request) {
 
     // Parse manifest using Python script
     const scriptPath = join(process.cwd(), 'scripts', 'parse_manifest.py');
-    const pythonProcess = spawn('python3', [scriptPath, filepath]);
+    const { code, stdout, stderr } = await runPythonScript(scriptPath, [filepath]);
 
-    let stdout = '';
-    let stderr = '';
-
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
-
-    return new Promise<NextResponse>((resolve) => {
-      pythonProcess.on('close', async (code) => {
-        if (code !== 0) {
-          console.error('Python script error:', stderr);
-          resolve(
-            NextResponse.json(
-              { error: 'Greška pri parsiranju manifesta' },
-              { status: 500 }
-            )
-          );
-          return;
-        }
+    if (code !== 0) {
+      console.error('Python script error:', stderr);
+      return NextResponse.json(
+        { error: 'Greška pri parsiranju manifesta' },
+        { status: 500 }
+      );
+    }
 
-        try {
-          const result = JSON.parse(stdout);
-
-          if (!result.success) {
-            resolve(
-              NextResponse.json(
-                { error: result.error || 'Greška pri parsiranju' },
-                { status: 500 }
-              )
-            );
-            return;
+    try {
+      const result = JSON.parse(stdout);
+
+      if (!result.success) {
+        return NextResponse.json(
+          { error: result.error || 'Greška pri parsiranju' },
+          { status: 500 }
+        );
+      }
+
+      // Create manifest record with passengers
+      const manifest = await prisma.boardingManifest.create({
+        data: {
+          flightId,
+          originalFileName: file.name,
+          filePath: `/uploads/manifests/${filename}`,
+          fileSize: file.size,
+          uploadedByUserId: authCheck.user.id,
+          boardingStatus: 'IN_PROGRESS',
+          passengers: {
+            create: result.data.passengers.map((p: any) => ({
+              seatNumber: p.seatNumber,
+              passengerName: p.passengerName,
+              title: p.title,
+              isInfant: p.isInfant,
+              passengerId: p.passengerId,
+              fareClass: p.fareClass,
+              confirmationDate: p.confirmationDate,
+              boardingStatus: 'NO_SHOW' // Default status je NO_SHOW
+            }))
+          }
+        },
+        include: {
+          passengers: true,
+          _count: {
+            select: { passengers: true }
           }
-
-          // Create manifest record with passengers
-          const manifest = await prisma.boardingManifest.create({
-            data: {
-              flightId,
-              originalFileName: file.name,
-              filePath: `/uploads/manifests/${filename}`,
-              fileSize: file.size,
-              uploadedByUserId: authCheck.user.id,
-              boardingStatus: 'IN_PROGRESS',
-              passengers: {
-                create: result.data.passengers.map((p: any) => ({
-                  seatNumber: p.seatNumber,
-                  passengerName: p.passengerName,
-                  title: p.title,
-                  isInfant: p.isInfant,
-                  passengerId: p.passengerId,
-                  fareClass: p.fareClass,
-                  confirmationDate: p.confirmationDate,
-                  boardingStatus: 'NO_SHOW' // Default status je NO_SHOW
-                }))
-              }
-            },
-            include: {
-              passengers: true,
-              _count: {
-                select: { passengers: true }
-              }
-            }
-          });
-
-          resolve(
-            NextResponse.json({
-              success: true,
-              data: manifest,
-              message: `Manifest uspješno uploadovan. Učitano ${result.data.passengers.length} putnika.`
-            })
-          );
-        } catch (error) {
-          console.error('Error creating manifest:', error);
-          resolve(
-            NextResponse.json(
-              { error: 'Greška pri kreiranju manifesta' },
-              { status: 500 }
-            )
-          );
         }
       });
-    });
+
+      return NextResponse.json({
+        success: true,
+        data: manifest,
+        message: `Manifest uspješno uploadovan. Učitano ${result.data.passengers.length} putnika.`
+      });
+    } catch (error) {
+      console.error('Error creating manifest:', error);
+      return NextResponse.json(
+        { error: 'Greška pri kreiranju manifesta' },
+        { status: 500 }
+      );
+    }
   } catch (error) {
     console.error('Error uploading manifest:', error);
     return NextResponse.json(
@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { verifyToken, getTokenFromCookie } from '@/lib/auth-utils';
-import { spawn } from 'child_process';
+import { runPythonScript } from '@/lib/python-worker';
 import path from 'path';
 
 export async function POST(request: NextRequest) {
@@ -18,7 +18,7 @@ export async function POST(request: NextRequest) {
     }
 
     const body = await request.json();
-    const { projectionYear, routes, useBaseline } = body;
+    const { projectionYear, routes, useBaseline, monteCarlo } = body;
 
     if (!projectionYear || !routes || !Array.isArray(routes)) {
       return NextResponse.json(
@@ -71,69 +71,48 @@ export async function POST(request: NextRequest) {
       projectionYear,
       routes,
       baselineData,
+      // Optional: { draws, seed, disruptionRate } for percentile bands
+      monteCarlo: monteCarlo || null,
       dbPath: path.join(process.cwd(), 'prisma', 'dev.db'),
     };
 
     // Run Python script
     const scriptPath = path.join(process.cwd(), 'scripts', 'advanced_projections.py');
     
-    return new Promise<Response>((resolve) => {
-      const pythonProcess = spawn('python3', [scriptPath, JSON.stringify(pythonInput)]);
-      
-      let outputData = '';
-      let errorData = '';
+    const { code, stdout: outputData, stderr: errorData } = await runPythonScript(scriptPath, [
+      JSON.stringify(pythonInput),
+    ]);
 
-      pythonProcess.stdout.on('data', (data) => {
-        outputData += data.toString();
-      });
-
-      pythonProcess.stderr.on('data', (data) => {
-        errorData += data.toString();
-      });
+    if (code !== 0) {
+      console.error('Python script error:', errorData);
+      return NextResponse.json(
+        { error: 'Calculation failed', details: errorData },
+        { status: 500 }
+      );
+    }
 
-      pythonProcess.on('close', (code) => {
-        if (code !== 0) {
-          console.error('Python script error:', errorData);
-          resolve(
-            NextResponse.json(
-              { error: 'Calculation failed', details: errorData },
-              { status: 500 }
-            )
-          );
-          return;
-        }
+    try {
+      const result = JSON.parse(outputData);
 
-        try {
-          const result = JSON.parse(outputData);
-          
-          if (result.error) {
-            resolve(
-              NextResponse.json(
-                { error: result.error },
-                { status: 500 }
-              )
-            );
-            return;
-          }
+      if (result.error) {
+        return NextResponse.json(
+          { error: result.error },
+          { status: 500 }
+        );
+      }
 
-          resolve(
-            NextResponse.json({
-              success: true,
-              data: result,
-            })
-          );
-        } catch (parseError) {
-          console.error('Failed to parse Python output:', parseError);
-          console.error('Output was:', outputData);
-          resolve(
-            NextResponse.json(
-              { error: 'Failed to parse calculation results' },
-              { status: 500 }
-            )
-          );
-        }
+      return NextResponse.json({
+        success: true,
+        data: result,
       });
-    });
+    } catch (parseError) {
+      console.error('Failed to parse Python output:', parseError);
+      console.error('Output was:', outputData);
+      return NextResponse.json(
+        { error: 'Failed to parse calculation results' },
+        { status: 500 }
+      );
+    }
   } catch (error: any) {
     console.error('Advanced calculation error:', error);
     return NextResponse.json(
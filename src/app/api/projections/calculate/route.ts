@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { verifyToken, getTokenFromCookie } from '@/lib/auth-utils';
-import { spawn } from 'child_process';
+import { runPythonScript } from '@/lib/python-worker';
 import path from 'path';
 
 export async function POST(request: NextRequest) {
@@ -95,7 +95,7 @@ export async function POST(request: NextRequest) {
       useBaseline: false, // Already merged baseline routes
     });
 
-    const projection = await runPythonScript(scriptPath, inputData);
+    const projection = await runProjectionScript(scriptPath, inputData);
 
     return NextResponse.json({
       success: true,
@@ -110,37 +110,16 @@ export async function POST(request: NextRequest) {
   }
 }
 
-function runPythonScript(scriptPath: string, inputData: string): Promise<any> {
-  return new Promise((resolve, reject) => {
-    const python = spawn('python3', [scriptPath, inputData]);
+async function runProjectionScript(scriptPath: string, inputData: string): Promise<any> {
+  const { code, stdout, stderr } = await runPythonScript(scriptPath, [inputData]);
 
-    let stdout = '';
-    let stderr = '';
-
-    python.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-
-    python.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
-
-    python.on('close', (code) => {
-      if (code !== 0) {
-        reject(new Error(`Python script failed: ${stderr}`));
-        return;
-      }
-
-      try {
-        const result = JSON.parse(stdout);
-        resolve(result);
-      } catch (err) {
-        reject(new Error(`Failed to parse Python output: ${stdout}`));
-      }
-    });
+  if (code !== 0) {
+    throw new Error(`Python script failed: ${stderr}`);
+  }
 
-    python.on('error', (err) => {
-      reject(new Error(`Failed to start Python process: ${err.message}`));
-    });
-  });
+  try {
+    return JSON.parse(stdout);
+  } catch (err) {
+    throw new Error(`Failed to parse Python output: ${stdout}`);
+  }
 }
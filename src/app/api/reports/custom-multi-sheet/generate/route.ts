@@ -1,8 +1,8 @@
 import { NextResponse } from 'next/server';
-import { spawn } from 'child_process';
 import path from 'path';
 import { getTokenFromCookie, verifyToken } from '@/lib/auth-utils';
 import { writeReportMetadata } from '@/lib/report-metadata';
+import { runPythonScript } from '@/lib/python-worker';
 
 export async function POST(request: Request): Promise<NextResponse> {
   try {
@@ -38,28 +38,8 @@ export async function POST(request: Request): Promise<NextResponse> {
     // Path to Python script
     const scriptPath = path.join(process.cwd(), 'scripts', 'generate_custom_advanced_report.py');
 
-    // Execute Python script
-    const pythonProcess = spawn('python3', [scriptPath, filters]);
-
-    let stdout = '';
-    let stderr = '';
-
-    // Collect stdout
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-
-    // Collect stderr
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
-
-    // Wait for process to complete
-    const exitCode = await new Promise<number>((resolve) => {
-      pythonProcess.on('close', (code) => {
-        resolve(code || 0);
-      });
-    });
+    // Execute Python script (persistent worker)
+    const { code: exitCode, stdout, stderr } = await runPythonScript(scriptPath, [filters]);
 
     // Check for errors
     if (exitCode !== 0) {
@@ -1,12 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { exec } from 'child_process';
-import { promisify } from 'util';
 import path from 'path';
 import fs from 'fs/promises';
 import { getTokenFromCookie, verifyToken } from '@/lib/auth-utils';
 import { writeReportMetadata } from '@/lib/report-metadata';
-
-const execAsync = promisify(exec);
+import { execPythonScript } from '@/lib/python-worker';
 
 /**
  * POST /api/reports/local/generate
@@ -52,16 +49,7 @@ export async function POST(request: NextRequest) {
     console.log(`Pokrećem Python skriptu: ${scriptPath} ${year} ${month}`);
 
     try {
-      const { stdout, stderr } = await execAsync(
-        `python3 "${scriptPath}" ${year} ${month}`,
-        {
-          env: {
-            ...process.env,
-            PYTHONIOENCODING: 'utf-8',
-          },
-          maxBuffer: 10 * 1024 * 1024,
-        }
-      );
+      const { stdout, stderr } = await execPythonScript(scriptPath, [year, month]);
 
       console.log('Python stdout:', stdout);
       if (stderr) {
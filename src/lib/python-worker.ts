@@ -0,0 +1,243 @@
+/**
+ * Pool of long-lived Python workers (scripts/report_worker.py)
+ *
+ * Instead of spawning a fresh `python3` per API request, jobs are sent as
+ * JSON lines to a small pool of warm workers that keep openpyxl, psycopg2 and
+ * the report DB pool loaded. Set PYTHON_WORKER_DISABLED=true to fall back to
+ * one process per request; PYTHON_WORKER_POOL_SIZE controls the pool size.
+ * A job that runs longer than PYTHON_WORKER_TIMEOUT_MS (default 10 minutes)
+ * kills its worker, which is respawned on the next job.
+ */
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+
+export type PythonScriptResult = {
+  code: number;
+  stdout: string;
+  stderr: string;
+};
+
+type PendingJob = {
+  resolve: (result: PythonScriptResult) => void;
+  reject: (error: Error) => void;
+  timer: NodeJS.Timeout;
+};
+
+const WORKER_SCRIPT = path.join(process.cwd(), 'scripts', 'report_worker.py');
+const POOL_SIZE = Math.max(1, Number(process.env.PYTHON_WORKER_POOL_SIZE) || 2);
+const WORKER_DISABLED = process.env.PYTHON_WORKER_DISABLED === 'true';
+const JOB_TIMEOUT_MS = Math.max(1, Number(process.env.PYTHON_WORKER_TIMEOUT_MS) || 10 * 60 * 1000);
+
+// Exit code reported for a job killed by the timeout (same as coreutils `timeout`)
+const TIMEOUT_EXIT_CODE = 124;
+
+function pythonEnv() {
+  return { ...process.env, PYTHONIOENCODING: 'utf-8' };
+}
+
+class PythonWorker {
+  private child: ChildProcessWithoutNullStreams | null = null;
+  private current: PendingJob | null = null;
+  private nextId = 0;
+
+  /**
+   * Run one script in this worker. Callers must wait for the previous job
+   * to finish (the pool guarantees this).
+   */
+  run(scriptPath: string, args: string[]): Promise<PythonScriptResult> {
+    return new Promise((resolve, reject) => {
+      const child = this.ensureStarted();
+      const timer = setTimeout(() => this.handleTimeout(child), JOB_TIMEOUT_MS);
+      this.current = { resolve, reject, timer };
+      const job = { id: String(++this.nextId), script: scriptPath, args };
+      child.stdin.write(`${JSON.stringify(job)}\n`);
+    });
+  }
+
+  private ensureStarted(): ChildProcessWithoutNullStreams {
+    if (this.child) {
+      return this.child;
+    }
+
+    const child = spawn('python3', [WORKER_SCRIPT], { env: pythonEnv() });
+    const lines = readline.createInterface({ input: child.stdout });
+
+    // Events from a worker that was already replaced (e.g. killed on timeout) are ignored
+    lines.on('line', (line) => {
+      if (this.child === child) this.handleResponse(line);
+    });
+    child.stderr.on('data', (data) => {
+      console.error('Python worker stderr:', data.toString());
+    });
+    child.on('error', (error) => {
+      if (this.child === child) this.handleExit(error);
+    });
+    child.on('exit', (code) => {
+      if (this.child === child) this.handleExit(new Error(`Python worker exited with code ${code}`));
+    });
+
+    this.child = child;
+    return child;
+  }
+
+  private handleResponse(line: string) {
+    const job = this.current;
+    if (!job) {
+      return;
+    }
+    this.current = null;
+    clearTimeout(job.timer);
+
+    try {
+      const response = JSON.parse(line);
+      job.resolve({
+        code: Number(response.code ?? 1),
+        stdout: response.stdout ?? '',
+        stderr: response.stderr ?? '',
+      });
+    } catch (error) {
+      job.reject(error instanceof Error ? error : new Error(String(error)));
+    }
+  }
+
+  private handleExit(error: Error) {
+    this.child = null;
+    const job = this.current;
+    this.current = null;
+    if (job) {
+      clearTimeout(job.timer);
+      job.reject(error);
+    }
+  }
+
+  /**
+   * The job hung: kill the worker and resolve with a failed result instead of
+   * rejecting, so runPythonScript does not re-run the script in a new process.
+   */
+  private handleTimeout(child: ChildProcessWithoutNullStreams) {
+    if (this.child !== child) {
+      return;
+    }
+    const job = this.current;
+    this.child = null;
+    this.current = null;
+    child.kill('SIGKILL');
+    job?.resolve({
+      code: TIMEOUT_EXIT_CODE,
+      stdout: '',
+      stderr: `Python script timed out after ${JOB_TIMEOUT_MS} ms\n`,
+    });
+  }
+}
+
+class PythonWorkerPool {
+  private idle: PythonWorker[];
+  private waiting: Array<(worker: PythonWorker) => void> = [];
+
+  constructor(size: number) {
+    this.idle = Array.from({ length: size }, () => new PythonWorker());
+  }
+
+  async run(scriptPath: string, args: string[]): Promise<PythonScriptResult> {
+    const worker = await this.acquire();
+    try {
+      return await worker.run(scriptPath, args);
+    } finally {
+      this.release(worker);
+    }
+  }
+
+  private acquire(): Promise<PythonWorker> {
+    const worker = this.idle.pop();
+    if (worker) {
+      return Promise.resolve(worker);
+    }
+    return new Promise((resolve) => this.waiting.push(resolve));
+  }
+
+  private release(worker: PythonWorker) {
+    const next = this.waiting.shift();
+    if (next) {
+      next(worker);
+    } else {
+      this.idle.push(worker);
+    }
+  }
+}
+
+const globalForPython = globalThis as unknown as {
+  pythonWorkerPool: PythonWorkerPool | undefined;
+};
+
+function getPool(): PythonWorkerPool {
+  if (!globalForPython.pythonWorkerPool) {
+    globalForPython.pythonWorkerPool = new PythonWorkerPool(POOL_SIZE);
+  }
+  return globalForPython.pythonWorkerPool;
+}
+
+/**
+ * One-off `python3 <script> <args>` process (fallback path)
+ */
+function spawnPythonScript(scriptPath: string, args: string[]): Promise<PythonScriptResult> {
+  return new Promise((resolve, reject) => {
+    const pythonProcess = spawn('python3', [scriptPath, ...args], { env: pythonEnv() });
+
+    let stdout = '';
+    let stderr = '';
+
+    pythonProcess.stdout.on('data', (data) => {
+      stdout += data.toString();
+    });
+
+    pythonProcess.stderr.on('data', (data) => {
+      stderr += data.toString();
+    });
+
+    pythonProcess.on('error', reject);
+    pythonProcess.on('close', (code) => {
+      resolve({ code: code ?? 1, stdout, stderr });
+    });
+  });
+}
+
+/**
+ * Run a script from scripts/ as if it were `python3 <script> <args>`.
+ * Resolves with exit code and captured output; never rejects on a non-zero exit.
+ */
+export async function runPythonScript(
+  scriptPath: string,
+  args: Array<string | number> = []
+): Promise<PythonScriptResult> {
+  const stringArgs = args.map(String);
+
+  if (WORKER_DISABLED) {
+    return spawnPythonScript(scriptPath, stringArgs);
+  }
+
+  try {
+    return await getPool().run(scriptPath, stringArgs);
+  } catch (error) {
+    console.warn('Python worker failed, falling back to a new process:', error);
+    return spawnPythonScript(scriptPath, stringArgs);
+  }
+}
+
+/**
+ * Like promisified `exec`: resolves with { stdout, stderr } on exit code 0,
+ * otherwise rejects with an Error carrying `code`, `stdout` and `stderr`.
+ */
+export async function execPythonScript(
+  scriptPath: string,
+  args: Array<string | number> = []
+): Promise<{ stdout: string; stderr: string }> {
+  const { code, stdout, stderr } = await runPythonScript(scriptPath, args);
+
+  if (code !== 0) {
+    const error = new Error(`Command failed: python3 ${scriptPath} ${args.join(' ')}\n${stderr}`);
+    throw Object.assign(error, { code, stdout, stderr });
+  }
+
+  return { stdout, stderr };
+}